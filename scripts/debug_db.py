@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """DB 디버그 스크립트 - paper_trades의 market_provider 확인"""
 import sys
+from collections import Counter
 from pathlib import Path
 
 # 프로젝트 루트를 경로에 추가
@@ -11,69 +12,59 @@ if str(project_root) not in sys.path:
 from src.database import get_db_connection
 from src.utils.date_utils import get_kst_date
 
+# 거래 기록 표 헤더 (고정 문자열)
+TABLE_HEADER = f"{'날짜':<12} {'종목코드':<10} {'종목명':<20} {'provider':<15} {'손익':<15} {'손익률':<10}"
+TABLE_DIVIDER = "-" * 90
+
+# 표에 출력할 최근 거래 수
+DISPLAY_LIMIT = 10
+
 
 def main():
     """오늘 날짜의 paper_trades 조회"""
     today = get_kst_date()
     
+    # 하루치 거래는 몇 건뿐이므로 한 번에 모두 읽고, 표 출력과 provider별 통계를 같이 계산
     with get_db_connection() as conn:
         cursor = conn.execute(
             """
             SELECT 
                 pt.date,
                 pt.symbol_id,
-                pt.market_provider,
+                COALESCE(pt.market_provider, 'NULL') as market_provider,
                 pt.pnl,
                 pt.pnl_rate,
-                s.symbol,
-                s.name
+                COALESCE(s.symbol, '-') as symbol,
+                COALESCE(s.name, '-') as name
             FROM paper_trades pt
-            JOIN symbols s ON pt.symbol_id = s.id
+            LEFT JOIN symbols s ON pt.symbol_id = s.id
             WHERE pt.date = ?
             ORDER BY pt.id DESC
-            LIMIT 10
             """,
             (today,)
         )
         rows = cursor.fetchall()
-        
-        if not rows:
-            print(f"오늘({today}) 거래 기록이 없습니다.")
-            return
-        
-        print(f"오늘({today}) paper_trades 기록 (최근 {len(rows)}건):\n")
-        print(f"{'날짜':<12} {'종목코드':<10} {'종목명':<20} {'provider':<15} {'손익':<15} {'손익률':<10}")
-        print("-" * 90)
-        
-        for row in rows:
-            date = row["date"]
-            symbol = row["symbol"]
-            name = row["name"]
-            provider = row["market_provider"] if "market_provider" in row.keys() else "NULL"
-            if provider is None:
-                provider = "NULL"
-            pnl = row["pnl"]
-            pnl_rate = row["pnl_rate"]
-            
-            print(f"{date:<12} {symbol:<10} {name:<20} {provider:<15} {pnl:>+12,.0f}원 {pnl_rate:>+7.2f}%")
-        
-        # provider별 통계
-        cursor = conn.execute(
-            """
-            SELECT 
-                COALESCE(market_provider, 'NULL') as provider,
-                COUNT(*) as count
-            FROM paper_trades
-            WHERE date = ?
-            GROUP BY provider
-            """,
-            (today,)
-        )
-        stats = cursor.fetchall()
-        
-        print("\n[Provider별 통계]")
-        for stat in stats:
-            print(f"  {stat['provider']}: {stat['count']}건")
+    
+    if not rows:
+        print(f"오늘({today}) 거래 기록이 없습니다.")
+        return
+    
+    recent_rows = rows[:DISPLAY_LIMIT]
+    print(f"오늘({today}) paper_trades 기록 (최근 {len(recent_rows)}건):\n")
+    print(TABLE_HEADER)
+    print(TABLE_DIVIDER)
+    
+    for row in recent_rows:
+        # SELECT 컬럼 순서대로 언패킹 (sqlite3.Row 키 조회 생략)
+        date, _symbol_id, provider, pnl, pnl_rate, symbol, name = row
+        print(f"{date:<12} {symbol:<10} {name:<20} {provider:<15} {pnl:>+12,.0f}원 {pnl_rate:>+7.2f}%")
+    
+    # provider별 통계 (표에 출력하지 않은 거래 포함)
+    provider_counts = Counter(row["market_provider"] for row in rows)
+    
+    print("\n[Provider별 통계]")
+    for provider, count in sorted(provider_counts.items()):
+        print(f"  {provider}: {count}건")
 
 
 if __name__ == "__main__":
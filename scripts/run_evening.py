@@ -10,10 +10,11 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from src.config import validate_config, MARKET_PROVIDER, TELEGRAM_REQUIRED
-from src.database import ensure_db
+from src.database import ensure_db, get_pooled_connection, close_pooled_connection
 from src.reports.evening import generate_evening_report
 from src.telegram import send_message, send_error_notification
 from src.market.provider import get_market_provider
+from src.utils.date_utils import get_kst_date
 from src.utils.logging import setup_logging, track_performance, PerformanceTracker
 
 
@@ -24,8 +25,12 @@ def main():
         setup_logging()
         validate_config()
         
-        # 2. DB 연결/초기화
+        # 기준 날짜는 실행 시작 시 한 번만 계산 (자정 직전 실행 시 단계별 날짜 불일치 방지)
+        today = get_kst_date()
+        
+        # 2. DB 연결/초기화 (실행 동안 하나의 연결을 재사용)
         ensure_db()
+        conn = get_pooled_connection()
         
         # 3. Market Provider 정보 출력 (디버그)
         print(f"[MARKET_PROVIDER]={MARKET_PROVIDER}")
@@ -37,30 +42,26 @@ def main():
         
         # 4. 리포트 생성
         with track_performance("generate_evening_report"):
-            report = generate_evening_report()
+            report = generate_evening_report(today)
         
         # 5. 저장된 거래 확인 (디버그)
-        from src.database import get_db_connection
-        from src.utils.date_utils import get_kst_date
-        today = get_kst_date()
-        with get_db_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT 
-                    pt.market_provider,
-                    COUNT(*) as count
-                FROM paper_trades pt
-                WHERE pt.date = ?
-                GROUP BY pt.market_provider
-                """,
-                (today,)
-            )
-            stats = cursor.fetchall()
-            if stats:
-                print(f"\n[오늘 저장된 거래 provider 통계]")
-                for stat in stats:
-                    provider = stat["market_provider"] or "NULL"
-                    print(f"  {provider}: {stat['count']}건")
+        cursor = conn.execute(
+            """
+            SELECT 
+                pt.market_provider,
+                COUNT(*) as count
+            FROM paper_trades pt
+            WHERE pt.date = ?
+            GROUP BY pt.market_provider
+            """,
+            (today,)
+        )
+        stats = cursor.fetchall()
+        if stats:
+            print(f"\n[오늘 저장된 거래 provider 통계]")
+            for stat in stats:
+                provider = stat["market_provider"] or "NULL"
+                print(f"  {provider}: {stat['count']}건")
         
         # 6. 텔레그램 전송
         with track_performance("send_telegram"):
@@ -86,6 +87,9 @@ def main():
         send_error_notification(e, "오후 리포트 생성")
         
         sys.exit(1)
+    
+    finally:
+        close_pooled_connection()
 
 
 if __name__ == "__main__":
@@ -10,22 +10,24 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from src.config import validate_config, MONTH_OVERRIDE, TELEGRAM_REQUIRED
-from src.database import ensure_db
-from src.reports.monthly import generate_monthly_report
-from src.telegram import send_message, send_error_notification
 from src.utils.date_utils import is_month_end
-from src.utils.logging import setup_logging, track_performance, PerformanceTracker
 
 
 def main():
     """메인 실행 함수"""
+    # 월말 체크 (MONTH_OVERRIDE가 있으면 스킵)
+    if not MONTH_OVERRIDE and not is_month_end():
+        print("월말이 아니므로 월간 리포트를 생성하지 않습니다.")
+        print("개발용으로 MONTH_OVERRIDE=YYYY-MM 환경변수를 설정하면 언제든 실행 가능합니다.")
+        sys.exit(0)
+    
+    # 월말이 아니면 위에서 바로 종료하므로 리포트/전송 모듈은 체크 이후에 import
+    from src.database import ensure_db
+    from src.reports.monthly import generate_monthly_report
+    from src.telegram import send_message, send_error_notification
+    from src.utils.logging import setup_logging, track_performance, PerformanceTracker
+    
     try:
-        # 월말 체크 (MONTH_OVERRIDE가 있으면 스킵)
-        if not MONTH_OVERRIDE and not is_month_end():
-            print("월말이 아니므로 월간 리포트를 생성하지 않습니다.")
-            print("개발용으로 MONTH_OVERRIDE=YYYY-MM 환경변수를 설정하면 언제든 실행 가능합니다.")
-            sys.exit(0)
-        
         # 1. 로깅 초기화 및 설정 검증
         setup_logging()
         validate_config()
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 """오전 리포트 실행 스크립트"""
+import re
 import sys
 import traceback
 from pathlib import Path
@@ -16,6 +17,9 @@ from src.telegram import send_message, send_error_notification
 from src.utils.date_utils import get_kst_now, get_news_window
 from src.utils.logging import setup_logging, track_performance, PerformanceTracker
 
+# 리포트의 "수집: X건 → 시간필터: Y건 → 중복제거: Z건" 카운트 패턴
+_COUNT_RE = re.compile(r'\*수집:\* (\d+)건 → 시간필터: (\d+)건 → 중복제거: (\d+)건')
+
 
 def main():
     """메인 실행 함수"""
@@ -42,8 +46,7 @@ def main():
         
         # 5. 리포트에서 카운트 정보 추출 (로컬 검증용)
         # 리포트에서 "수집: X건 → 시간필터: Y건 → 중복제거: Z건" 패턴 찾기
-        import re
-        count_match = re.search(r'\*수집:\* (\d+)건 → 시간필터: (\d+)건 → 중복제거: (\d+)건', report)
+        count_match = _COUNT_RE.search(report)
         if count_match:
             fetched = count_match.group(1)
             time_filtered = count_match.group(2)
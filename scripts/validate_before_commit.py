@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 """커밋 전 GitHub Actions 동작 검증 스크립트"""
+import io
 import sys
-import subprocess
+import threading
+import py_compile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # 프로젝트 루트를 경로에 추가
@@ -9,37 +12,66 @@ project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-def run_command(cmd, description):
-    """명령어 실행 및 결과 반환"""
-    print(f"\n{'='*60}")
-    print(f"검증: {description}")
-    print(f"명령어: {cmd}")
-    print(f"{'='*60}")
+class ThreadLocalStdout:
+    """스레드별로 출력을 버퍼에 모으는 stdout (병렬 검증 출력이 섞이지 않도록)"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def start_capture(self):
+        self._local.buffer = io.StringIO()
+    
+    def stop_capture(self):
+        buffer = getattr(self._local, "buffer", None)
+        self._local.buffer = None
+        return buffer.getvalue() if buffer else ""
+    
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+def run_checks_concurrently(checks):
+    """
+    독립적인 검증 함수들을 병렬 실행
+    
+    Args:
+        checks: [(이름, 검증 함수)] 리스트
+    
+    Returns:
+        [(이름, 통과 여부)] 리스트 (입력 순서 유지, 각 검증의 출력도 입력 순서대로 출력)
+    """
+    original_stdout = sys.stdout
+    captured_stdout = ThreadLocalStdout(original_stdout)
+    
+    def run_check(check):
+        name, check_fn = check
+        captured_stdout.start_capture()
+        try:
+            passed = check_fn()
+        except Exception as e:
+            print(f"✗ {name}: 예외 발생 - {e}")
+            passed = False
+        return name, passed, captured_stdout.stop_capture()
+    
+    sys.stdout = captured_stdout
     try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True,
-            cwd=project_root
-        )
-        if result.returncode == 0:
-            print(f"✓ 성공")
-            if result.stdout:
-                print(result.stdout)
-            return True
-        else:
-            print(f"✗ 실패 (exit code: {result.returncode})")
-            if result.stderr:
-                print("에러 출력:")
-                print(result.stderr)
-            if result.stdout:
-                print("표준 출력:")
-                print(result.stdout)
-            return False
-    except Exception as e:
-        print(f"✗ 예외 발생: {e}")
-        return False
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            outcomes = list(executor.map(run_check, checks))
+    finally:
+        sys.stdout = original_stdout
+    
+    results = []
+    for name, passed, output in outcomes:
+        print(output, end="")
+        results.append((name, passed))
+    return results
 
 def check_python_syntax():
     """Python 문법 오류 확인"""
@@ -57,19 +89,16 @@ def check_python_syntax():
     
     all_files = scripts + [str(f) for f in src_files]
     
+    # 파일마다 인터프리터를 띄우지 않고 현재 프로세스에서 바로 컴파일
     success = True
     for file_path in all_files:
         if not Path(file_path).exists():
             continue
-        result = subprocess.run(
-            [sys.executable, "-m", "py_compile", file_path],
-            capture_output=True,
-            text=True,
-            cwd=project_root
-        )
-        if result.returncode != 0:
+        try:
+            py_compile.compile(file_path, doraise=True)
+        except py_compile.PyCompileError as e:
             print(f"✗ {file_path}: 문법 오류")
-            print(result.stderr)
+            print(e.msg)
             success = False
     
     if success:
@@ -166,10 +195,25 @@ def run_basic_tests():
     """기본 테스트 실행"""
     print("\n[5/5] 기본 테스트 실행")
     
-    return run_command(
-        f"{sys.executable} -m pytest tests/ -q --tb=short",
-        "pytest 기본 테스트"
-    )
+    args = [str(project_root / "tests"), "-q", "--tb=short"]
+    print(f"\n{'='*60}")
+    print("검증: pytest 기본 테스트")
+    print(f"명령어: pytest {' '.join(args)} (in-process)")
+    print(f"{'='*60}")
+    
+    # 별도 인터프리터/셸을 띄우지 않고 현재 프로세스에서 pytest 실행
+    try:
+        import pytest
+    except ImportError as e:
+        print(f"✗ pytest import 실패: {e}")
+        return False
+    
+    exit_code = pytest.main(args)
+    if exit_code == 0:
+        print("✓ 성공")
+        return True
+    print(f"✗ 실패 (exit code: {int(exit_code)})")
+    return False
 
 def main():
     """메인 검증 함수"""
@@ -177,21 +221,15 @@ def main():
     print("GitHub Actions 동작 검증 시작")
     print("="*60)
     
-    results = []
-    
-    # 1. Python 문법 검증
-    results.append(("Python 문법", check_python_syntax()))
-    
-    # 2. Import 검증
-    results.append(("Import 검증", check_imports()))
-    
-    # 3. 핵심 함수 검증
-    results.append(("핵심 함수", check_core_functions()))
-    
-    # 4. 워크플로우 파일 검증
-    results.append(("워크플로우 파일", check_workflow_files()))
+    # 1~4. 서로 독립적인 검증은 병렬 실행 (문법 / Import / 핵심 함수 / 워크플로우 파일)
+    results = run_checks_concurrently([
+        ("Python 문법", check_python_syntax),
+        ("Import 검증", check_imports),
+        ("핵심 함수", check_core_functions),
+        ("워크플로우 파일", check_workflow_files),
+    ])
     
-    # 5. 기본 테스트 실행
+    # 5. 기본 테스트 실행 (가장 무거우므로 마지막에 단독 실행)
     results.append(("기본 테스트", run_basic_tests()))
     
     # 결과 요약
@@ -1,11 +1,19 @@
 """월간 성과 집계 모듈"""
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
-from collections import defaultdict
 from datetime import date
+from itertools import groupby
+from operator import itemgetter
 
+from src.config import PAPER_TRADE_AMOUNT
+from src.utils.date_utils import get_kst_now
 
-@dataclass
+# 베스트/워스트 종목 하이라이트에 담는 필드
+STOCK_HIGHLIGHT_FIELDS = ("name", "symbol", "pnl", "pnl_rate")
+_get_stock_highlight_values = itemgetter(*STOCK_HIGHLIGHT_FIELDS)
+
+
+@dataclass(slots=True)
 class DaySummary:
     """일자별 집계"""
     date: str  # YYYY-MM-DD
@@ -41,54 +49,48 @@ def aggregate_daily_trades(trades: List[Dict]) -> List[DaySummary]:
     일자별 집계
     
     Args:
-        trades: 가정 투자 기록 리스트
+        trades: 가정 투자 기록 리스트 (date 오름차순 정렬 필수, get_paper_trades_by_month 결과 그대로 사용)
     
     Returns:
-        일자별 집계 리스트
+        일자별 집계 리스트 (date 오름차순)
     """
-    daily = defaultdict(lambda: {"pnl": 0.0, "invested": 0.0, "count": 0})
-    
-    for trade in trades:
-        trade_date = trade["date"]
-        daily[trade_date]["pnl"] += trade["pnl"]
-        daily[trade_date]["invested"] += trade["invested_amount"]
-        daily[trade_date]["count"] += 1
-    
+    # 입력이 날짜순이므로 정렬 없이 groupby로 연속 구간별 합계
     day_summaries = []
-    for trade_date in sorted(daily.keys()):
-        day_data = daily[trade_date]
-        day_return = (day_data["pnl"] / day_data["invested"]) * 100 if day_data["invested"] > 0 else 0.0
-        
-        day_summaries.append(DaySummary(
-            date=trade_date,
-            day_pnl=round(day_data["pnl"], 2),
-            day_invested=round(day_data["invested"], 2),
-            day_return=round(day_return, 2),
-            trade_count=day_data["count"]
-        ))
+    for trade_date, group in groupby(trades, key=itemgetter("date")):
+        group = list(group)
+        pnl = sum(trade["pnl"] for trade in group)
+        invested = sum(trade["invested_amount"] for trade in group)
+        day_summaries.append(_make_day_summary(trade_date, pnl, invested, len(group)))
     
     return day_summaries
 
 
+def _make_day_summary(trade_date: str, pnl: float, invested: float, count: int) -> DaySummary:
+    """일자별 합계로 DaySummary 생성 (반올림 규칙 공통)"""
+    day_return = (pnl / invested) * 100 if invested > 0 else 0.0
+    return DaySummary(
+        date=trade_date,
+        day_pnl=round(pnl, 2),
+        day_invested=round(invested, 2),
+        day_return=round(day_return, 2),
+        trade_count=count
+    )
+
+
 def aggregate_monthly_trades(trades: List[Dict]) -> MonthlySummary:
     """
     월간 집계
     
     Args:
-        trades: 가정 투자 기록 리스트
+        trades: 가정 투자 기록 리스트 (date 오름차순 정렬 필수)
     
     Returns:
         월간 집계
     """
     if not trades:
-        # 첫 번째 trade에서 연월 추출 시도
-        if trades:
-            first_date = date.fromisoformat(trades[0]["date"])
-            year, month = first_date.year, first_date.month
-        else:
-            from src.utils.date_utils import get_kst_now
-            now = get_kst_now()
-            year, month = now.year, now.month
+        # 거래가 없으면 현재 월 기준
+        now = get_kst_now()
+        year, month = now.year, now.month
         
         return MonthlySummary(
             year=year,
@@ -116,96 +118,136 @@ def aggregate_monthly_trades(trades: List[Dict]) -> MonthlySummary:
     # 일자별 집계
     day_summaries = aggregate_daily_trades(trades)
     
-    # 월간 합계
-    month_pnl = sum(d.day_pnl for d in day_summaries)
-    month_invested = sum(d.day_invested for d in day_summaries)
-    month_return = (month_pnl / month_invested) * 100 if month_invested > 0 else 0.0
-    
-    # 승/패/무 카운트
-    win_count = sum(1 for t in trades if t["pnl"] > 0)
-    loss_count = sum(1 for t in trades if t["pnl"] < 0)
-    draw_count = sum(1 for t in trades if t["pnl"] == 0)
+    # 승/패/무 카운트 + 베스트/워스트 종목 (단일 패스, 동률이면 먼저 나온 거래)
+    win_count = loss_count = draw_count = 0
+    best_row = worst_row = trades[0]
+    best_pnl = worst_pnl = best_row["pnl"]
+    for trade in trades:
+        pnl = trade["pnl"]
+        if pnl > 0:
+            win_count += 1
+        elif pnl < 0:
+            loss_count += 1
+        elif pnl == 0:
+            draw_count += 1
+        if pnl > best_pnl:
+            best_row, best_pnl = trade, pnl
+        if pnl < worst_pnl:
+            worst_row, worst_pnl = trade, pnl
     total_count = len(trades)
     
+    best_stock = dict(zip(STOCK_HIGHLIGHT_FIELDS, _get_stock_highlight_values(best_row)))
+    worst_stock = dict(zip(STOCK_HIGHLIGHT_FIELDS, _get_stock_highlight_values(worst_row)))
+    
+    return _build_monthly_summary(
+        year, month, day_summaries,
+        win_count, loss_count, draw_count, total_count,
+        best_stock, worst_stock
+    )
+
+
+def aggregate_monthly_from_db(year: int, month: int, include_dummy: bool = False) -> MonthlySummary:
+    """
+    월간 집계 (DB 집계 쿼리 기반)
+    
+    aggregate_monthly_trades와 동일한 결과를 반환하지만, 거래 행 리스트를 만들지 않고
+    일자별 합계/승패 카운트/베스트·워스트 종목을 SQL에서 바로 집계한다.
+    
+    Args:
+        year: 연도
+        month: 월 (1-12)
+        include_dummy: dummy provider 거래 포함 여부 (기본: False, yahoo만)
+    
+    Returns:
+        월간 집계
+    """
+    from src.database import get_paper_trade_stats_by_month
+    
+    stats = get_paper_trade_stats_by_month(year, month, include_dummy=include_dummy)
+    day_summaries = [
+        _make_day_summary(d["date"], d["pnl"], d["invested"], d["count"])
+        for d in stats["daily"]
+    ]
+    
+    return _build_monthly_summary(
+        year, month, day_summaries,
+        stats["win_count"], stats["loss_count"], stats["draw_count"], stats["total_count"],
+        stats["best_stock"], stats["worst_stock"]
+    )
+
+
+def _build_monthly_summary(
+    year: int,
+    month: int,
+    day_summaries: List[DaySummary],
+    win_count: int,
+    loss_count: int,
+    draw_count: int,
+    total_count: int,
+    best_stock: Optional[Dict],
+    worst_stock: Optional[Dict]
+) -> MonthlySummary:
+    """
+    일자별 집계와 거래 카운트로 MonthlySummary 생성 (월간 합계, 승률, 베스트/워스트 데이, MDD)
+    """
+    # 월간 합계 + 베스트/워스트 데이 (단일 패스, 동률이면 먼저 나온 날)
+    month_pnl = 0.0
+    month_invested = 0.0
+    best_day = worst_day = day_summaries[0] if day_summaries else None
+    for day_sum in day_summaries:
+        month_pnl += day_sum.day_pnl
+        month_invested += day_sum.day_invested
+        if day_sum.day_pnl > best_day.day_pnl:
+            best_day = day_sum
+        if day_sum.day_pnl < worst_day.day_pnl:
+            worst_day = day_sum
+    month_return = (month_pnl / month_invested) * 100 if month_invested > 0 else 0.0
+    
     # 승률 계산: win/(win+loss) (무는 제외)
     win_loss_total = win_count + loss_count
     win_rate = (win_count / win_loss_total) * 100 if win_loss_total > 0 else 0.0
     
-    # 베스트/워스트 데이
-    best_day = max(day_summaries, key=lambda d: d.day_pnl) if day_summaries else None
-    worst_day = min(day_summaries, key=lambda d: d.day_pnl) if day_summaries else None
-    
-    # 베스트/워스트 종목
-    best_stock = max(trades, key=lambda t: t["pnl"]) if trades else None
-    worst_stock = min(trades, key=lambda t: t["pnl"]) if trades else None
-    
-    if best_stock:
-        best_stock = {
-            "name": best_stock["name"],
-            "symbol": best_stock["symbol"],
-            "pnl": best_stock["pnl"],
-            "pnl_rate": best_stock["pnl_rate"]
-        }
-    
-    if worst_stock:
-        worst_stock = {
-            "name": worst_stock["name"],
-            "symbol": worst_stock["symbol"],
-            "pnl": worst_stock["pnl"],
-            "pnl_rate": worst_stock["pnl_rate"]
-        }
-    
     # MDD 계산 (equity curve 기반)
     # 표본이 2일 미만이면 MDD 계산 불가
+    # base_cash가 month_invested에 의존할 수 있어 월간 합계 이후 별도 패스로 계산
     mdd = None
     mdd_amount = 0.0
     
     if len(day_summaries) >= 2:
-        # 일자별 equity 계산
-        from src.config import PAPER_TRADE_AMOUNT
-        
         # base_cash는 월간 기준값 (PAPER_TRADE_AMOUNT 사용, 없으면 day_invested 누적으로 대체)
         base_cash = PAPER_TRADE_AMOUNT if PAPER_TRADE_AMOUNT > 0 else month_invested
         
-        equity_curve = []
-        cumulative_pnl = 0.0
-        cumulative_invested = 0.0
+        # 첫날 equity는 루프 밖에서 계산 (첫날은 peak와 같으므로 낙폭 0)
+        first_day = day_summaries[0]
+        cumulative_pnl = first_day.day_pnl
+        if base_cash > 0:
+            equity_base = base_cash
+            peak_equity = base_cash + cumulative_pnl
+        else:
+            # base_cash가 없으면 첫날 invested + pnl을 기준으로 사용
+            seed_equity = first_day.day_invested + first_day.day_pnl
+            equity_base = seed_equity
+            peak_equity = seed_equity
+        mdd_pct = 0.0
         
-        for day_sum in day_summaries:
+        # equity 계산과 MDD(peak 대비 낙폭) 갱신을 한 루프에서 처리
+        for day_sum in day_summaries[1:]:
             cumulative_pnl += day_sum.day_pnl
-            cumulative_invested += day_sum.day_invested
             
-            # equity = base_cash + cumulative_pnl
-            # base_cash가 없으면 cumulative_invested를 기준으로 사용
-            if base_cash > 0:
-                equity = base_cash + cumulative_pnl
-            else:
-                # base_cash가 없으면 첫날 invested를 기준으로 사용
-                if not equity_curve:
-                    equity = cumulative_invested + cumulative_pnl
-                else:
-                    equity = equity_curve[0] + cumulative_pnl
+            # equity = 기준값(base_cash 또는 첫날 equity) + cumulative_pnl
+            equity = equity_base + cumulative_pnl
+            if equity > peak_equity:
+                peak_equity = equity
             
-            equity_curve.append(equity)
-        
-        # MDD 계산 (equity 기준)
-        mdd_pct = 0.0
-        
-        if equity_curve:
-            peak_equity = equity_curve[0]
-            for equity in equity_curve:
-                if equity > peak_equity:
-                    peak_equity = equity
+            # drawdown = (equity - peak_equity) / peak_equity
+            if peak_equity > 0:
+                drawdown = peak_equity - equity
+                drawdown_pct = (drawdown / peak_equity) * 100
                 
-                # drawdown = (equity - peak_equity) / peak_equity
-                if peak_equity > 0:
-                    drawdown = peak_equity - equity
-                    drawdown_pct = (drawdown / peak_equity) * 100
-                    
-                    if drawdown > mdd_amount:
-                        mdd_amount = drawdown
-                    if drawdown_pct > mdd_pct:
-                        mdd_pct = drawdown_pct
+                if drawdown > mdd_amount:
+                    mdd_amount = drawdown
+                if drawdown_pct > mdd_pct:
+                    mdd_pct = drawdown_pct
         
         # MDD는 % 기준으로 사용 (원 단위도 저장)
         mdd = mdd_pct
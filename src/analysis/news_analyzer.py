@@ -2,18 +2,24 @@
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 import re
+import sys
+import math
 import logging
-from collections import defaultdict
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from itertools import chain
+from datetime import datetime, timedelta, timezone
 from difflib import SequenceMatcher
-from pytz import UTC
+from urllib.parse import urlsplit
 
 from src.news.base import NewsItem
 from src.analysis.sector_keywords import SECTOR_KEYWORDS
-from src.utils.text import normalize_title, jaccard_similarity
+from src.utils.text import normalize_title, title_token_set, title_token_bitmap, jaccard_similarity_bits
 
 logger = logging.getLogger(__name__)
 
+UTC = timezone.utc
+
 
 @dataclass
 class NewsDigest:
@@ -91,7 +97,109 @@ CREDIBLE_DOMAINS = [
 ]
 
 
-# ... (locally removed normalize_title and jaccard_similarity)
+def _compile_keywords(keywords: List[str]) -> "re.Pattern[str]":
+    """
+    키워드 목록을 하나의 정규식 alternation으로 컴파일
+    
+    긴 키워드를 먼저 두고 lookahead로 감싸 위치마다 가장 긴 키워드를 찾는다.
+    (겹치는 키워드도 놓치지 않도록 매칭 문자를 소비하지 않음)
+    """
+    alternation = "|".join(map(re.escape, sorted(set(keywords), key=len, reverse=True)))
+    return re.compile(f"(?=({alternation}))")
+
+
+def _build_prefix_map(keywords: List[str]) -> Dict[str, Tuple[str, ...]]:
+    """매칭된 키워드 -> 같은 위치에서 함께 매칭되는 키워드(접두사 키워드 포함) 매핑"""
+    unique = list(dict.fromkeys(keywords))
+    return {kw: tuple(other for other in unique if kw.startswith(other)) for kw in unique}
+
+
+def _find_keywords(pattern: "re.Pattern[str]", prefix_map: Dict[str, Tuple[str, ...]], text: str) -> set:
+    """
+    텍스트에 포함된 키워드 집합 (`keyword in text`를 키워드마다 검사한 결과와 동일)
+    
+    Args:
+        pattern: _compile_keywords로 만든 정규식
+        prefix_map: _build_prefix_map으로 만든 매핑
+        text: 검사할 텍스트 (소문자)
+    
+    Returns:
+        포함된 키워드 집합
+    """
+    found = set()
+    for match in pattern.findall(text):
+        found.update(prefix_map[match])
+    return found
+
+
+# 모듈 로드 시 1회 컴파일
+_DUMMY_URL_RE = re.compile(r"example\.com", re.IGNORECASE)
+
+_CREDIBLE_DOMAIN_SET = frozenset(CREDIBLE_DOMAINS)
+
+_NOISE_RE = _compile_keywords(NOISE_KEYWORDS)
+
+_CLICKBAIT_SET = frozenset(CLICKBAIT_KEYWORDS)
+
+# 섹터 분류 우선순위 순서대로 (섹터명, 키워드)
+_SECTOR_PRIORITY_KEYWORDS = [
+    # 코인/크립토 우선 체크 (거시 섹터보다 우선)
+    ("코인/크립토", [
+        "비트코인", "btc", "이더리움", "eth", "코인", "크립토", "암호화폐",
+        "블록체인", "디파이", "defi", "nft", "가상자산", "가상화폐",
+        "비트코인 etf", "비트코인 현물 etf"
+    ]),
+    # 바이오/헬스 우선 체크 (AI보다 우선)
+    ("바이오/헬스", [
+        "셀트리온", "노보", "glp-1", "fda", "임상", "신약", "제약", "바이오",
+        "삼성바이오로직스", "유한양행", "한미약품", "헬스케어", "의료", "바이오텍"
+    ]),
+    # 반도체/AI 섹터 (명확한 키워드 중심)
+    ("반도체/AI", [
+        "nvidia", "엔비디아", "반도체", "dram", "hbm", "파운드리", "tsmc", "amd",
+        "삼성전자", "sk하이닉스", "하이닉스", "sk hynix", "메모리", "칩"
+    ]),
+]
+# 개별 종목 매칭 (섹터 키워드에 없는 특정 우량주/이슈주)
+_SECTOR_FALLBACK_KEYWORDS = [
+    ("테크/가전", ["애플", "아이폰", "apple", "iphone"]),
+    ("자동차/모빌리티", ["테슬라", "tesla", "자율주행", "ev"]),
+    ("방산/우주", ["방산", "k-방산", "현대로템", "한화에어로"]),
+]
+# 섹터명은 intern해 섹터별 dict 키 비교가 포인터 비교로 끝나도록 함
+_SECTOR_OTHER = sys.intern("기타")
+_SECTOR_KEYWORD_SETS = [
+    (sys.intern(sector), frozenset(sys.intern(kw.lower()) for kw in keywords))
+    for sector, keywords in (
+        _SECTOR_PRIORITY_KEYWORDS
+        # 코인/크립토, 바이오/헬스는 우선 체크에서 이미 처리됨
+        + [(s, kws) for s, kws in SECTOR_KEYWORDS.items() if s not in ("코인/크립토", "바이오/헬스")]
+        + _SECTOR_FALLBACK_KEYWORDS
+    )
+]
+
+# 점수 계산용 키워드 전체 (시장 관련도 + 클릭베이트 + 섹터)를 하나로 합쳐
+# 기사 텍스트를 한 번만 스캔하고, 찾은 키워드 집합에서 각 항목을 계산
+_SCORING_KEYWORDS = list(dict.fromkeys(
+    list(MARKET_KEYWORDS)
+    + CLICKBAIT_KEYWORDS
+    + [kw for _, keywords in _SECTOR_KEYWORD_SETS for kw in keywords]
+))
+_SCORING_RE = _compile_keywords(_SCORING_KEYWORDS)
+_SCORING_PREFIXES = _build_prefix_map(_SCORING_KEYWORDS)
+
+
+_MARKET_KEYWORD_SET = frozenset(MARKET_KEYWORDS)
+
+
+def _market_relevance(keywords: frozenset) -> float:
+    """기본 관련도 점수: 포함된 시장 키워드 가중치 합 (keywords: _scan_scoring_keywords 결과)"""
+    return float(sum(MARKET_KEYWORDS[keyword] for keyword in keywords & _MARKET_KEYWORD_SET))
+
+
+def _scan_scoring_keywords(text: str) -> frozenset:
+    """텍스트(제목+본문 소문자)에 포함된 점수 계산용 키워드 집합 (1회 스캔)"""
+    return frozenset(_find_keywords(_SCORING_RE, _SCORING_PREFIXES, text))
 
 
 def is_noise_article(title: str, source: str = "", url: str = "") -> bool:
@@ -109,11 +217,7 @@ def is_noise_article(title: str, source: str = "", url: str = "") -> bool:
     text = (title + " " + source + " " + url).lower()
     
     # 노이즈 키워드 체크
-    for keyword in NOISE_KEYWORDS:
-        if keyword in text:
-            return True
-    
-    return False
+    return _NOISE_RE.search(text) is not None
 
 
 def calculate_freshness_score(item: NewsItem, now_utc: Optional[datetime] = None) -> float:
@@ -134,26 +238,180 @@ def calculate_freshness_score(item: NewsItem, now_utc: Optional[datetime] = None
         now_utc = datetime.now(UTC)
     
     item_utc = item.published_at
-    if item_utc.tzinfo != UTC:
+    if item_utc.utcoffset() is None:  # naive 시각만 변환 (aware 시각은 그대로 뺄셈 가능)
         item_utc = item_utc.astimezone(UTC)
     
     hours_ago = (now_utc - item_utc).total_seconds() / 3600
-    
-    # 감쇠 함수: 0시간=1.0, 12시간=0.5, 24시간=0.2, 48시간=0.05
+    return _freshness_from_hours(hours_ago)
+
+
+# 신선도 감쇠 구간표: (구간 끝 시각, 구간 시작 시각, 구간 길이, 시작 점수, 구간 내 감소폭)
+# 감쇠 함수: 0시간=1.0, 12시간=0.5, 24시간=0.2, 48시간=0.05, 이후 0.05 고정
+_FRESHNESS_SEGMENTS = [
+    (12, 0, 12, 1.0, 0.5),    # 0~12시간: 선형 감쇠 1.0 -> 0.5
+    (24, 12, 12, 0.5, 0.3),   # 12~24시간: 선형 감쇠 0.5 -> 0.2
+    (48, 24, 24, 0.2, 0.15),  # 24~48시간: 선형 감쇠 0.2 -> 0.05
+]
+_FRESHNESS_SEGMENT_ENDS = [segment[0] for segment in _FRESHNESS_SEGMENTS]
+
+
+def _freshness_from_hours(hours_ago: float) -> float:
+    """경과 시간(시간 단위) -> 신선도 점수 (구간표 이분 탐색 후 선형 보간)"""
     if hours_ago <= 0:
         return 1.0
-    elif hours_ago <= 12:
-        # 0~12시간: 선형 감쇠 1.0 -> 0.5
-        return 1.0 - (hours_ago / 12) * 0.5
-    elif hours_ago <= 24:
-        # 12~24시간: 선형 감쇠 0.5 -> 0.2
-        return 0.5 - ((hours_ago - 12) / 12) * 0.3
-    elif hours_ago <= 48:
-        # 24~48시간: 선형 감쇠 0.2 -> 0.05
-        return 0.2 - ((hours_ago - 24) / 24) * 0.15
-    else:
+    
+    # 구간 끝 시각은 해당 구간에 포함 (예: 정확히 12시간이면 첫 구간)
+    idx = bisect_left(_FRESHNESS_SEGMENT_ENDS, hours_ago)
+    if idx == len(_FRESHNESS_SEGMENTS):
         # 48시간 이상: 0.05 고정
         return 0.05
+    
+    _, start, width, start_score, drop = _FRESHNESS_SEGMENTS[idx]
+    return start_score - ((hours_ago - start) / width) * drop
+
+
+@dataclass(slots=True)
+class _PreparedItem:
+    """점수 계산용 사전 계산 값 (아이템당 1회 생성해 N² 비교 루프에서 재사용)"""
+    item: NewsItem
+    keywords: frozenset  # (제목 + 본문) 소문자에 포함된 점수 계산용 키워드
+    sector: str  # classify_sector 결과
+    market_relevance: float  # MARKET_KEYWORDS 가중치 합 (기본 관련도 점수)
+    norm_title: str  # 정규화된 제목
+    token_bits: int  # 정규화된 제목의 단어 집합 비트맵
+    published_us: Optional[int]  # UTC epoch 마이크로초 (날짜 없으면 None)
+
+
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# 새로움 비교 구간 (24~72시간, 마이크로초)
+_NOVELTY_WINDOW_MIN_US = 24 * 3600 * 10**6
+_NOVELTY_WINDOW_MAX_US = 72 * 3600 * 10**6
+
+
+def _prepare_item(item: NewsItem, token_vocab: Dict[str, int]) -> _PreparedItem:
+    """정규화 제목/단어 집합/키워드 집합/섹터/UTC 시각을 한 번에 계산 (token_vocab: 호출 단위 제목 비트맵 어휘)"""
+    norm_title = normalize_title(item.title)
+    keywords = _scan_scoring_keywords((item.title + " " + (item.content or "")).lower())
+    
+    published_us = None
+    if item.published_at:
+        item_utc = item.published_at
+        if item_utc.utcoffset() is None:  # naive 시각만 변환 (aware 시각은 그대로 뺄셈 가능)
+            item_utc = item_utc.astimezone(UTC)
+        published_us = (item_utc - _EPOCH_UTC) // _ONE_MICROSECOND
+    
+    return _PreparedItem(
+        item=item,
+        keywords=keywords,
+        sector=_sector_from_keywords(keywords),
+        market_relevance=_market_relevance(keywords),
+        norm_title=norm_title,
+        token_bits=title_token_bitmap(norm_title, token_vocab),
+        published_us=published_us,
+    )
+
+
+class _PublishedIndex:
+    """발행 시각 순으로 정렬한 아이템 목록 (시간 구간 조회를 이분 탐색으로 처리)"""
+    
+    def __init__(self, prepared: List[_PreparedItem]):
+        # 날짜 없는 아이템은 새로움 비교 대상이 아니므로 제외
+        self.items = sorted(
+            (p for p in prepared if p.published_us is not None),
+            key=lambda p: p.published_us,
+        )
+        self.times = [p.published_us for p in self.items]
+        self._member_ids = {id(p) for p in self.items}
+        self._similar_counts: Optional[Dict[int, int]] = None
+    
+    def window(self, center_us: int, min_us: int, max_us: int) -> List[_PreparedItem]:
+        """center_us와의 시각 차이가 min_us 이상 max_us 이하인 아이템 (앞뒤 양쪽)"""
+        times = self.times
+        before = self.items[bisect_left(times, center_us - max_us):bisect_right(times, center_us - min_us)]
+        after = self.items[bisect_left(times, center_us + min_us):bisect_right(times, center_us + max_us)]
+        return before + after
+    
+    def similar_count(self, target: _PreparedItem) -> int:
+        """24~72시간 내 유사 제목 수 (인덱스에 속한 아이템은 전체 일괄 계산 결과 재사용)"""
+        if id(target) not in self._member_ids:
+            return _count_similar_titles(target, self)
+        
+        if self._similar_counts is None:
+            self._similar_counts = _count_similar_titles_batch(self)
+        return self._similar_counts[id(target)]
+
+
+# 새로움 유사도 임계값 (Jaccard, SequenceMatcher 공통)
+_NOVELTY_SIMILARITY_THRESHOLD = 0.4
+
+
+def _is_similar_sequence(matcher: SequenceMatcher, other_title: str) -> bool:
+    """
+    SequenceMatcher 유사도가 임계값 이상인지 (matcher의 a는 기준 제목)
+    
+    ratio()의 상한인 real_quick_ratio/quick_ratio가 미달이면 ratio() 계산은 생략
+    """
+    matcher.set_seq2(other_title)
+    return (
+        matcher.real_quick_ratio() >= _NOVELTY_SIMILARITY_THRESHOLD
+        and matcher.quick_ratio() >= _NOVELTY_SIMILARITY_THRESHOLD
+        and matcher.ratio() >= _NOVELTY_SIMILARITY_THRESHOLD
+    )
+
+
+def _count_similar_titles(target: _PreparedItem, published_index: _PublishedIndex) -> int:
+    """target 기준 24~72시간 내 유사 제목 수"""
+    # a(item)는 고정, b(other)만 교체하며 재사용
+    matcher = SequenceMatcher(None, target.norm_title, "")
+    similar_count = 0
+    
+    # 24~72시간 범위 내만 체크 (정렬된 시각에서 이분 탐색으로 후보만 추림)
+    # (같은 아이템은 시각 차이가 0이라 자연히 제외됨)
+    for other in published_index.window(target.published_us, _NOVELTY_WINDOW_MIN_US, _NOVELTY_WINDOW_MAX_US):
+        # Jaccard 유사도와 SequenceMatcher 유사도 중 높은 값 사용
+        # Jaccard가 이미 임계값을 넘으면 SequenceMatcher는 생략
+        if (
+            jaccard_similarity_bits(target.token_bits, other.token_bits) >= _NOVELTY_SIMILARITY_THRESHOLD
+            or _is_similar_sequence(matcher, other.norm_title)
+        ):
+            similar_count += 1
+    
+    return similar_count
+
+
+def _count_similar_titles_batch(published_index: _PublishedIndex) -> Dict[int, int]:
+    """
+    인덱스 전체 아이템의 24~72시간 내 유사 제목 수를 한 번에 계산
+    
+    시각순으로 정렬된 아이템에서 뒤쪽 구간만 훑어 쌍마다 한 번씩 방문한다.
+    Jaccard는 대칭이라 쌍당 한 번만 계산하고, SequenceMatcher는 방향별 결과가
+    다를 수 있어 양쪽을 각각 계산한다.
+    
+    Returns:
+        id(_PreparedItem) -> 유사 제목 수
+    """
+    items = published_index.items
+    times = published_index.times
+    counts = [0] * len(items)
+    matchers = [SequenceMatcher(None, p.norm_title, "") for p in items]
+    
+    for i, item in enumerate(items):
+        start = bisect_left(times, times[i] + _NOVELTY_WINDOW_MIN_US, lo=i + 1)
+        end = bisect_right(times, times[i] + _NOVELTY_WINDOW_MAX_US, lo=start)
+        for j in range(start, end):
+            other = items[j]
+            if jaccard_similarity_bits(item.token_bits, other.token_bits) >= _NOVELTY_SIMILARITY_THRESHOLD:
+                counts[i] += 1
+                counts[j] += 1
+                continue
+            if _is_similar_sequence(matchers[i], other.norm_title):
+                counts[i] += 1
+            if _is_similar_sequence(matchers[j], item.norm_title):
+                counts[j] += 1
+    
+    return {id(p): count for p, count in zip(items, counts)}
 
 
 def calculate_novelty_score(
@@ -174,45 +432,23 @@ def calculate_novelty_score(
         - novelty_score: 0.0 ~ 1.0 (높을수록 새로움)
         - repeat_penalty: 0.0 ~ 1.0 (높을수록 반복 심함)
     """
-    if not item.published_at:
+    token_vocab: Dict[str, int] = {}  # 이번 호출의 비트맵끼리만 비교하므로 호출 단위 어휘
+    return _calculate_novelty_prepared(
+        _prepare_item(item, token_vocab),
+        _PublishedIndex([_prepare_item(other, token_vocab) for other in other_items]),
+    )
+
+
+def _calculate_novelty_prepared(
+    target: _PreparedItem,
+    published_index: _PublishedIndex
+) -> Tuple[float, float]:
+    """calculate_novelty_score의 사전 계산 버전 (create_digest에서 재사용)"""
+    if target.published_us is None:
         return (0.5, 0.0)  # 날짜 없으면 중간값
     
-    if now_utc is None:
-        now_utc = datetime.now(UTC)
-    
-    item_utc = item.published_at
-    if item_utc.tzinfo != UTC:
-        item_utc = item_utc.astimezone(UTC)
-    
-    item_normalized = normalize_title(item.title)
-    
     # 24~72시간 내 유사한 제목 찾기
-    similar_count = 0
-    similar_items = []
-    
-    for other in other_items:
-        if other == item or not other.published_at:
-            continue
-        
-        other_utc = other.published_at
-        if other_utc.tzinfo != UTC:
-            other_utc = other_utc.astimezone(UTC)
-        
-        hours_diff = abs((item_utc - other_utc).total_seconds() / 3600)
-        
-        # 24~72시간 범위 내만 체크
-        if 24 <= hours_diff <= 72:
-            other_normalized = normalize_title(other.title)
-            
-            # Jaccard 유사도와 SequenceMatcher 유사도 중 높은 값 사용
-            jaccard_sim = jaccard_similarity(item_normalized, other_normalized)
-            seq_sim = SequenceMatcher(None, item_normalized, other_normalized).ratio()
-            similarity = max(jaccard_sim, seq_sim)
-            
-            # 유사도 임계값: 0.4 이상이면 유사한 것으로 간주
-            if similarity >= 0.4:
-                similar_count += 1
-                similar_items.append((other, similarity))
+    similar_count = published_index.similar_count(target)
     
     # Novelty score: 유사한 기사가 적을수록 높음
     if similar_count == 0:
@@ -237,6 +473,27 @@ def calculate_novelty_score(
     return (novelty_score, repeat_penalty)
 
 
+# 섹터별 선행지표 매핑 (강화)
+_SECTOR_INDICATORS = {
+    sys.intern("반도체/AI"): ["NVDA", "Nasdaq", "S&P500"],
+    sys.intern("코인/크립토"): ["BTC"],
+    sys.intern("거시/금리/달러"): ["USDKRW", "US10Y", "DXY"],
+    sys.intern("에너지/원유"): ["WTI", "S&P500"],
+    sys.intern("금/귀금속"): ["Gold", "DXY"],
+    sys.intern("변동성/리스크"): ["VIX", "Nasdaq"],
+}
+
+# 섹터별 가중치 (중요한 지표에 더 높은 가중치)
+_SECTOR_INDICATOR_WEIGHTS = {
+    sys.intern("반도체/AI"): {"NVDA": 2.0, "Nasdaq": 1.5, "S&P500": 1.0},
+    sys.intern("코인/크립토"): {"BTC": 2.0},
+    sys.intern("거시/금리/달러"): {"USDKRW": 2.0, "US10Y": 1.5, "DXY": 1.0},
+    sys.intern("에너지/원유"): {"WTI": 2.0, "S&P500": 1.0},
+    sys.intern("금/귀금속"): {"Gold": 2.0, "DXY": 1.0},
+    sys.intern("변동성/리스크"): {"VIX": 2.0, "Nasdaq": 1.0},
+}
+
+
 def calculate_late_news_penalty(
     item: NewsItem,
     sector: str,
@@ -256,36 +513,16 @@ def calculate_late_news_penalty(
     if not overnight_signals:
         return 0.0
     
-    # 섹터별 선행지표 매핑 (강화)
-    sector_indicators = {
-        "반도체/AI": ["NVDA", "Nasdaq", "S&P500"],
-        "코인/크립토": ["BTC"],
-        "거시/금리/달러": ["USDKRW", "US10Y", "DXY"],
-        "에너지/원유": ["WTI", "S&P500"],
-        "금/귀금속": ["Gold", "DXY"],
-        "변동성/리스크": ["VIX", "Nasdaq"],
-    }
-    
-    if sector not in sector_indicators:
+    if sector not in _SECTOR_INDICATORS:
         return 0.0
     
     # 해당 섹터의 선행지표들 확인
-    indicators = sector_indicators[sector]
+    indicators = _SECTOR_INDICATORS[sector]
     max_change = 0.0
     weighted_change = 0.0
     indicator_count = 0
     
-    # 섹터별 가중치 (중요한 지표에 더 높은 가중치)
-    indicator_weights = {
-        "반도체/AI": {"NVDA": 2.0, "Nasdaq": 1.5, "S&P500": 1.0},
-        "코인/크립토": {"BTC": 2.0},
-        "거시/금리/달러": {"USDKRW": 2.0, "US10Y": 1.5, "DXY": 1.0},
-        "에너지/원유": {"WTI": 2.0, "S&P500": 1.0},
-        "금/귀금속": {"Gold": 2.0, "DXY": 1.0},
-        "변동성/리스크": {"VIX": 2.0, "Nasdaq": 1.0},
-    }
-    
-    weights = indicator_weights.get(sector, {})
+    weights = _SECTOR_INDICATOR_WEIGHTS.get(sector, {})
     
     for indicator_name in indicators:
         signal = overnight_signals.get(indicator_name)
@@ -309,6 +546,16 @@ def calculate_late_news_penalty(
         return 0.0
 
 
+def _is_credible_host(host: str) -> bool:
+    """
+    신뢰 도메인 여부 (호스트 자신 또는 상위 도메인이 CREDIBLE_DOMAINS에 있는지)
+    
+    예: "www.reuters.com" -> "www.reuters.com", "reuters.com", "com" 순으로 set 조회
+    """
+    labels = host.split(".")
+    return any(".".join(labels[i:]) in _CREDIBLE_DOMAIN_SET for i in range(len(labels)))
+
+
 def calculate_clickbait_penalty(item: NewsItem) -> float:
     """
     클릭베이트 페널티 계산
@@ -320,33 +567,32 @@ def calculate_clickbait_penalty(item: NewsItem) -> float:
         클릭베이트 페널티 (0.0 ~ 1.0, 높을수록 자극적)
     """
     text = (item.title + " " + (item.content or "")).lower()
-    
+    return _clickbait_penalty_from_keywords(item, _scan_scoring_keywords(text))
+
+
+def _clickbait_penalty_from_keywords(item: NewsItem, keywords: frozenset) -> float:
+    """calculate_clickbait_penalty의 사전 계산 버전 (keywords: _scan_scoring_keywords 결과)"""
     # 클릭베이트 키워드 체크
-    clickbait_count = 0
-    for keyword in CLICKBAIT_KEYWORDS:
-        if keyword in text:
-            clickbait_count += 1
+    clickbait_count = len(keywords & _CLICKBAIT_SET)
+    
+    # 페널티 계산
+    if clickbait_count == 0:
+        return 0.0
     
-    # 신뢰성 높은 출처는 감점 완화
+    # 신뢰성 높은 출처는 감점 완화 (URL 호스트 또는 출처명이 신뢰 도메인/하위 도메인)
     is_credible = False
     if item.url:
-        url_lower = item.url.lower()
-        for domain in CREDIBLE_DOMAINS:
-            if domain in url_lower:
-                is_credible = True
-                break
+        url = item.url.strip().lower()
+        try:
+            host = urlsplit(url).hostname or url.split("/", 1)[0]
+        except ValueError:  # 잘못된 URL (예: 깨진 IPv6 표기)
+            host = ""
+        is_credible = _is_credible_host(host)
     
-    if item.source:
-        source_lower = item.source.lower()
-        for domain in CREDIBLE_DOMAINS:
-            if domain in source_lower:
-                is_credible = True
-                break
+    if not is_credible and item.source:
+        is_credible = _is_credible_host(item.source.strip().lower())
     
-    # 페널티 계산
-    if clickbait_count == 0:
-        penalty = 0.0
-    elif clickbait_count == 1:
+    if clickbait_count == 1:
         penalty = 0.3 if not is_credible else 0.1
     elif clickbait_count == 2:
         penalty = 0.6 if not is_credible else 0.3
@@ -379,26 +625,44 @@ def score_headline(
     if now_utc is None:
         now_utc = datetime.now(UTC)
     
-    text = (item.title + " " + (item.content or "")).lower()
+    token_vocab: Dict[str, int] = {}  # 이번 호출의 비트맵끼리만 비교하므로 호출 단위 어휘
+    return _score_headline_prepared(
+        _prepare_item(item, token_vocab),
+        _PublishedIndex([_prepare_item(other, token_vocab) for other in all_items]),
+        now_utc,
+        overnight_signals=overnight_signals,
+    )
+
+
+def _score_headline_prepared(
+    prepared: _PreparedItem,
+    published_index: _PublishedIndex,
+    now_utc: datetime,
+    overnight_signals: Optional[Dict] = None
+) -> Tuple[float, Dict[str, float]]:
+    """score_headline의 사전 계산 버전 (create_digest에서 재사용)"""
+    item = prepared.item
+    keywords = prepared.keywords
     
     # 1. 기본 관련도 점수 (기존 로직)
-    base_relevance = 0.0
-    for keyword, weight in MARKET_KEYWORDS.items():
-        if keyword in text:
-            base_relevance += weight
+    base_relevance = prepared.market_relevance
     
     # 2. Freshness score
-    freshness_score = calculate_freshness_score(item, now_utc)
+    if prepared.published_us is None:
+        freshness_score = 0.5  # 날짜 없으면 중간값
+    else:
+        now_us = (now_utc - _EPOCH_UTC) // _ONE_MICROSECOND
+        freshness_score = _freshness_from_hours((now_us - prepared.published_us) / 10**6 / 3600)
     
     # 3. Novelty / Repeat penalty
-    novelty_score, repeat_penalty = calculate_novelty_score(item, all_items, now_utc)
+    novelty_score, repeat_penalty = _calculate_novelty_prepared(prepared, published_index)
     
     # 4. Late-news penalty
-    sector = classify_sector(item.title, item.content or "")
+    sector = prepared.sector
     late_penalty = calculate_late_news_penalty(item, sector, overnight_signals=overnight_signals)
     
     # 5. Clickbait penalty
-    clickbait_penalty = calculate_clickbait_penalty(item)
+    clickbait_penalty = _clickbait_penalty_from_keywords(item, keywords)
     
     # 6. 최종 점수 계산 (가중치 적용)
     # 가중치 설정 (환경변수로 조정 가능하도록 향후 개선)
@@ -432,6 +696,22 @@ def score_headline(
     return (final_score, debug_info)
 
 
+def _dedup_prefix_tokens(tokens: frozenset, token_freq: Counter, threshold: float) -> List[str]:
+    """
+    중복 후보 탐색용 접두 단어 (prefix filtering)
+    
+    단어를 전체 빈도 오름차순(드문 단어 먼저)으로 정렬했을 때, Jaccard >= threshold인
+    두 제목은 각자의 앞쪽 len - ceil(threshold * len) + 1개 단어 중 하나를 반드시 공유한다.
+    따라서 이 접두 단어만 역색인에 넣고 조회해도 결과는 전체 비교와 동일하다.
+    """
+    # 부동소수 오차로 필요한 겹침 수가 과대 계산되지 않도록 약간 여유를 둠
+    required_overlap = math.ceil(threshold * len(tokens) - 1e-9)
+    prefix_len = len(tokens) - required_overlap + 1
+    if prefix_len <= 0:
+        return []
+    return sorted(tokens, key=lambda token: (token_freq[token], token))[:prefix_len]
+
+
 def remove_duplicates(news_items: List[NewsItem], 
                      title_threshold: float = 0.85) -> List[NewsItem]:
     """
@@ -450,23 +730,48 @@ def remove_duplicates(news_items: List[NewsItem],
         return []
     
     # 정규화된 제목으로 중복 체크
+    normalized_titles = [normalize_title(item.title) for item in news_items]
     seen = []
+    seen_bits = set()  # 유지된 제목의 단어 집합 비트맵 (완전 동일 제목 O(1) 판정용)
     unique_items = []
-    
-    for item in news_items:
-        normalized = normalize_title(item.title)
+    # 접두 단어 -> 해당 단어를 접두부에 가진 seen 인덱스 (역색인)
+    token_index: Dict[str, List[int]] = defaultdict(list)
+    # 전체 제목의 단어 빈도 (드문 단어가 접두부에 오도록 정렬 기준으로 사용)
+    token_freq = Counter(token for normalized in normalized_titles for token in title_token_set(normalized))
+    # 단어 -> 비트 위치 (이번 호출 전용 어휘, 스레드 간 공유하지 않음)
+    token_vocab: Dict[str, int] = {}
+    
+    for item, normalized in zip(news_items, normalized_titles):
+        # 단어 집합/비트맵은 아이템당 한 번만 생성
+        tokens = title_token_set(normalized)
+        bits = title_token_bitmap(normalized, token_vocab)
+        
+        # 단어 집합이 이미 유지된 제목과 같으면 Jaccard 1.0이므로 비교 없이 중복 처리
+        if bits and bits in seen_bits and title_threshold <= 1.0:
+            continue
+        
         is_duplicate = False
         
-        for seen_normalized, seen_item in seen:
+        if title_threshold > 0:
+            prefix = _dedup_prefix_tokens(tokens, token_freq, title_threshold)
+            candidates = {idx for token in prefix for idx in token_index.get(token, ())}
+        else:
+            prefix = ()
+            candidates = range(len(seen))
+        
+        for idx in candidates:
             # 제목 유사도만 체크 (Google News 링크는 도메인/슬러그 유사도 제외)
-            title_sim = jaccard_similarity(normalized, seen_normalized)
+            title_sim = jaccard_similarity_bits(bits, seen[idx])
             
             if title_sim >= title_threshold:
                 is_duplicate = True
                 break
         
         if not is_duplicate:
-            seen.append((normalized, item))
+            for token in prefix:
+                token_index[token].append(len(seen))
+            seen.append(bits)
+            seen_bits.add(bits)
             unique_items.append(item)
     
     return unique_items
@@ -479,52 +784,41 @@ def classify_sector(title: str, content: str = "") -> str:
     Returns:
         섹터명 (없으면 "기타")
     """
-    text = (title + " " + content).lower()
-    
-    # 코인/크립토 우선 체크 (거시 섹터보다 우선)
-    crypto_keywords = [
-        "비트코인", "btc", "이더리움", "eth", "코인", "크립토", "암호화폐",
-        "블록체인", "디파이", "defi", "nft", "가상자산", "가상화폐",
-        "비트코인 etf", "비트코인 현물 etf"
-    ]
-    if any(kw in text for kw in crypto_keywords):
-        return "코인/크립토"
-    
-    # 바이오/헬스 우선 체크 (AI보다 우선)
-    bio_keywords = [
-        "셀트리온", "노보", "glp-1", "fda", "임상", "신약", "제약", "바이오",
-        "삼성바이오로직스", "유한양행", "한미약품", "헬스케어", "의료", "바이오텍"
-    ]
-    if any(kw in text for kw in bio_keywords):
-        return "바이오/헬스"
-    
-    # 반도체/AI 섹터 (명확한 키워드 중심)
-    semi_keywords = [
-        "nvidia", "엔비디아", "반도체", "dram", "hbm", "파운드리", "tsmc", "amd",
-        "삼성전자", "sk하이닉스", "하이닉스", "sk hynix", "메모리", "칩"
-    ]
-    if any(kw in text for kw in semi_keywords):
-        return "반도체/AI"
-    
-    # 섹터별로 키워드 매칭 (우선순위 순, 코인은 이미 처리됨)
-    for sector, keywords in SECTOR_KEYWORDS.items():
-        if sector == "코인/크립토":  # 이미 처리됨
-            continue
-        # 바이오/헬스는 이미 처리됨 (여기는 루프에서 제외하거나 그냥 둠)
-        if sector == "바이오/헬스":
-            continue
-        if any(keyword.lower() in text for keyword in keywords):
+    return _sector_from_keywords(_scan_scoring_keywords((title + " " + content).lower()))
+
+
+def _sector_from_keywords(keywords: frozenset) -> str:
+    """classify_sector의 사전 계산 버전 (keywords: _scan_scoring_keywords 결과)"""
+    # 우선순위 순서대로 첫 매칭 섹터 반환
+    for sector, sector_keywords in _SECTOR_KEYWORD_SETS:
+        if not sector_keywords.isdisjoint(keywords):
             return sector
     
-    # 개별 종목 매칭 추가 (섹터 키워드에 없는 특정 우량주/이슈주)
-    if any(kw in text for kw in ["애플", "아이폰", "apple", "iphone"]):
-        return "테크/가전"
-    if any(kw in text for kw in ["테슬라", "tesla", "자율주행", "ev"]):
-        return "자동차/모빌리티"
-    if any(kw in text for kw in ["방산", "k-방산", "현대로템", "한화에어로"]):
-        return "방산/우주"
-    
-    return "기타"
+    return _SECTOR_OTHER
+
+
+# 거시 요약 주요 테마 (순서대로 표시)
+_MACRO_THEMES = {
+    "금리/통화정책": ["금리", "연준", "fed", "기준금리", "cpi", "인플레이션"],
+    "AI/반도체": ["ai", "반도체", "엔비디아", "hbm", "칩", "llm"],
+    "경기/성장": ["경기", "성장", "실적", "수출", "gdp"],
+    "지정학적 리스크": ["지정학", "전쟁", "관세", "무역", "중국", "러시아"]
+}
+_MACRO_THEME_RES = [(theme, _compile_keywords(keywords)) for theme, keywords in _MACRO_THEMES.items()]
+
+# 긍정/부정 톤 키워드 (서로 겹치지 않아 finditer 매칭 수 == 키워드별 등장 횟수 합)
+_MACRO_TONE_RE = re.compile(
+    "(?P<pos>" + "|".join(map(re.escape, ["상승", "개선", "기대", "호재"])) + ")"
+    "|(?P<neg>" + "|".join(map(re.escape, ["하락", "우려", "불안", "악재"])) + ")"
+)
+
+# 한국장 영향도 키워드
+_IMPACT_POSITIVE_KEYWORDS = frozenset(["상승", "급등", "호재", "기대", "개선", "증가", "성장", "반등"])
+_IMPACT_NEGATIVE_KEYWORDS = frozenset(["하락", "급락", "악재", "우려", "감소", "축소", "위험", "불안"])
+_IMPACT_MAJOR_STOCKS = frozenset(["삼성", "sk하이닉스", "네이버", "카카오", "lg", "현대", "기아"])
+_IMPACT_KEYWORDS = list(_IMPACT_POSITIVE_KEYWORDS | _IMPACT_NEGATIVE_KEYWORDS | _IMPACT_MAJOR_STOCKS)
+_IMPACT_RE = _compile_keywords(_IMPACT_KEYWORDS)
+_IMPACT_PREFIXES = _build_prefix_map(_IMPACT_KEYWORDS)
 
 
 def generate_macro_summary(news_items: List[NewsItem], overnight_signals: Optional[Dict] = None) -> str:
@@ -561,21 +855,18 @@ def generate_macro_summary(news_items: List[NewsItem], overnight_signals: Option
             quantitative_lines.append(f"• 시장 지표: {', '.join(sig_texts[:4])}")
 
     # 2. 정성 데이터 분석 (뉴스 컨텐츠)
-    all_text = " ".join([item.title + " " + (item.content or "") for item in news_items])
-    all_text_lower = all_text.lower()
+    # 기사별로 스캔해 테마 포함 여부와 긍정/부정 톤 등장 횟수를 누적 (전체 텍스트 결합 없음)
+    theme_hits = set()
+    tone_counts = Counter()
+    for item in news_items:
+        text = (item.title + " " + (item.content or "")).lower()
+        for theme, pattern in _MACRO_THEME_RES:
+            if theme not in theme_hits and pattern.search(text):
+                theme_hits.add(theme)
+        tone_counts.update(match.lastgroup for match in _MACRO_TONE_RE.finditer(text))
     
     # 주요 테마 추출
-    themes = {
-        "금리/통화정책": ["금리", "연준", "fed", "기준금리", "cpi", "인플레이션"],
-        "AI/반도체": ["ai", "반도체", "엔비디아", "hbm", "칩", "llm"],
-        "경기/성장": ["경기", "성장", "실적", "수출", "gdp"],
-        "지정학적 리스크": ["지정학", "전쟁", "관세", "무역", "중국", "러시아"]
-    }
-    
-    found_themes = []
-    for theme, keywords in themes.items():
-        if any(kw in all_text_lower for kw in keywords):
-            found_themes.append(theme)
+    found_themes = [theme for theme, _ in _MACRO_THEME_RES if theme in theme_hits]
     
     # 3. 종합 요약 구성
     lines = []
@@ -586,8 +877,8 @@ def generate_macro_summary(news_items: List[NewsItem], overnight_signals: Option
         lines.append(f"• 주요 테마: {', '.join(found_themes[:3])}")
     
     # 긍정/부정 톤 분석
-    pos_count = sum(all_text_lower.count(kw) for kw in ["상승", "개선", "기대", "호재"])
-    neg_count = sum(all_text_lower.count(kw) for kw in ["하락", "우려", "불안", "악재"])
+    pos_count = tone_counts["pos"]
+    neg_count = tone_counts["neg"]
     
     if pos_count > neg_count * 1.2:
         tone = "긍정적"
@@ -620,19 +911,14 @@ def assess_korea_impact(news_items: List[NewsItem]) -> tuple[str, str]:
     if not news_items:
         return ("중", "뉴스 부족")
     
-    all_text = " ".join([item.title + " " + (item.content or "") for item in news_items])
-    all_text_lower = all_text.lower()
-    
-    # 긍정/부정 키워드
-    positive_keywords = ["상승", "급등", "호재", "기대", "개선", "증가", "성장", "반등"]
-    negative_keywords = ["하락", "급락", "악재", "우려", "감소", "축소", "위험", "불안"]
-    
-    positive_count = sum(1 for kw in positive_keywords if kw in all_text_lower)
-    negative_count = sum(1 for kw in negative_keywords if kw in all_text_lower)
+    # 긍정/부정 키워드, 주요 종목 언급 여부 (기사별 스캔 결과를 합쳐 포함된 키워드 집합 계산)
+    found = set()
+    for item in news_items:
+        found |= _find_keywords(_IMPACT_RE, _IMPACT_PREFIXES, (item.title + " " + (item.content or "")).lower())
     
-    # 주요 종목 언급 여부
-    major_stocks = ["삼성", "sk하이닉스", "네이버", "카카오", "lg", "현대", "기아"]
-    stock_mentions = sum(1 for stock in major_stocks if stock in all_text_lower)
+    positive_count = len(found & _IMPACT_POSITIVE_KEYWORDS)
+    negative_count = len(found & _IMPACT_NEGATIVE_KEYWORDS)
+    stock_mentions = len(found & _IMPACT_MAJOR_STOCKS)
     
     # 영향도 계산
     if positive_count > negative_count * 1.5 and stock_mentions >= 2:
@@ -649,6 +935,11 @@ def assess_korea_impact(news_items: List[NewsItem]) -> tuple[str, str]:
         return ("중", "혼조세")
 
 
+# 섹터별 감성 집계 키워드 (한글은 대소문자 구분이 없으므로 제목을 lower() 하지 않고 그대로 검색)
+_SECTOR_POSITIVE_KEYWORDS = ("상승", "기대", "호재")
+_SECTOR_NEGATIVE_KEYWORDS = ("하락", "우려", "악재")
+
+
 def create_digest(news_items: List[NewsItem], 
                   fetched_count: int = 0,
                   time_filtered_count: int = 0,
@@ -684,14 +975,21 @@ def create_digest(news_items: List[NewsItem],
     
     logger.info(f"중복 제거: {before_dedup}건 → {after_dedup}건")
     
-    # 2. 노이즈 필터 적용
+    # 정규화 제목/단어 집합/키워드 집합/섹터/UTC 시각을 아이템당 1회만 계산
+    token_vocab: Dict[str, int] = {}  # 제목 비트맵용 단어 어휘 (이번 다이제스트 생성에만 사용)
+    prepared_news = [_prepare_item(item, token_vocab) for item in unique_news]
+    published_index = _PublishedIndex(prepared_news)
+    
+    # 2. 노이즈 필터 적용 (아이템당 1회 판정, 노이즈 항목은 복구 후보로 보관)
     filtered_news = []
-    noise_count = 0
-    for item in unique_news:
+    noise_news = []
+    for prepared in prepared_news:
+        item = prepared.item
         if is_noise_article(item.title, item.source or "", item.url):
-            noise_count += 1
+            noise_news.append(prepared)
         else:
-            filtered_news.append(item)
+            filtered_news.append(prepared)
+    noise_count = len(noise_news)
     
     logger.info(f"노이즈 필터: {len(unique_news)}건 → {len(filtered_news)}건 (제외: {noise_count}건)")
     
@@ -699,36 +997,37 @@ def create_digest(news_items: List[NewsItem],
     if len(filtered_news) < 10:
         logger.warning(f"노이즈 필터 후 후보가 {len(filtered_news)}개로 부족, 일부 복구")
         # 노이즈 제외된 항목 중 일부 복구 (점수 높은 것부터)
-        noise_items = [item for item in unique_news if is_noise_article(item.title, item.source or "", item.url)]
         # score_headline이 튜플을 반환하므로 첫 번째 요소(점수)로 정렬
         now_utc_temp = datetime.now(UTC)
         noise_items_with_scores = [
-            (item, score_headline(item, unique_news, now_utc_temp, overnight_signals=overnight_signals)[0]) 
-            for item in noise_items
+            (prepared, _score_headline_prepared(prepared, published_index, now_utc_temp, overnight_signals=overnight_signals)[0]) 
+            for prepared in noise_news
         ]
         noise_items_with_scores.sort(key=lambda x: x[1], reverse=True)
         # 상위 5개만 복구
-        filtered_news.extend([item for item, _ in noise_items_with_scores[:5]])
-        logger.info(f"노이즈 항목 {min(5, len(noise_items))}개 복구")
+        filtered_news.extend([prepared for prepared, _ in noise_items_with_scores[:5]])
+        logger.info(f"노이즈 항목 {min(5, noise_count)}개 복구")
     
     # 3. 시장 관련도 점수 계산 및 정렬 (전체 unique_news를 비교 대상으로 전달)
     now_utc = datetime.now(UTC)
-    scored_news = []
+    scored_prepared = []
     headline_debug = {}
-    for item in filtered_news:
-        score, debug_info = score_headline(item, unique_news, now_utc, overnight_signals=overnight_signals)
-        scored_news.append((item, score))
-        headline_debug[item.title] = debug_info
+    for prepared in filtered_news:
+        score, debug_info = _score_headline_prepared(prepared, published_index, now_utc, overnight_signals=overnight_signals)
+        scored_prepared.append((prepared, score))
+        headline_debug[prepared.item.title] = debug_info
     
-    scored_news.sort(key=lambda x: x[1], reverse=True)
+    scored_prepared.sort(key=lambda x: x[1], reverse=True)
+    scored_news = [(prepared.item, score) for prepared, score in scored_prepared]
     
     # 4. 섹터 다양성 보정 (한 섹터 최대 3개)
     sector_counts = defaultdict(int)
     selected_headlines = []
     selected_items = []
     
-    for item, score in scored_news:
-        sector = classify_sector(item.title, item.content or "")
+    for prepared, score in scored_prepared:
+        item = prepared.item
+        sector = prepared.sector
         
         # 섹터별 최대 3개 제한
         if sector_counts[sector] >= 3:
@@ -755,15 +1054,16 @@ def create_digest(news_items: List[NewsItem],
     sector_bullets: Dict[str, List[str]] = defaultdict(list)
     sector_sentiment_counts = defaultdict(lambda: {"pos": 0, "neg": 0})
     
-    for item in unique_news:
-        sector = classify_sector(item.title, item.content or "")
+    for prepared in prepared_news:
+        item = prepared.item
+        sector = prepared.sector
         if len(sector_bullets[sector]) < 3:  # 섹터당 최대 3개
             sector_bullets[sector].append(item.title)
         
         # 섹터별 감성 집계
-        title_lower = item.title.lower()
-        sector_sentiment_counts[sector]["pos"] += sum(title_lower.count(kw) for kw in ["상승", "기대", "호재"])
-        sector_sentiment_counts[sector]["neg"] += sum(title_lower.count(kw) for kw in ["하락", "우려", "악재"])
+        title = item.title
+        sector_sentiment_counts[sector]["pos"] += sum(title.count(kw) for kw in _SECTOR_POSITIVE_KEYWORDS)
+        sector_sentiment_counts[sector]["neg"] += sum(title.count(kw) for kw in _SECTOR_NEGATIVE_KEYWORDS)
     
     # 섹터 우선순위 결정: 변동성 큰 지표 관련 섹터 우선 + 뉴스 많은 섹터
     priority_sectors = []
@@ -784,7 +1084,7 @@ def create_digest(news_items: List[NewsItem],
             score += 10
         return score
 
-    sector_items = [(k, v) for k, v in sector_bullets.items() if k != "기타"]
+    sector_items = [(k, v) for k, v in sector_bullets.items() if k != _SECTOR_OTHER]
     sector_items.sort(key=sector_sort_key, reverse=True)
     
     # 섹터 결과 재구성 (감성 정보 포함 가능하지만 현재는 불렛만)
@@ -795,24 +1095,14 @@ def create_digest(news_items: List[NewsItem],
     korea_impact = f"{impact_level} - {impact_reason}"
     
     # 9. 소스 URL (중복 제거, 최대 5개)
-    # selected_items에서 유효한 URL만 추출 (example.com 제외)
-    valid_urls = []
-    for item in selected_items[:10]:
-        url = item.url.strip() if item.url else ""
-        # example.com이나 더미 URL 제외
-        if url and not url.startswith("https://example.com") and "example.com" not in url:
-            valid_urls.append(url)
-    
-    # 유효한 URL이 부족하면 전체 unique_news에서도 가져오기
-    if len(valid_urls) < 5:
-        for item in unique_news:
-            if len(valid_urls) >= 5:
-                break
-            url = item.url.strip() if item.url else ""
-            if url and url not in valid_urls and not url.startswith("https://example.com") and "example.com" not in url:
-                valid_urls.append(url)
-    
-    sources = valid_urls[:5]
+    # selected_items의 유효한 URL 우선, 부족하면 전체 unique_news에서 채움
+    # (example.com 더미 URL 제외, 순서 유지 중복 제거)
+    valid_urls = (
+        url
+        for url in (item.url.strip() for item in chain(selected_items[:10], unique_news) if item.url)
+        if url and not _DUMMY_URL_RE.search(url)
+    )
+    sources = list(dict.fromkeys(valid_urls))[:5]
     
     # 디버그 로그
     if sources:
@@ -1,9 +1,11 @@
 """성과 분석 모듈"""
 from typing import List, Optional
 from dataclasses import dataclass
+from itertools import accumulate
+from operator import sub, truediv
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeResult:
     """거래 결과"""
     symbol: str
@@ -100,18 +102,29 @@ def calculate_performance_metrics(trade_results: List[TradeResult]) -> Performan
             mdd=0.0
         )
     
-    total_invested = sum(t.invested_amount for t in trade_results)
-    total_value = sum(t.current_value for t in trade_results)
+    # 합계/승패/최저 손익률을 한 번의 순회로 집계
+    total_invested = 0.0
+    total_value = 0.0
+    win_count = 0
+    loss_count = 0
+    # MDD 계산 (간단한 버전): 최저 손익률 (0 이상이면 MDD 0)
+    max_drawdown = 0.0
+    
+    for t in trade_results:
+        total_invested += t.invested_amount
+        total_value += t.current_value
+        if t.pnl > 0:
+            win_count += 1
+        elif t.pnl < 0:
+            loss_count += 1
+        if t.pnl_rate < max_drawdown:
+            max_drawdown = t.pnl_rate
+    
     total_pnl = total_value - total_invested
     total_pnl_rate = (total_pnl / total_invested) * 100 if total_invested > 0 else 0.0
+    win_rate = (win_count / len(trade_results)) * 100
     
-    win_count = sum(1 for t in trade_results if t.pnl > 0)
-    loss_count = sum(1 for t in trade_results if t.pnl < 0)
-    win_rate = (win_count / len(trade_results)) * 100 if trade_results else 0.0
-    
-    # MDD 계산 (간단한 버전)
-    max_drawdown = min((t.pnl_rate for t in trade_results), default=0.0)
-    mdd = abs(max_drawdown) if max_drawdown < 0 else 0.0
+    mdd = abs(max_drawdown)
     
     return PerformanceMetrics(
         total_invested=round(total_invested, 2),
@@ -138,15 +151,9 @@ def calculate_mdd(prices: List[float]) -> float:
     if not prices or len(prices) < 2:
         return 0.0
     
-    peak = prices[0]
-    max_drawdown = 0.0
-    
-    for price in prices[1:]:
-        if price > peak:
-            peak = price
-        drawdown = ((peak - price) / peak) * 100
-        if drawdown > max_drawdown:
-            max_drawdown = drawdown
+    # 시점별 고점 (running max) 후 낙폭 비율의 최댓값 (C 레벨 map/accumulate)
+    peaks = list(accumulate(prices, max))
+    max_drawdown = max(map(truediv, map(sub, peaks, prices), peaks)) * 100
     
     return round(max_drawdown, 2)
 
@@ -1,26 +1,108 @@
 """종목 선정 로직 (뉴스 기반 관찰 리스트 생성)"""
 from typing import List, Dict, Tuple, Optional, Any
 from dataclasses import dataclass, asdict
+import concurrent.futures
+import heapq
 import logging
 import json
+import multiprocessing
+import os
+import random
+import re
+import sys
+from collections import Counter, defaultdict
+from functools import lru_cache, partial
+from itertools import chain, islice
 
 from src.news.base import NewsItem
 from src.analysis.news_analyzer import NewsDigest, classify_sector
 from src.data.kr_symbols import (
     KR_SYMBOLS, 
-    find_symbols_in_text, 
+    FOREIGN_TO_KR_MAPPING,
+    compile_name_pattern,
+    find_symbol_names,
+    find_symbol_and_foreign_names,
     get_foreign_substitute_symbols,
     get_symbol_code
 )
 from src.config import WATCHLIST_KR, LLM_ENABLED, LLM_MODEL, LOG_FORMAT
-from src.llm.client import generate_json
-from src.market.financial import fetch_financial_metrics, calculate_checklist_scores_from_metrics
+from src.llm.client import generate_json_batch, generate_json_stream
+from src.market.financial import FinancialMetrics, fetch_financial_metrics, calculate_checklist_scores_from_metrics
+from src.market.overnight import assess_market_tone
 from src.utils.logging import track_performance, log_with_extra
 
 logger = logging.getLogger(__name__)
 
+# 관찰 리스트 종목별 가중치 (중복 등록된 종목은 등록 횟수만큼)
+_WATCHLIST_BONUS = Counter(map(sys.intern, WATCHLIST_KR))
 
-@dataclass
+# 관찰 리스트 포함 여부 조회용 (리스트 선형 탐색 대신 집합 조회, 가중치 키를 그대로 사용)
+_WATCHLIST_SET = frozenset(_WATCHLIST_BONUS)
+
+# NVDA 강세 시 가점 대상 (nvidia/엔비디아 대체 종목, 중복 제거)
+_NVDA_SUBSTITUTES = frozenset(FOREIGN_TO_KR_MAPPING.get("nvidia", []) + FOREIGN_TO_KR_MAPPING.get("엔비디아", []))
+
+# Nasdaq 강세 시 가점 대상 종목명 키워드 (반도체/AI)
+_NASDAQ_THEME_KEYWORDS = ("반도체", "전자", "하이닉스", "칩스", "반도")
+
+# Risk-off 시 감점 대상 종목명 키워드 (2차전지, 바이오 등 고변동)
+_RISK_OFF_KEYWORDS = ("에너지", "SDI", "바이오", "제약", "헬스")
+
+# 점수가 매겨질 수 있는 종목명 전체 (KR_SYMBOLS + 해외 대체 종목)
+_SCORABLE_NAMES = frozenset(chain(KR_SYMBOLS, chain.from_iterable(FOREIGN_TO_KR_MAPPING.values())))
+
+# 키워드 포함 여부를 모듈 로드 시 한 번만 판정해 둔 종목 집합 (호출마다 종목 × 키워드 부분 문자열 검사 대신 집합 교집합)
+_NASDAQ_THEME_NAMES = frozenset(
+    name for name in _SCORABLE_NAMES if any(keyword in name for keyword in _NASDAQ_THEME_KEYWORDS)
+)
+_RISK_OFF_NAMES = frozenset(
+    name for name in _SCORABLE_NAMES if any(keyword in name for keyword in _RISK_OFF_KEYWORDS)
+)
+
+
+def _signal_pct_change(signal: Optional[Any]) -> float:
+    """
+    오버나이트 신호의 변동률 (신호가 없거나 수집 실패/변동률 없음이면 0.0)
+    
+    Args:
+        signal: OvernightSignal 또는 None
+    
+    Returns:
+        변동률 (%)
+    """
+    if signal is None or not signal.success:
+        return 0.0
+    return signal.pct_change or 0.0
+
+
+@lru_cache(maxsize=4096)
+def _fold(text: str) -> str:
+    """
+    대소문자 무시 비교용 텍스트 (casefold)
+    
+    같은 헤드라인/bullet/제목이 후보 추출, 후보 생성, catalyst 검색에서 반복 사용되므로
+    모듈 전체에서 문자열당 1회만 변환되도록 캐싱한다.
+    
+    Args:
+        text: 원문 텍스트
+    
+    Returns:
+        casefold된 텍스트
+    """
+    return text.casefold()
+
+
+# 해외 종목명 -> FOREIGN_TO_KR_MAPPING 순번 (언급된 해외 종목만 매핑 순서로 정렬하기 위함)
+_FOREIGN_RANK: Dict[str, int] = {foreign_name: rank for rank, foreign_name in enumerate(FOREIGN_TO_KR_MAPPING)}
+
+# 한국 종목 -> (해외 종목명, ...) 역방향 매핑 (FOREIGN_TO_KR_MAPPING 순서)
+_FOREIGN_NAMES_BY_KR: Dict[str, Tuple[str, ...]] = {}
+for _foreign_name, _kr_names in FOREIGN_TO_KR_MAPPING.items():
+    for _kr_name in dict.fromkeys(_kr_names):
+        _FOREIGN_NAMES_BY_KR[_kr_name] = _FOREIGN_NAMES_BY_KR.get(_kr_name, ()) + (_foreign_name,)
+
+
+@dataclass(slots=True)
 class WatchStock:
     """관찰 종목 정보"""
     name: str  # 종목명
@@ -35,6 +117,15 @@ class WatchStock:
     confidence_reason: str  # 확신도 이유
 
 
+@dataclass(slots=True)
+class WatchStockJob:
+    """pick_watch_stocks_batch 작업 단위 (pick_watch_stocks 인자와 동일)"""
+    digest: NewsDigest  # 뉴스 다이제스트
+    news_items: List[NewsItem]  # 뉴스 아이템 리스트
+    date_str: Optional[str] = None  # 날짜 문자열 (YYYY-MM-DD, LLM 사용 시 필요)
+    overnight_signals: Optional[Dict] = None  # 오버나이트 선행 신호
+
+
 @track_performance("extract_stock_candidates")
 def extract_stock_candidates(
     digest: NewsDigest, 
@@ -52,98 +143,110 @@ def extract_stock_candidates(
     Returns:
         {종목명: 점수} 딕셔너리
     """
-    scores: Dict[str, int] = {}
-    
-    # 전체 텍스트 수집
-    all_text = " ".join(digest.top_headlines)
-    all_text += " " + " ".join([bullet for bullets in digest.sector_bullets.values() for bullet in bullets])
-    
-    # 뉴스 아이템 전체에서도 종목 찾기 (더 넓은 범위)
-    for item in news_items:
-        item_text = item.title + " " + (item.content or "")
-        found_symbols = find_symbols_in_text(item_text)
-        for symbol_name, code in found_symbols.items():
-            if symbol_name not in scores:
-                scores[symbol_name] = 0
-            scores[symbol_name] += 2  # 뉴스 아이템 언급: +2
-    
-    # 헤드라인에서 종목명 찾기
-    for headline in digest.top_headlines:
-        found_symbols = find_symbols_in_text(headline)
-        for symbol_name, code in found_symbols.items():
-            if symbol_name not in scores:
-                scores[symbol_name] = 0
-            scores[symbol_name] += 3  # 헤드라인 직접 언급: +3
-    
-    # 섹터 bullets에서 종목명 찾기
-    for bullets in digest.sector_bullets.values():
-        for bullet in bullets:
-            found_symbols = find_symbols_in_text(bullet)
-            for symbol_name, code in found_symbols.items():
-                if symbol_name not in scores:
-                    scores[symbol_name] = 0
-                scores[symbol_name] += 2  # 섹터 bullet 언급: +2
+    # 뉴스/헤드라인/bullet이 모두 비어 있고 오버나이트 신호도 없으면 가점 대상이 없음 (수집 실패, 휴일 등)
+    if not news_items and not digest.top_headlines and not any(digest.sector_bullets.values()) and not overnight_signals:
+        return {}
+    
+    # 뉴스 아이템 전체에서도 종목 찾기 (더 넓은 범위, +2)
+    # 아이템 수가 많으므로 언급 횟수는 Counter의 C 구현으로 한 번에 세고 가중치는 종목별로 1회만 곱함
+    # (Counter는 처음 언급된 순서를 유지하므로 동점 종목의 순서도 그대로)
+    scores: Dict[str, int] = Counter(chain.from_iterable(
+        find_symbol_names((item.title + " " + (item.content or "")).casefold()) for item in news_items
+    ))
+    for symbol_name in scores:
+        scores[symbol_name] *= 2
+    
+    # 헤드라인(+3) / 섹터 bullet(+2)은 (텍스트, 가중치) 하나의 흐름으로 처리 (sector_bullets는 이 한 번만 순회)
+    weighted_texts = chain(
+        # 헤드라인 직접 언급
+        ((headline, 3) for headline in digest.top_headlines),
+        # 섹터 bullet 언급
+        ((bullet, 2) for bullets in digest.sector_bullets.values() for bullet in bullets),
+    )
+    # 헤드라인/bullet은 종목명과 해외 종목명을 한 번의 스캔으로 함께 찾음
+    digest_foreign_names = set()
+    for text, weight in weighted_texts:
+        symbol_names, foreign_names = find_symbol_and_foreign_names(_fold(text))
+        digest_foreign_names.update(foreign_names)
+        for symbol_name in symbol_names:
+            scores[symbol_name] += weight
     
     # WATCHLIST_KR에 있는 종목 가중치 추가 (가중치 감소: +2 → +1)
     # WATCHLIST_KR은 참고용이지, 무조건 선택되게 하지 않음
-    for watch_name in WATCHLIST_KR:
-        if watch_name in scores:
-            scores[watch_name] += 1  # WATCHLIST_KR 포함: +1 (기존 +2에서 감소)
-        # WATCHLIST_KR에 있지만 언급되지 않은 경우는 점수 부여하지 않음 (다양성 확보)
-    
-    # 해외 종목 → 한국 대체 종목 매핑 (FOREIGN_TO_KR_MAPPING 사용)
-    from src.data.kr_symbols import FOREIGN_TO_KR_MAPPING
-    all_text_lower = all_text.lower()
-    for foreign_name, kr_substitutes in FOREIGN_TO_KR_MAPPING.items():
-        if foreign_name in all_text_lower:
-            for kr_name in kr_substitutes:
-                if kr_name not in scores:
-                    scores[kr_name] = 0
-                scores[kr_name] += 1  # 해외 종목 관련: +1
+    # 언급된 종목과 관찰 리스트의 교집합만 가점 (언급되지 않은 종목은 점수 부여하지 않음, 다양성 확보)
+    for watch_name in _WATCHLIST_BONUS.keys() & scores.keys():
+        scores[watch_name] += _WATCHLIST_BONUS[watch_name]  # WATCHLIST_KR 포함: +1 (기존 +2에서 감소)
+    
+    # 해외 종목 → 한국 대체 종목 매핑 (언급된 해외 종목만 FOREIGN_TO_KR_MAPPING 순서로 적용)
+    for foreign_name in sorted(digest_foreign_names, key=_FOREIGN_RANK.__getitem__):
+        for kr_name in FOREIGN_TO_KR_MAPPING[foreign_name]:
+            scores[kr_name] += 1  # 해외 종목 관련: +1
     
     # 오버나이트 선행 신호 기반 점수 조정 (섹터별 동적 처리)
     if overnight_signals:
-        from src.market.overnight import assess_market_tone
-        from src.data.kr_symbols import FOREIGN_TO_KR_MAPPING
         
-        # 반도체/AI 섹터: Nasdaq/NVDA 강하면 관련 종목 가점
-        nvda = overnight_signals.get("NVDA")
-        nasdaq = overnight_signals.get("Nasdaq")
+        # 반도체/AI 섹터: Nasdaq/NVDA 강하면 관련 종목 가점 (신호별 변동률은 한 번만 꺼내 사용)
+        nvda_pct = _signal_pct_change(overnight_signals.get("NVDA"))
+        nasdaq_pct = _signal_pct_change(overnight_signals.get("Nasdaq"))
         
         # NVDA 관련 한국 종목 찾기 (FOREIGN_TO_KR_MAPPING 사용)
-        if nvda and nvda.success and nvda.pct_change:
-            if nvda.pct_change > 1.0:  # NVDA +1% 이상
-                nvda_related = FOREIGN_TO_KR_MAPPING.get("nvidia", []) + FOREIGN_TO_KR_MAPPING.get("엔비디아", [])
-                for kr_name in set(nvda_related):  # 중복 제거
-                    if kr_name not in scores:
-                        scores[kr_name] = 0
-                    scores[kr_name] += 1  # NVDA 강세: +1 (기존 +2에서 감소)
+        if nvda_pct > 1.0:  # NVDA +1% 이상
+            for kr_name in _NVDA_SUBSTITUTES:  # 중복 제거된 상수
+                scores[kr_name] += 1  # NVDA 강세: +1 (기존 +2에서 감소)
         
         # Nasdaq 강세 시 반도체/AI 관련 종목 가점 (더 넓은 범위)
-        if nasdaq and nasdaq.success and nasdaq.pct_change:
-            if nasdaq.pct_change > 0.5:  # Nasdaq +0.5% 이상
-                # 반도체/AI 관련 종목 찾기 (뉴스에서 언급된 종목 중)
-                for stock_name in scores.keys():
-                    # 반도체/AI 관련 키워드가 있는 종목만 가점
-                    if any(keyword in stock_name for keyword in ["반도체", "전자", "하이닉스", "칩스", "반도"]):
-                        scores[stock_name] += 1  # Nasdaq 강세: +1
+        if nasdaq_pct > 0.5:  # Nasdaq +0.5% 이상
+            # 반도체/AI 관련 종목 찾기 (뉴스에서 언급된 종목 중 관련 키워드가 있는 종목만 가점)
+            for stock_name in _NASDAQ_THEME_NAMES & scores.keys():
+                scores[stock_name] += 1  # Nasdaq 강세: +1
         
-        # 코인 관련: BTC 강하면 가점 (향후 확장 가능)
-        btc = overnight_signals.get("BTC")
-        if btc and btc.success and btc.pct_change:
-            if btc.pct_change > 2.0:  # BTC +2% 이상
-                # 코인 관련 종목이 있으면 가점 (현재는 없지만 향후 확장 가능)
-                pass
+        # 코인 관련: BTC +2% 이상이면 가점 (현재는 코인 관련 종목이 없어 점수 변화 없음, 향후 확장 가능)
         
         # Risk-off 환경: 고변동 종목 감점 (섹터별로 동적 처리)
         market_tone = assess_market_tone(overnight_signals)
         if market_tone == "risk_off":
             # 고변동 종목 감점 (2차전지, 바이오 등)
-            for stock_name in scores.keys():
-                if any(keyword in stock_name for keyword in ["에너지", "SDI", "바이오", "제약", "헬스"]):
-                    scores[stock_name] = max(0, scores[stock_name] - 1)  # -1 감점
+            for stock_name in _RISK_OFF_NAMES & scores.keys():
+                scores[stock_name] = max(0, scores[stock_name] - 1)  # -1 감점
     
-    return scores
+    # 호출자에게는 일반 dict로 반환 (없는 키 조회 시 자동 추가되지 않도록)
+    return dict(scores)
+
+
+# 체크리스트 항목 (LLM/재무 점수 키, 표시용 한글 항목명) - 표시 순서 고정
+_CHECKLIST_ITEMS = (
+    ("known_company", "내가 아는 회사"),  # 1) 내가 아는 회사인가?
+    ("business_explainable", "비즈니스 설명 가능"),  # 2) 비즈니스 설명 가능?
+    ("growth_3y", "3년간 실적 성장"),  # 3) 3년간 실적 성장?
+    ("per_10_20", "PER 10~20"),  # 4) PER 10~20?
+    ("debt_lt_100", "부채비율 100% 이하"),  # 5) 부채비율 100% 이하?
+    ("clear_reason", "살 이유 명확"),  # 6) 살 이유가 명확한가?
+)
+_CHECKLIST_LABELS = tuple(label for _, label in _CHECKLIST_ITEMS)
+
+
+@lru_cache(maxsize=None)
+def _default_checklist_scores(
+    in_watchlist: bool,
+    known_symbol: bool,
+    has_catalyst: bool
+) -> Tuple[Tuple[str, int], ...]:
+    """
+    재무 데이터가 없을 때의 기본 체크리스트 점수
+    
+    입력 조합이 8가지뿐이므로 캐싱하고, 호출자가 변경할 수 없도록 (항목, 점수) 튜플로 반환
+    
+    Args:
+        in_watchlist: WATCHLIST_KR에 있는지
+        known_symbol: KR_SYMBOLS에 있는 종목인지
+        has_catalyst: 뉴스 catalyst가 있는지 여부
+    
+    Returns:
+        (항목, 점수) 튜플
+    """
+    # 3)~5)는 데이터가 없으므로 기본 1점
+    values = (2 if in_watchlist else 1, 2 if known_symbol else 1, 1, 1, 1, 2 if has_catalyst else 1)
+    return tuple(zip(_CHECKLIST_LABELS, values))
 
 
 def calculate_checklist_score(
@@ -162,7 +265,7 @@ def calculate_checklist_score(
     Returns:
         (체크리스트 점수 딕셔너리, 총점) 튜플
     """
-    in_watchlist = stock_name in WATCHLIST_KR
+    in_watchlist = stock_name in _WATCHLIST_SET
     
     # 재무 데이터가 있으면 사용, 없으면 기본값
     if financial_metrics and financial_metrics.success:
@@ -173,54 +276,40 @@ def calculate_checklist_score(
             in_watchlist
         )
         # 키 이름을 한글로 변환 (기존 호환성 유지)
-        scores_kr = {
-            "내가 아는 회사": scores.get("known_company", 1),
-            "비즈니스 설명 가능": scores.get("business_explainable", 1),
-            "3년간 실적 성장": scores.get("growth_3y", 1),
-            "PER 10~20": scores.get("per_10_20", 1),
-            "부채비율 100% 이하": scores.get("debt_lt_100", 1),
-            "살 이유 명확": scores.get("clear_reason", 1)
-        }
+        scores_kr = {label: scores.get(key, 1) for key, label in _CHECKLIST_ITEMS}
         logger.info(f"{stock_name}: 재무 데이터 기반 점수 계산 완료 - 총점={sum(scores_kr.values())}/12")
     else:
         if financial_metrics:
             logger.debug(f"{stock_name}: 재무 데이터 있지만 success=False, 기본값 사용")
         else:
             logger.debug(f"{stock_name}: 재무 데이터 없음, 기본값 사용")
-        # 재무 데이터 없으면 기본값 사용
-        scores_kr = {}
-        
-        # 1) 내가 아는 회사인가?
-        if in_watchlist:
-            scores_kr["내가 아는 회사"] = 2
-        else:
-            scores_kr["내가 아는 회사"] = 1
-        
-        # 2) 비즈니스 설명 가능?
-        if stock_name in KR_SYMBOLS:
-            scores_kr["비즈니스 설명 가능"] = 2
-        else:
-            scores_kr["비즈니스 설명 가능"] = 1
-        
-        # 3) 3년간 실적 성장?
-        scores_kr["3년간 실적 성장"] = 1  # 데이터 없으므로 기본 1점
-        
-        # 4) PER 10~20?
-        scores_kr["PER 10~20"] = 1  # 데이터 없으므로 기본 1점
-        
-        # 5) 부채비율 100% 이하?
-        scores_kr["부채비율 100% 이하"] = 1  # 데이터 없으므로 기본 1점
-        
-        # 6) 살 이유가 명확한가?
-        if has_catalyst:
-            scores_kr["살 이유 명확"] = 2
-        else:
-            scores_kr["살 이유 명확"] = 1
+        # 재무 데이터 없으면 기본값 사용 (입력 조합별로 캐싱된 점수의 복사본)
+        scores_kr = dict(_default_checklist_scores(in_watchlist, stock_name in KR_SYMBOLS, has_catalyst))
     
     total = sum(scores_kr.values())
     return (scores_kr, total)
 
 
+# 확신도 (확신도, 이유) 상수
+_CONFIDENCE_HIGH = ("상", "체크리스트 점수 높음 + catalyst + 관찰 리스트 포함")
+_CONFIDENCE_MID_CATALYST = ("중", "체크리스트 점수 양호 + catalyst 존재")
+_CONFIDENCE_MID = ("중", "체크리스트 점수 양호")
+_CONFIDENCE_LOW = ("하", "체크리스트 점수 낮음 또는 catalyst 부족")
+
+# (점수 구간, catalyst 여부, 관찰 리스트 포함 여부) -> 확신도
+# 점수 구간: 2 = 10점 이상, 1 = 8점 이상 (8점 미만은 테이블에 없음 → 하)
+_CONFIDENCE_TABLE: Dict[Tuple[int, bool, bool], Tuple[str, str]] = {
+    (2, True, True): _CONFIDENCE_HIGH,
+    (2, True, False): _CONFIDENCE_MID_CATALYST,
+    (1, True, True): _CONFIDENCE_MID_CATALYST,
+    (1, True, False): _CONFIDENCE_MID_CATALYST,
+    (2, False, True): _CONFIDENCE_MID,
+    (2, False, False): _CONFIDENCE_MID,
+    (1, False, True): _CONFIDENCE_MID,
+    (1, False, False): _CONFIDENCE_MID,
+}
+
+
 def assess_confidence(total_score: int, has_catalyst: bool, in_watchlist: bool) -> Tuple[str, str]:
     """
     확신도 평가
@@ -233,14 +322,47 @@ def assess_confidence(total_score: int, has_catalyst: bool, in_watchlist: bool)
     Returns:
         (확신도, 이유) 튜플
     """
-    if total_score >= 10 and has_catalyst and in_watchlist:
-        return ("상", "체크리스트 점수 높음 + catalyst + 관찰 리스트 포함")
-    elif total_score >= 8 and has_catalyst:
-        return ("중", "체크리스트 점수 양호 + catalyst 존재")
-    elif total_score >= 8:
-        return ("중", "체크리스트 점수 양호")
-    else:
-        return ("하", "체크리스트 점수 낮음 또는 catalyst 부족")
+    if total_score < 8:
+        return _CONFIDENCE_LOW
+    score_tier = 2 if total_score >= 10 else 1
+    return _CONFIDENCE_TABLE[(score_tier, bool(has_catalyst), bool(in_watchlist))]
+
+
+# 섹터 태그별 특화 리스크 (첫 번째 리스크를 대체)
+_SECTOR_RISKS: Dict[str, str] = {
+    "semiconductor": "반도체 업황 사이클 변동성",
+    "battery": "전기차 수요 변동성 및 원자재 가격 변동",
+    "bio": "신약 개발 및 규제 승인 불확실성",
+}
+
+# 기본 리스크 템플릿
+_DEFAULT_MARKET_RISK = "시장 변동성 및 리스크 존재"
+_DEFAULT_FINANCIAL_RISK = "재무데이터 확인 필요 (PER, 부채비율 등)"
+
+
+def _risk_sector_tag(stock_name: str) -> Optional[str]:
+    """
+    종목명 기반 리스크 섹터 태그
+    
+    Args:
+        stock_name: 종목명
+    
+    Returns:
+        "semiconductor" | "battery" | "bio" 또는 None
+    """
+    if "반도체" in stock_name or stock_name in {"삼성전자", "SK하이닉스"}:
+        return "semiconductor"
+    elif "2차전지" in stock_name or "배터리" in stock_name:
+        return "battery"
+    elif "바이오" in stock_name or "제약" in stock_name:
+        return "bio"
+    return None
+
+
+# KR_SYMBOLS 종목의 섹터 태그는 모듈 로드 시 1회 계산 (태그 없는 종목은 제외)
+_SYMBOL_RISK_TAGS: Dict[str, str] = {
+    name: tag for name in KR_SYMBOLS if (tag := _risk_sector_tag(name)) is not None
+}
 
 
 def generate_risks(stock_name: str) -> List[str]:
@@ -253,21 +375,17 @@ def generate_risks(stock_name: str) -> List[str]:
     Returns:
         리스크 리스트 (2개)
     """
-    # 기본 리스크 템플릿
-    risks = [
-        "시장 변동성 및 리스크 존재",
-        "재무데이터 확인 필요 (PER, 부채비율 등)"
-    ]
-    
-    # 종목별 특화 리스크
-    if "반도체" in stock_name or stock_name in ["삼성전자", "SK하이닉스"]:
-        risks[0] = "반도체 업황 사이클 변동성"
-    elif "2차전지" in stock_name or "배터리" in stock_name:
-        risks[0] = "전기차 수요 변동성 및 원자재 가격 변동"
-    elif "바이오" in stock_name or "제약" in stock_name:
-        risks[0] = "신약 개발 및 규제 승인 불확실성"
+    # 종목별 특화 리스크 (KR_SYMBOLS 종목은 미리 계산한 태그 사용)
+    if stock_name in KR_SYMBOLS:
+        tag = _SYMBOL_RISK_TAGS.get(stock_name)
+    else:
+        tag = _risk_sector_tag(stock_name)
     
-    return risks
+    return [_SECTOR_RISKS.get(tag, _DEFAULT_MARKET_RISK), _DEFAULT_FINANCIAL_RISK]
+
+
+# 관찰 트리거 (현재는 종목과 무관한 고정 문구)
+_DEFAULT_TRIGGER = "갭상승 시 추격 금지, 변동성 확인 후 관찰"
 
 
 def generate_trigger(stock_name: str) -> str:
@@ -280,7 +398,76 @@ def generate_trigger(stock_name: str) -> str:
     Returns:
         관찰 트리거 텍스트
     """
-    return "갭상승 시 추격 금지, 변동성 확인 후 관찰"
+    return _DEFAULT_TRIGGER
+
+
+def _iter_by_score(scores: Dict[str, int]):
+    """
+    점수 내림차순으로 (종목명, 점수) 순회 (동점은 입력 순서 유지, sorted와 동일한 순서)
+    
+    전체를 정렬하지 않고 힙에서 필요한 만큼만 꺼내므로 상위 몇 개만 쓰고 멈추는 경우 유리
+    
+    Args:
+        scores: {종목명: 점수} 딕셔너리
+    
+    Yields:
+        (종목명, 점수) 튜플
+    """
+    heap = [(-score, index, name) for index, (name, score) in enumerate(scores.items())]
+    heapq.heapify(heap)
+    while heap:
+        neg_score, _, name = heapq.heappop(heap)
+        yield name, -neg_score
+
+
+# 재무 데이터 동시 요청 수 (프로세스 전체 기준, pick_watch_stocks_batch 워커 프로세스끼리 나눠 씀)
+_FINANCIAL_FETCH_MAX_WORKERS = 8
+_financial_fetch_workers = _FINANCIAL_FETCH_MAX_WORKERS
+
+
+def _set_financial_fetch_workers(workers: int):
+    """현재 프로세스의 재무 데이터 동시 요청 수 설정 (프로세스 풀 워커 initializer)"""
+    global _financial_fetch_workers
+    _financial_fetch_workers = workers
+
+
+def _fetch_financial_metrics_parallel(targets: List[tuple]) -> Dict[str, Any]:
+    """
+    후보 종목들의 재무 데이터를 스레드 풀로 병렬 수집
+    
+    종목별 수집은 서로 독립적인 네트워크 I/O이므로 순차 호출 대신 동시에 요청한다.
+    개별 실패는 로그만 남기고 결과에서 제외한다 (best-effort).
+    
+    Args:
+        targets: (종목명, 점수, 종목코드, 관련 헤드라인, 섹터) 튜플 리스트
+    
+    Returns:
+        종목코드 -> FinancialMetrics 딕셔너리 (예외 발생 종목은 없음)
+    """
+    results = {}
+    if not targets:
+        return results
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(_financial_fetch_workers, len(targets))) as executor:
+        future_to_target = {
+            executor.submit(fetch_financial_metrics, code, stock_name, provider="yahoo"): (stock_name, code)
+            for stock_name, _, code, _, _ in targets
+        }
+        for future in concurrent.futures.as_completed(future_to_target):
+            stock_name, code = future_to_target[future]
+            try:
+                financial_metrics = future.result()
+            except Exception as e:
+                logger.warning(f"{stock_name} ({code}): 재무 데이터 수집 예외 발생: {e}")
+                continue
+            
+            if financial_metrics.success:
+                logger.info(f"{stock_name} ({code}): 재무 데이터 수집 성공 - PER={financial_metrics.per}, 부채비율={financial_metrics.debt_ratio}%")
+            else:
+                logger.debug(f"{stock_name} ({code}): 재무 데이터 수집 실패 - {financial_metrics.error}")
+            results[code] = financial_metrics
+    
+    return results
 
 
 def create_stock_candidates(
@@ -308,13 +495,12 @@ def create_stock_candidates(
         "candidate_count": len(candidate_scores)
     })
     if candidate_scores:
-        top_5 = sorted(candidate_scores.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_5 = heapq.nlargest(5, candidate_scores.items(), key=lambda x: x[1])
         logger.info(f"상위 5개 후보: {[(name, score) for name, score in top_5]}")
     
     if not candidate_scores:
         # 후보가 없으면 섹터별 대표주로 fallback (더 다양하고 무작위성 부여)
         logger.warning("뉴스에서 종목을 찾지 못해 섹터별 대표주로 fallback")
-        import random
         
         # 섹터별 대표주 풀 확장
         sector_pools = {
@@ -353,12 +539,17 @@ def create_stock_candidates(
         if not candidate_scores:
             candidate_scores["삼성전자"] = 1
     
-    # 2. 점수 상위 종목 선택 (중복 종목코드 제거)
-    sorted_candidates = sorted(candidate_scores.items(), key=lambda x: x[1], reverse=True)
+    # 2. 점수 상위 종목 선택 (중복 종목코드 제거, max_candidates개 채우면 중단)
+    sorted_candidates = _iter_by_score(candidate_scores)
     
-    # 종목코드 기준으로 중복 제거
+    # 종목코드 기준으로 중복 제거 (max_candidates개 채우면 중단)
     seen_codes = set()
-    candidates = []
+    targets = []  # (종목명, 점수, 종목코드, 관련 헤드라인, 섹터)
+    
+    # 헤드라인 소문자 변환과 섹터 bullets 평탄화는 후보마다 반복하지 않고 1회만
+    headlines = [(headline, _fold(headline)) for headline in digest.top_headlines]
+    # 섹터 bullets는 원문 그대로(대소문자 구분) 종목명을 찾으므로 (원문, 원문) 쌍으로 구성
+    sector_bullets = [(bullet, bullet) for bullets in digest.sector_bullets.values() for bullet in bullets]
     
     for stock_name, score in sorted_candidates:
         code = get_symbol_code(stock_name)
@@ -367,13 +558,12 @@ def create_stock_candidates(
         
         seen_codes.add(code)
         
-        # 관련 헤드라인 찾기 (최대 3개)
-        matched_headlines = []
-        for headline in digest.top_headlines:
-            if stock_name in headline or stock_name.lower() in headline.lower():
-                matched_headlines.append(headline)
-                if len(matched_headlines) >= 3:
-                    break
+        # 관련 헤드라인 찾기 (최대 3개, 3개 찾으면 중단)
+        # 종목명은 한글/영문이므로 원문 포함 검사는 소문자 포함 검사에 포함됨 (소문자 1회 검사로 충분)
+        stock_name_lower = stock_name.casefold()
+        matched_headlines = list(islice(
+            (headline for headline, headline_lower in headlines if stock_name_lower in headline_lower), 3
+        ))
         
         # 섹터 분류
         sector = None
@@ -382,27 +572,26 @@ def create_stock_candidates(
             if sector:
                 break
         
-        # 섹터 bullets에서도 확인
-        if not sector:
-            for bullets in digest.sector_bullets.values():
-                for bullet in bullets:
-                    if stock_name in bullet:
-                        sector = classify_sector(bullet, "")
-                        if sector:
-                            break
-                if sector:
-                    break
-        
-        # 재무 데이터 수집 (비동기적으로, 실패해도 계속 진행)
-        financial_metrics = None
-        try:
-            financial_metrics = fetch_financial_metrics(code, stock_name, provider="yahoo")
-            if financial_metrics.success:
-                logger.info(f"{stock_name} ({code}): 재무 데이터 수집 성공 - PER={financial_metrics.per}, 부채비율={financial_metrics.debt_ratio}%")
-            else:
-                logger.debug(f"{stock_name} ({code}): 재무 데이터 수집 실패 - {financial_metrics.error}")
-        except Exception as e:
-            logger.warning(f"{stock_name} ({code}): 재무 데이터 수집 예외 발생: {e}")
+        targets.append((stock_name, score, code, matched_headlines, sector))
+        if len(targets) >= max_candidates:
+            break
+    
+    # 헤드라인으로 섹터를 못 정한 종목은 섹터 bullets에서 확인
+    # (종목마다 bullets 전체를 훑지 않고, 남은 종목명을 한 번에 찾는 역색인으로 처리)
+    # 기존 `stock_name in bullet` 검사와 같도록 원문 그대로(대소문자 구분) 비교 (의도된 동작)
+    missing = {target[0]: [(target[0], target[0])] for target in targets if not target[4]}
+    if missing and sector_bullets:
+        bullet_matches = _index_texts_by_key(sector_bullets, missing)
+        for i, (stock_name, score, code, matched_headlines, sector) in enumerate(targets):
+            if stock_name in missing and bullet_matches[stock_name]:
+                targets[i] = (stock_name, score, code, matched_headlines, classify_sector(bullet_matches[stock_name][0], ""))
+    
+    # 재무 데이터 수집 (후보별 HTTP 요청이므로 스레드 풀로 병렬 수집, 실패해도 계속 진행)
+    financial_metrics_by_code = _fetch_financial_metrics_parallel(targets)
+    
+    candidates = []
+    for stock_name, score, code, matched_headlines, sector in targets:
+        financial_metrics = financial_metrics_by_code.get(code)
         
         # 재무 데이터 딕셔너리 생성 (항상 포함, success=False일 수도 있음)
         financial_metrics_dict = None
@@ -429,77 +618,96 @@ def create_stock_candidates(
             "sector": sector,
             "financial_metrics": financial_metrics_dict
         })
-        
-        if len(candidates) >= max_candidates:
-            break
     
     return candidates
 
 
+# LLM 출력용 JSON Schema (Structured Outputs, 호출마다 다시 만들지 않도록 모듈 상수로 유지)
+_STOCK_SELECTION_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "selected": {
+            "type": "array",
+            "minItems": 1,
+            "maxItems": 3,
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "code": {"type": "string"},
+                    "confidence": {"type": "string", "enum": ["low", "mid", "high"]},
+                    "thesis": {"type": "string"},
+                    "catalyst": {
+                        "type": "array",
+                        "maxItems": 2,
+                        "items": {"type": "string"}
+                    },
+                    "risks": {
+                        "type": "array",
+                        "minItems": 2,
+                        "maxItems": 2,
+                        "items": {"type": "string"}
+                    },
+                    "watch_trigger": {"type": "string"},
+                    "checklist": {
+                        "type": "object",
+                        "properties": {
+                            "known_company": {"type": "integer", "minimum": 0, "maximum": 2},
+                            "business_explainable": {"type": "integer", "minimum": 0, "maximum": 2},
+                            "growth_3y": {"type": "integer", "minimum": 0, "maximum": 2},
+                            "per_10_20": {"type": "integer", "minimum": 0, "maximum": 2},
+                            "debt_lt_100": {"type": "integer", "minimum": 0, "maximum": 2},
+                            "clear_reason": {"type": "integer", "minimum": 0, "maximum": 2}
+                        },
+                        "required": ["known_company", "business_explainable", "growth_3y", "per_10_20", "debt_lt_100", "clear_reason"]
+                    },
+                    "must_use_news_refs": {
+                        "type": "array",
+                        "items": {"type": "integer"}
+                    }
+                },
+                "required": ["name", "code", "confidence", "thesis", "catalyst", "risks", "watch_trigger", "checklist"]
+            }
+        },
+        "meta": {
+            "type": "object",
+            "properties": {
+                "policy": {"type": "string"},
+                "notes": {"type": "string"}
+            },
+            "required": ["policy", "notes"]
+        }
+    },
+    "required": ["selected", "meta"]
+}
+
+
 def get_stock_selection_json_schema() -> Dict[str, Any]:
     """
     LLM 출력을 위한 JSON Schema (Structured Outputs)
     
     Returns:
-        JSON Schema 딕셔너리
+        JSON Schema 딕셔너리 (공유 상수이므로 수정하지 말 것)
     """
-    return {
-        "type": "object",
-        "properties": {
-            "selected": {
-                "type": "array",
-                "minItems": 1,
-                "maxItems": 3,
-                "items": {
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string"},
-                        "code": {"type": "string"},
-                        "confidence": {"type": "string", "enum": ["low", "mid", "high"]},
-                        "thesis": {"type": "string"},
-                        "catalyst": {
-                            "type": "array",
-                            "maxItems": 2,
-                            "items": {"type": "string"}
-                        },
-                        "risks": {
-                            "type": "array",
-                            "minItems": 2,
-                            "maxItems": 2,
-                            "items": {"type": "string"}
-                        },
-                        "watch_trigger": {"type": "string"},
-                        "checklist": {
-                            "type": "object",
-                            "properties": {
-                                "known_company": {"type": "integer", "minimum": 0, "maximum": 2},
-                                "business_explainable": {"type": "integer", "minimum": 0, "maximum": 2},
-                                "growth_3y": {"type": "integer", "minimum": 0, "maximum": 2},
-                                "per_10_20": {"type": "integer", "minimum": 0, "maximum": 2},
-                                "debt_lt_100": {"type": "integer", "minimum": 0, "maximum": 2},
-                                "clear_reason": {"type": "integer", "minimum": 0, "maximum": 2}
-                            },
-                            "required": ["known_company", "business_explainable", "growth_3y", "per_10_20", "debt_lt_100", "clear_reason"]
-                        },
-                        "must_use_news_refs": {
-                            "type": "array",
-                            "items": {"type": "integer"}
-                        }
-                    },
-                    "required": ["name", "code", "confidence", "thesis", "catalyst", "risks", "watch_trigger", "checklist"]
-                }
-            },
-            "meta": {
-                "type": "object",
-                "properties": {
-                    "policy": {"type": "string"},
-                    "notes": {"type": "string"}
-                },
-                "required": ["policy", "notes"]
-            }
-        },
-        "required": ["selected", "meta"]
-    }
+    return _STOCK_SELECTION_SCHEMA
+
+
+# LLM 시스템 프롬프트 (날짜/후보와 무관한 고정 문구)
+_SYSTEM_PROMPT = """너는 금융 리서치 센터의 수석 애널리스트이자 전문 요약가입니다.
+너의 임무는 방대한 뉴스 데이터에서 오늘 가장 주목해야 할 '관찰 종목'을 선정하고, 그 논리적 근거(Investment Thesis)를 제시하는 것입니다.
+
+핵심 정책:
+1. 관찰 리스트 톤(Watchlist Only): 절대 매수/매도 추천을 하지 않습니다. "이런 이유로 오늘 추적 관찰이 필요하다"는 관점만 유지합니다.
+2. 논리적 인과관계: 단순히 "뉴스가 있다"가 아니라, "A 뉴스 때문에 B라는 기대감이 형성되어 C 종목의 움직임이 예상된다"는 식의 논리를 갖춘 Thesis를 작성합니다.
+3. 데이터 기반: 제공된 재무 데이터(PER, 부채비율 등)가 있다면 반드시 이를 체크리스트 점수에 반영하고, 논거에 활용합니다.
+4. 후보 준수: 반드시 제공된 candidates 리스트 안에서만 종목을 선택합니다.
+
+금지 표현:
+- "매수", "목표가", "비중", "수익 보장", "손절가", "확정적", "강력 추천"
+- 후보 목록에 없는 종목 언급
+
+필수 표현:
+- "추적 관찰", "모멘텀 확인", "변동성 주의", "시나리오 점검", "수급 확인" """
 
 
 def create_llm_prompt(
@@ -510,6 +718,9 @@ def create_llm_prompt(
     """
     LLM 프롬프트 생성
     
+    프롬프트에 실제로 들어가는 값만 튜플로 모아 캐시 키로 사용하므로,
+    같은 입력으로 재시도할 때는 JSON 직렬화와 문자열 조립을 다시 하지 않는다.
+    
     Args:
         date_str: 날짜 문자열 (YYYY-MM-DD)
         digest: 뉴스 다이제스트
@@ -518,77 +729,113 @@ def create_llm_prompt(
     Returns:
         (system_prompt, user_prompt) 튜플
     """
-    system_prompt = """너는 금융 리서치 센터의 수석 애널리스트이자 전문 요약가입니다.
-너의 임무는 방대한 뉴스 데이터에서 오늘 가장 주목해야 할 '관찰 종목'을 선정하고, 그 논리적 근거(Investment Thesis)를 제시하는 것입니다.
+    sectors = tuple(
+        (sector, tuple(bullets[:3]))
+        for sector, bullets in islice(digest.sector_bullets.items(), 5)
+    )
+    candidate_rows = []
+    for c in candidates:
+        # 재무 데이터는 성공한 경우에만 프롬프트에 포함
+        fm = c.get("financial_metrics")
+        finance = None
+        if fm and fm.get("success"):
+            finance = (fm.get("per"), fm.get("debt_ratio"), fm.get("revenue_growth_3y"))
+        candidate_rows.append((c["name"], c["code"], c["sector"], tuple(c["matched_headlines"][:2]), finance))
+    
+    return _build_llm_prompt(
+        date_str,
+        tuple(digest.top_headlines[:8]),
+        sectors,
+        digest.korea_impact,
+        (digest.fetched_count, digest.time_filtered_count, digest.deduped_count),
+        tuple(candidate_rows)
+    )
 
-핵심 정책:
-1. 관찰 리스트 톤(Watchlist Only): 절대 매수/매도 추천을 하지 않습니다. "이런 이유로 오늘 추적 관찰이 필요하다"는 관점만 유지합니다.
-2. 논리적 인과관계: 단순히 "뉴스가 있다"가 아니라, "A 뉴스 때문에 B라는 기대감이 형성되어 C 종목의 움직임이 예상된다"는 식의 논리를 갖춘 Thesis를 작성합니다.
-3. 데이터 기반: 제공된 재무 데이터(PER, 부채비율 등)가 있다면 반드시 이를 체크리스트 점수에 반영하고, 논거에 활용합니다.
-4. 후보 준수: 반드시 제공된 candidates 리스트 안에서만 종목을 선택합니다.
 
-금지 표현:
-- "매수", "목표가", "비중", "수익 보장", "손절가", "확정적", "강력 추천"
-- 후보 목록에 없는 종목 언급
+# 후보 종목 JSON용 콤팩트 인코더 (json.dumps가 호출마다 인코더를 새로 만들지 않도록 재사용, C 가속 인코더 사용)
+_COMPACT_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
 
-필수 표현:
-- "추적 관찰", "모멘텀 확인", "변동성 주의", "시나리오 점검", "수급 확인" """
-    
-    # 뉴스 요약 구성
-    news_summary = f"""## 오늘 날짜: {date_str}
 
-## 핵심 헤드라인 (최대 8개):
-"""
-    for i, headline in enumerate(digest.top_headlines[:8], 1):
-        news_summary += f"{i}. {headline}\n"
+@lru_cache(maxsize=16)
+def _build_llm_prompt(
+    date_str: str,
+    headlines: Tuple[str, ...],
+    sectors: Tuple[Tuple[str, Tuple[str, ...]], ...],
+    korea_impact: str,
+    counts: Tuple[int, int, int],
+    candidate_rows: Tuple[Tuple, ...]
+) -> Tuple[str, str]:
+    """
+    create_llm_prompt의 실제 프롬프트 조립 (입력이 모두 튜플이라 캐싱 가능)
+    
+    Args:
+        date_str: 날짜 문자열 (YYYY-MM-DD)
+        headlines: 핵심 헤드라인 (최대 8개)
+        sectors: (섹터, bullets 최대 3개) 튜플 (최대 5개 섹터)
+        korea_impact: 한국장 영향
+        counts: (수집, 시간필터, 중복제거) 건수
+        candidate_rows: (종목명, 종목코드, 섹터, 헤드라인 최대 2개, (PER, 부채비율, 매출성장률) 또는 None) 튜플
+    
+    Returns:
+        (system_prompt, user_prompt) 튜플
+    """
+    system_prompt = _SYSTEM_PROMPT
+    fetched_count, time_filtered_count, deduped_count = counts
+    
+    # 뉴스 요약 구성 (조각을 모아 마지막에 한 번만 join)
+    summary_parts = [f"## 오늘 날짜: {date_str}\n\n## 핵심 헤드라인 (최대 8개):\n"]
+    for i, headline in enumerate(headlines, 1):
+        summary_parts.append(f"{i}. {headline}\n")
     
-    news_summary += "\n## 섹터별 요약:\n"
-    for sector, bullets in list(digest.sector_bullets.items())[:5]:
-        news_summary += f"\n### {sector}:\n"
-        for bullet in bullets[:3]:
-            news_summary += f"- {bullet}\n"
+    summary_parts.append("\n## 섹터별 요약:\n")
+    for sector, bullets in sectors:
+        summary_parts.append(f"\n### {sector}:\n")
+        for bullet in bullets:
+            summary_parts.append(f"- {bullet}\n")
     
-    news_summary += f"\n## 한국장 영향: {digest.korea_impact}\n"
-    news_summary += f"\n## 수집 정보: 수집={digest.fetched_count}건, 시간필터={digest.time_filtered_count}건, 중복제거={digest.deduped_count}건\n"
+    summary_parts.append(f"\n## 한국장 영향: {korea_impact}\n")
+    summary_parts.append(f"\n## 수집 정보: 수집={fetched_count}건, 시간필터={time_filtered_count}건, 중복제거={deduped_count}건\n")
+    news_summary = "".join(summary_parts)
     
     # 후보 종목 JSON 최적화 (토근 절감)
     optimized_candidates = []
-    for c in candidates:
+    for name, code, sector, matched_headlines, finance in candidate_rows:
         cand = {
-            "name": c["name"],
-            "code": c["code"],
-            "sector": c["sector"],
-            "headlines": c["matched_headlines"][:2]  # 헤드라인 2개로 제한
+            "name": name,
+            "code": code,
+            "sector": sector,
+            "headlines": list(matched_headlines)  # 헤드라인 2개로 제한
         }
         # 재무 데이터가 성공한 경우에만 포함하여 토큰 절약
-        fm = c.get("financial_metrics")
-        if fm and fm.get("success"):
+        if finance:
+            per, debt_ratio, revenue_growth_3y = finance
             cand["finance"] = {
-                "per": round(fm["per"], 1) if fm.get("per") else None,
-                "debt": round(fm["debt_ratio"], 1) if fm.get("debt_ratio") else None,
-                "growth": round(fm["revenue_growth_3y"], 1) if fm.get("revenue_growth_3y") else None
+                "per": round(per, 1) if per else None,
+                "debt": round(debt_ratio, 1) if debt_ratio else None,
+                "growth": round(revenue_growth_3y, 1) if revenue_growth_3y else None
             }
         optimized_candidates.append(cand)
     
     # 콤팩트한 JSON (공백 제거)
-    candidates_json = json.dumps(optimized_candidates, ensure_ascii=False, separators=(',', ':'))
+    candidates_json = _COMPACT_JSON_ENCODER.encode(optimized_candidates)
     
     # 재무 데이터가 있는 종목은 프롬프트에 명시
+    financial_lines = []
+    for name, code, _, _, finance in candidate_rows:
+        if finance:
+            per, debt_ratio, revenue_growth_3y = finance
+            line = f"\n- {name} ({code}): "
+            if per:
+                line += f"PER={per:.1f}, "
+            if debt_ratio:
+                line += f"부채비율={debt_ratio:.1f}%, "
+            if revenue_growth_3y:
+                line += f"매출성장률={revenue_growth_3y:.1f}%, "
+            financial_lines.append(line.rstrip(", "))
+    
     financial_info = ""
-    for candidate in candidates:
-        if candidate.get("financial_metrics") and candidate["financial_metrics"].get("success"):
-            fm = candidate["financial_metrics"]
-            financial_info += f"\n- {candidate['name']} ({candidate['code']}): "
-            if fm.get("per"):
-                financial_info += f"PER={fm['per']:.1f}, "
-            if fm.get("debt_ratio"):
-                financial_info += f"부채비율={fm['debt_ratio']:.1f}%, "
-            if fm.get("revenue_growth_3y"):
-                financial_info += f"매출성장률={fm['revenue_growth_3y']:.1f}%, "
-            financial_info = financial_info.rstrip(", ")
-    
-    if financial_info:
-        financial_info = "\n## 재무 데이터 (일부 종목):" + financial_info
+    if financial_lines:
+        financial_info = "\n## 재무 데이터 (일부 종목):" + "".join(financial_lines)
     
     user_prompt = f"""{news_summary}{financial_info}
 
@@ -640,6 +887,10 @@ def create_llm_prompt(
     return (system_prompt, user_prompt)
 
 
+# LLM 확신도 -> 한글 확신도
+_LLM_CONFIDENCE_KR = {"low": "하", "mid": "중", "high": "상"}
+
+
 def parse_llm_response(
     llm_output: Dict[str, Any],
     candidates: List[Dict[str, Any]]
@@ -670,8 +921,8 @@ def parse_llm_response(
         watch_stocks = []
         
         for item in selected:
-            # 필수 필드 확인
-            if "name" not in item or "code" not in item:
+            # 필수 필드 확인 (형식이 잘못된 항목은 예외 대신 명시적으로 검증 실패 처리)
+            if not isinstance(item, dict) or "name" not in item or "code" not in item:
                 logger.warning("LLM 출력에 name 또는 code가 없습니다")
                 return None
             
@@ -697,7 +948,6 @@ def parse_llm_response(
             candidate = candidate_map.get((name, code))
             financial_metrics = None
             if candidate and candidate.get("financial_metrics") and candidate["financial_metrics"].get("success"):
-                from src.market.financial import FinancialMetrics
                 fm_dict = candidate["financial_metrics"]
                 financial_metrics = FinancialMetrics(
                     symbol=code,
@@ -711,7 +961,7 @@ def parse_llm_response(
             
             # LLM이 준 점수를 기본으로 사용하되, 재무 데이터가 있으면 보정
             has_catalyst = len(item.get("catalyst", [])) > 0
-            in_watchlist = name in WATCHLIST_KR
+            in_watchlist = name in _WATCHLIST_SET
             
             if financial_metrics:
                 # 재무 데이터 기반 점수 계산
@@ -720,29 +970,17 @@ def parse_llm_response(
                 )
                 # LLM 점수와 계산된 점수 중 높은 값 사용 (LLM이 재무 데이터를 고려했을 수도 있음)
                 checklist_scores = {
-                    "내가 아는 회사": max(checklist_raw.get("known_company", 1), calculated_scores.get("known_company", 1)),
-                    "비즈니스 설명 가능": max(checklist_raw.get("business_explainable", 1), calculated_scores.get("business_explainable", 1)),
-                    "3년간 실적 성장": max(checklist_raw.get("growth_3y", 1), calculated_scores.get("growth_3y", 1)),
-                    "PER 10~20": max(checklist_raw.get("per_10_20", 1), calculated_scores.get("per_10_20", 1)),
-                    "부채비율 100% 이하": max(checklist_raw.get("debt_lt_100", 1), calculated_scores.get("debt_lt_100", 1)),
-                    "살 이유 명확": max(checklist_raw.get("clear_reason", 1), calculated_scores.get("clear_reason", 1))
+                    label: max(checklist_raw.get(key, 1), calculated_scores.get(key, 1))
+                    for key, label in _CHECKLIST_ITEMS
                 }
             else:
                 # 재무 데이터 없으면 LLM 점수 그대로 사용
-                checklist_scores = {
-                    "내가 아는 회사": checklist_raw.get("known_company", 1),
-                    "비즈니스 설명 가능": checklist_raw.get("business_explainable", 1),
-                    "3년간 실적 성장": checklist_raw.get("growth_3y", 1),
-                    "PER 10~20": checklist_raw.get("per_10_20", 1),
-                    "부채비율 100% 이하": checklist_raw.get("debt_lt_100", 1),
-                    "살 이유 명확": checklist_raw.get("clear_reason", 1)
-                }
+                checklist_scores = {label: checklist_raw.get(key, 1) for key, label in _CHECKLIST_ITEMS}
             
             total_score = sum(checklist_scores.values())
             
             # 확신도 변환 (low/mid/high -> 하/중/상)
-            confidence_map = {"low": "하", "mid": "중", "high": "상"}
-            confidence_kr = confidence_map.get(confidence, "중")
+            confidence_kr = _LLM_CONFIDENCE_KR.get(confidence, "중")
             confidence_reason = f"LLM 평가: {confidence}"
             
             watch_stock = WatchStock(
@@ -763,10 +1001,136 @@ def parse_llm_response(
         return watch_stocks
         
     except Exception as e:
-        logger.error(f"LLM 출력 파싱 실패: {e}", exc_info=True)
+        # 예상치 못한 출력 형식: traceback은 DEBUG 레벨에서만 남김 (fallback 경로에서 traceback 포맷 비용 제거)
+        logger.warning(f"LLM 출력 파싱 실패: {e}")
+        logger.debug("LLM 출력 파싱 실패 상세", exc_info=True)
         return None
 
 
+def _compile_name_matcher(lowers: List[str]) -> Tuple["re.Pattern[str]", Dict[str, List[str]]]:
+    """
+    소문자 이름 목록을 하나의 정규식으로 컴파일
+    
+    kr_symbols와 같은 트라이 정규식을 사용하므로 겹치는 이름도 놓치지 않는다.
+    
+    Args:
+        lowers: 소문자 이름 리스트 (빈 문자열 제외)
+    
+    Returns:
+        (정규식, {매칭된 이름: 같은 위치에서 함께 매칭되는 이름(접두사 포함)}) 튜플
+    """
+    pattern = compile_name_pattern(lowers)
+    prefixes = {lower: [other for other in lowers if lower.startswith(other)] for lower in lowers}
+    return pattern, prefixes
+
+
+def _index_texts_by_key(
+    texts: List[Tuple[str, str]],
+    names_by_key: Dict[str, List[Tuple[str, str]]]
+) -> Dict[str, List[str]]:
+    """
+    텍스트를 한 번씩만 훑어 키(종목명 등)별로 관련 이름이 포함된 텍스트 목록 생성
+    
+    비교는 비교용 형태끼리 한다. 대소문자 무시가 필요하면 호출자가 텍스트와 이름 모두
+    소문자로 넘기고, 원문 그대로 넘기면 대소문자를 구분해 매칭한다.
+    
+    Args:
+        texts: (텍스트, 비교용 텍스트) 리스트
+        names_by_key: {키: [(이름, 비교용 이름)]}
+    
+    Returns:
+        {키: 관련 이름이 하나라도 포함된 텍스트 리스트 (텍스트 순서, 텍스트당 1회)}
+    """
+    matches: Dict[str, List[str]] = {key: [] for key in names_by_key}
+    
+    # 비교용 이름 -> 키 리스트
+    owners: Dict[str, List[str]] = defaultdict(list)
+    for key, names in names_by_key.items():
+        for _, name_lower in names:
+            if key not in owners[name_lower]:
+                owners[name_lower].append(key)
+    
+    lowers = [name_lower for name_lower in owners if name_lower]
+    if not lowers:
+        return matches
+    
+    pattern, prefixes = _compile_name_matcher(lowers)
+    for text, text_lower in texts:
+        matched_keys = set()
+        for match in pattern.findall(text_lower):
+            for name_lower in prefixes[match]:
+                matched_keys.update(owners[name_lower])
+        for key in matched_keys:
+            matches[key].append(text)
+    
+    return matches
+
+
+def _collect_news_catalysts(
+    news_titles: List[Tuple[str, str]],
+    related_names_by_stock: Dict[str, List[Tuple[str, str]]],
+    limit: int = 2
+) -> Dict[str, List[str]]:
+    """
+    뉴스 제목을 한 번만 훑어 종목별 catalyst 제목 수집
+    
+    종목마다 news_items 전체를 다시 훑는 대신, 모든 관련 종목명을 하나의 정규식으로 묶어
+    제목당 1회 스캔한다. 제목 하나에 관련 종목명이 여러 개 포함되면 그 수만큼 추가한다
+    (종목명별로 검사하던 기존 동작과 동일). 종목명은 한글/영문이므로 원문 포함 검사는
+    소문자 포함 검사에 포함된다.
+    
+    Args:
+        news_titles: (제목, 소문자 제목) 리스트
+        related_names_by_stock: {종목명: [(관련 종목명, 소문자 관련 종목명)]}
+        limit: 종목당 최대 catalyst 수
+    
+    Returns:
+        {종목명: catalyst 제목 리스트}
+    """
+    catalysts: Dict[str, List[str]] = {stock_name: [] for stock_name in related_names_by_stock}
+    
+    # 소문자 관련 종목명 -> 종목명 리스트 (관련 종목명 하나당 1개)
+    owners: Dict[str, List[str]] = defaultdict(list)
+    for stock_name, related_names in related_names_by_stock.items():
+        for _, related_lower in related_names:
+            owners[related_lower].append(stock_name)
+    
+    lowers = [related_lower for related_lower in owners if related_lower]
+    if not lowers:
+        return catalysts
+    
+    # 겹치는 종목명도 놓치지 않도록 lookahead + 접두사 매핑
+    pattern, prefixes = _compile_name_matcher(lowers)
+    
+    remaining = len(catalysts)
+    for title, title_lower in news_titles:
+        matched = set()
+        for match in pattern.findall(title_lower):
+            matched.update(prefixes[match])
+        
+        for related_lower in matched:
+            for stock_name in owners[related_lower]:
+                stock_catalysts = catalysts[stock_name]
+                if len(stock_catalysts) < limit:
+                    stock_catalysts.append(title)
+                    if len(stock_catalysts) >= limit:
+                        remaining -= 1
+        
+        if remaining == 0:
+            break
+    
+    return catalysts
+
+
+# 룰 기반 thesis 문구 (첫 번째 catalyst의 키워드 그룹별, 앞쪽 그룹 우선)
+_THESIS_TOPICS = (
+    (re.compile("실적|수익|성장"), "실적/성장 관련 뉴스로 관찰 필요"),
+    (re.compile("AI|반도체"), "AI/반도체 동향 관련 관찰 필요"),
+    (re.compile("전기차|배터리"), "전기차/배터리 동향 관련 관찰 필요"),
+    (re.compile("금리|환율"), "거시 환경 변화 관련 관찰 필요"),
+)
+
+
 @track_performance("pick_watch_stocks")
 def pick_watch_stocks(
     digest: NewsDigest,
@@ -803,158 +1167,161 @@ def pick_watch_stocks(
         try:
             system_prompt, user_prompt = create_llm_prompt(date_str, digest, candidates)
             json_schema = get_stock_selection_json_schema()
-            llm_output = generate_json(system_prompt, user_prompt, json_schema=json_schema)
-            
-            if llm_output:
-                logger.info(f"LLM 사용: model={LLM_MODEL}")
-                print(f"[LLM] 사용: model={LLM_MODEL}")
-                watch_stocks = parse_llm_response(llm_output, candidates)
-                
-                if watch_stocks:
-                    logger.info(f"LLM으로 {len(watch_stocks)}개 종목 선정 완료")
-                    return watch_stocks[:max_count]
-                else:
-                    logger.warning("LLM 출력 검증 실패, 룰 기반으로 fallback")
-            else:
-                logger.warning("LLM 호출 실패, 룰 기반으로 fallback")
+            # 후보 밖 종목이 나오면 parse_llm_response에서 어차피 거부되므로 스트리밍 중 바로 중단하고 fallback
+            candidate_keys = {(c["name"], c["code"]) for c in candidates}
+            llm_output = generate_json_stream(
+                system_prompt,
+                user_prompt,
+                json_schema=json_schema,
+                item_validator=lambda item: isinstance(item, dict) and (item.get("name"), item.get("code")) in candidate_keys
+            )
+            watch_stocks = _watch_stocks_from_llm_output(llm_output, candidates, max_count)
+            if watch_stocks:
+                return watch_stocks
         except Exception as e:
             logger.warning(f"LLM 처리 중 오류 발생, 룰 기반으로 fallback: {e}")
     
     # 4. 룰 기반 fallback (섹터별 다양성 고려)
-    logger.info("룰 기반 종목 선정 사용")
-    # candidates는 이미 재무 데이터가 포함되어 있음
-    candidate_scores = {c["name"]: c["score"] for c in candidates}
+    return _pick_watch_stocks_by_rules(digest, news_items, candidates, max_count)
+
+
+def _watch_stocks_from_llm_output(
+    llm_output: Optional[Dict[str, Any]],
+    candidates: List[Dict[str, Any]],
+    max_count: int
+) -> Optional[List[WatchStock]]:
+    """
+    LLM 출력을 관찰 종목 리스트로 변환 (단건/배치 호출 공용)
     
-    # 점수 상위 종목 선택 (섹터별 다양성 고려)
-    sorted_candidates = sorted(candidate_scores.items(), key=lambda x: x[1], reverse=True)
+    Args:
+        llm_output: LLM 출력 JSON (호출 실패 시 None)
+        candidates: 후보 종목 리스트
+        max_count: 최대 선정 개수
     
-    # 종목코드 기준으로 중복 제거 + 섹터별 다양성 확보
-    seen_codes = set()
+    Returns:
+        관찰 종목 리스트 (출력이 없거나 검증 실패 시 None → 룰 기반 fallback)
+    """
+    if not llm_output:
+        logger.warning("LLM 호출 실패, 룰 기반으로 fallback")
+        return None
+    
+    logger.info(f"LLM 사용: model={LLM_MODEL}")
+    print(f"[LLM] 사용: model={LLM_MODEL}")
+    watch_stocks = parse_llm_response(llm_output, candidates)
+    
+    if not watch_stocks:
+        logger.warning("LLM 출력 검증 실패, 룰 기반으로 fallback")
+        return None
+    
+    logger.info(f"LLM으로 {len(watch_stocks)}개 종목 선정 완료")
+    return watch_stocks[:max_count]
+
+
+def _pick_watch_stocks_by_rules(
+    digest: NewsDigest,
+    news_items: List[NewsItem],
+    candidates: List[Dict[str, Any]],
+    max_count: int
+) -> List[WatchStock]:
+    """
+    룰 기반 관찰 종목 선정 (섹터별 다양성 고려, LLM 미사용/실패 시)
+    
+    Args:
+        digest: 뉴스 다이제스트
+        news_items: 뉴스 아이템 리스트
+        candidates: 후보 종목 리스트 (create_stock_candidates 결과: 점수순, 종목코드 중복 없음)
+        max_count: 최대 선정 개수
+    
+    Returns:
+        관찰 종목 리스트
+    """
+    logger.info("룰 기반 종목 선정 사용")
+    # candidates(create_stock_candidates 결과)는 이미 점수 내림차순 정렬, 종목코드 조회 및 중복 제거가 끝난 상태이므로
+    # 다시 정렬/중복 제거하지 않고 그대로 사용 (재무 데이터도 포함되어 있음)
     seen_sectors = set()  # 섹터별 다양성 확보
     selected = []
+    deferred = []  # 섹터 중복으로 1차에서 미룬 후보 (점수순)
     
     # 1차: 섹터별로 최소 1개씩 선택 (점수 상위)
-    for stock_name, score in sorted_candidates:
-        code = get_symbol_code(stock_name)
-        if not code or code in seen_codes:
-            continue
-        
-        # 섹터 확인
-        sector = None
-        for candidate in candidates:
-            if candidate["name"] == stock_name:
-                sector = candidate.get("sector")
-                break
-        
-        # 섹터가 없거나 이미 선택된 섹터면 스킵 (다양성 확보)
+    for candidate in candidates:
+        # 섹터가 없거나 이미 선택된 섹터면 미룸 (다양성 확보)
+        sector = candidate.get("sector")
         if sector and sector in seen_sectors:
+            deferred.append(candidate)
             continue
         
-        selected.append((stock_name, score))
-        seen_codes.add(code)
+        selected.append((candidate["name"], candidate["score"], candidate["code"]))
         if sector:
             seen_sectors.add(sector)
         
         if len(selected) >= max_count:
             break
     
-    # 2차: 섹터 다양성 확보 후 남은 자리가 있으면 점수 상위로 채움
-    if len(selected) < max_count:
-        for stock_name, score in sorted_candidates:
-            code = get_symbol_code(stock_name)
-            if code and code not in seen_codes:
-                selected.append((stock_name, score))
-                seen_codes.add(code)
-                if len(selected) >= max_count:
-                    break
+    # 2차: 섹터 다양성 확보 후 남은 자리가 있으면 미룬 후보를 점수 상위로 채움
+    # (남은 자리가 있다면 1차가 후보 전체를 훑었으므로 미선정 후보 = 미룬 후보)
+    for candidate in deferred[:max_count - len(selected)]:
+        selected.append((candidate["name"], candidate["score"], candidate["code"]))
     
     watch_stocks = []
     
-    for stock_name, score in selected:
-        code = get_symbol_code(stock_name)
-        if not code:
-            logger.warning(f"종목코드를 찾을 수 없음: {stock_name}")
-            continue
-        
+    # catalyst 검색용 소문자 텍스트 (종목마다 다시 변환하지 않도록 1회 계산, 헤드라인/bullet은 후보 추출 때 변환한 값 재사용)
+    news_titles = [(item.title, _fold(item.title)) for item in news_items]
+    headlines = [(headline, _fold(headline)) for headline in digest.top_headlines]
+    sector_bullets = [
+        (bullet, _fold(bullet))
+        for bullets in digest.sector_bullets.values()
+        for bullet in bullets
+    ]
+    
+    # 종목명 + 해외 대체 종목 (엔비디아 → 삼성전자/SK하이닉스 등)
+    related_names_by_stock = {
+        stock_name: [
+            (related_name, related_name.casefold())
+            for related_name in [stock_name] + get_foreign_substitute_symbols(stock_name)
+        ]
+        for stock_name, _, _ in selected
+    }
+    
+    # 1. news_items에서 직접 매칭 (종목명 + 해외 대체 종목) - 모든 종목을 한 번에
+    news_catalysts = _collect_news_catalysts(news_titles, related_names_by_stock)
+    
+    # 2~3. 헤드라인/섹터 bullets도 텍스트당 한 번만 훑어 종목별 색인
+    headline_matches = _index_texts_by_key(headlines, related_names_by_stock)
+    bullet_matches = _index_texts_by_key(sector_bullets, related_names_by_stock)
+    
+    # 4. 역방향 해외 종목(엔비디아 뉴스 → 삼성전자)도 해외 종목명별로 색인
+    reverse_foreign_names = {
+        foreign_name: [(foreign_name, foreign_name.casefold())]
+        for stock_name, _, _ in selected
+        for foreign_name in _FOREIGN_NAMES_BY_KR.get(stock_name, ())
+    }
+    foreign_title_matches = _index_texts_by_key(news_titles, reverse_foreign_names)
+    foreign_headline_matches = _index_texts_by_key(headlines, reverse_foreign_names)
+    
+    for stock_name, score, code in selected:
         # 관련 뉴스 찾기 (더 넓은 범위에서 검색)
-        catalysts = []
-        
-        # 해외 종목 매핑 확인 (엔비디아 → 삼성전자/SK하이닉스 등)
-        foreign_substitutes = get_foreign_substitute_symbols(stock_name)
-        related_stock_names = [stock_name] + foreign_substitutes
-        
-        # 1. news_items에서 직접 매칭 (종목명 + 해외 대체 종목)
-        for item in news_items:
-            title_lower = item.title.lower()
-            for related_name in related_stock_names:
-                related_lower = related_name.lower()
-                if related_lower in title_lower or related_name in item.title:
-                    catalysts.append(item.title)
-                    if len(catalysts) >= 2:
-                        break
-            if len(catalysts) >= 2:
-                break
-        
-        # 2. digest의 헤드라인에서도 찾기 (종목명 + 해외 대체 종목)
-        if len(catalysts) < 2:
-            for headline in digest.top_headlines:
-                headline_lower = headline.lower()
-                for related_name in related_stock_names:
-                    related_lower = related_name.lower()
-                    if related_lower in headline_lower or related_name in headline:
-                        if headline not in catalysts:
-                            catalysts.append(headline)
-                            if len(catalysts) >= 2:
-                                break
-                if len(catalysts) >= 2:
-                    break
+        catalysts = list(news_catalysts[stock_name])
         
-        # 3. 섹터 bullets에서도 찾기 (종목명 + 해외 대체 종목)
+        # 2. digest의 헤드라인 → 3. 섹터 bullets 순서로 보충 (종목명 + 해외 대체 종목)
         if len(catalysts) < 2:
-            for sector, bullets in digest.sector_bullets.items():
-                for bullet in bullets:
-                    bullet_lower = bullet.lower()
-                    for related_name in related_stock_names:
-                        related_lower = related_name.lower()
-                        if related_lower in bullet_lower or related_name in bullet:
-                            if bullet not in catalysts:
-                                catalysts.append(bullet)
-                                if len(catalysts) >= 2:
-                                    break
+            for text in chain(headline_matches[stock_name], bullet_matches[stock_name]):
+                if text not in catalysts:
+                    catalysts.append(text)
                     if len(catalysts) >= 2:
                         break
-                if len(catalysts) >= 2:
-                    break
         
         # 4. 해외 종목 관련 뉴스도 찾기 (역방향: 엔비디아 뉴스 → 삼성전자 Catalyst)
         if len(catalysts) < 2:
-            # FOREIGN_TO_KR_MAPPING에서 이 종목이 대체 종목인 해외 종목 찾기
-            from src.data.kr_symbols import FOREIGN_TO_KR_MAPPING
-            for foreign_name, kr_stocks in FOREIGN_TO_KR_MAPPING.items():
-                if stock_name in kr_stocks:
-                    # 이 해외 종목이 언급된 뉴스 찾기
-                    for item in news_items:
-                        title_lower = item.title.lower()
-                        foreign_lower = foreign_name.lower()
-                        if foreign_lower in title_lower or foreign_name in item.title:
-                            if item.title not in catalysts:
-                                catalysts.append(item.title)
-                                if len(catalysts) >= 2:
-                                    break
-                    if len(catalysts) >= 2:
-                        break
-                    
-                    # 헤드라인에서도 찾기
-                    for headline in digest.top_headlines:
-                        headline_lower = headline.lower()
-                        foreign_lower = foreign_name.lower()
-                        if foreign_lower in headline_lower or foreign_name in headline:
-                            if headline not in catalysts:
-                                catalysts.append(headline)
-                                if len(catalysts) >= 2:
-                                    break
-                    if len(catalysts) >= 2:
-                        break
+            # FOREIGN_TO_KR_MAPPING에서 이 종목이 대체 종목인 해외 종목 (미리 계산한 역방향 매핑)
+            for foreign_name in _FOREIGN_NAMES_BY_KR.get(stock_name, ()):
+                # 이 해외 종목이 언급된 뉴스 → 헤드라인 순서
+                for text in chain(foreign_title_matches[foreign_name], foreign_headline_matches[foreign_name]):
+                    if text not in catalysts:
+                        catalysts.append(text)
+                        if len(catalysts) >= 2:
+                            break
+                if len(catalysts) >= 2:
+                    break
         
         # catalyst가 없으면 섹터 기반으로 생성
         if not catalysts:
@@ -974,15 +1341,11 @@ def pick_watch_stocks(
         if catalysts and len(catalysts) > 0:
             # 첫 번째 catalyst에서 핵심 키워드 추출
             first_catalyst = catalysts[0]
-            # 간단한 요약 생성
-            if "실적" in first_catalyst or "수익" in first_catalyst or "성장" in first_catalyst:
-                thesis = f"{stock_name}, 실적/성장 관련 뉴스로 관찰 필요"
-            elif "AI" in first_catalyst or "반도체" in first_catalyst:
-                thesis = f"{stock_name}, AI/반도체 동향 관련 관찰 필요"
-            elif "전기차" in first_catalyst or "배터리" in first_catalyst:
-                thesis = f"{stock_name}, 전기차/배터리 동향 관련 관찰 필요"
-            elif "금리" in first_catalyst or "환율" in first_catalyst:
-                thesis = f"{stock_name}, 거시 환경 변화 관련 관찰 필요"
+            # 간단한 요약 생성 (키워드 그룹 우선순위 순서로 검사)
+            for pattern, topic in _THESIS_TOPICS:
+                if pattern.search(first_catalyst):
+                    thesis = f"{stock_name}, {topic}"
+                    break
             else:
                 # catalyst의 핵심 내용을 간단히 요약
                 thesis = f"{stock_name}, {first_catalyst[:30]}... 관련 관찰 필요"
@@ -996,7 +1359,6 @@ def pick_watch_stocks(
                 fm_dict = candidate.get("financial_metrics")
                 if fm_dict and fm_dict.get("success"):
                     # financial_metrics 딕셔너리를 FinancialMetrics 객체로 변환
-                    from src.market.financial import FinancialMetrics
                     financial_metrics = FinancialMetrics(
                         symbol=code,
                         name=stock_name,
@@ -1018,7 +1380,7 @@ def pick_watch_stocks(
         checklist_scores, total_score = calculate_checklist_score(stock_name, has_catalyst, financial_metrics)
         
         # 확신도 평가
-        in_watchlist = stock_name in WATCHLIST_KR
+        in_watchlist = stock_name in _WATCHLIST_SET
         confidence, confidence_reason = assess_confidence(total_score, has_catalyst, in_watchlist)
         
         # 리스크 생성
@@ -1044,3 +1406,125 @@ def pick_watch_stocks(
     
     return watch_stocks
 
+
+def _pick_watch_stocks_job(job: WatchStockJob, max_count: int) -> List[WatchStock]:
+    """pick_watch_stocks_batch 작업 단위 (프로세스 풀에서 실행되므로 모듈 레벨 함수)"""
+    return pick_watch_stocks(job.digest, job.news_items, max_count, job.date_str, job.overnight_signals)
+
+
+def pick_watch_stocks_batch(
+    jobs: List[WatchStockJob],
+    max_count: int = 3,
+    max_workers: Optional[int] = None,
+    use_batch_api: bool = False,
+    batch_poll_interval: float = 30.0,
+    batch_timeout: float = 24 * 3600
+) -> List[List[WatchStock]]:
+    """
+    여러 날짜의 다이제스트에 대해 관찰 종목 선정 (백테스트 등 일괄 처리용)
+    
+    다이제스트별 처리는 서로 독립적이므로 프로세스 풀로 병렬 실행한다.
+    종목명 매처 등은 모듈 로드 시 구성되므로 워커에서도 별도 초기화가 필요 없다.
+    워커마다 재무 데이터를 스레드로 동시 요청하므로, 전체 동시 요청 수가 크게 늘지 않도록
+    _FINANCIAL_FETCH_MAX_WORKERS를 워커 수로 나눠 배정한다 (워커당 최소 1개).
+    
+    Args:
+        jobs: 작업 리스트
+        max_count: 다이제스트별 최대 선정 개수 (기본 3개)
+        max_workers: 최대 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 실행,
+            LLM Batch API 사용 시에는 무시)
+        use_batch_api: LLM 사용 시 OpenAI Batch API로 일괄 처리 (비용 절반, 완료까지 최대 24시간 대기)
+        batch_poll_interval: Batch 상태 확인 간격 (초)
+        batch_timeout: Batch 최대 대기 시간 (초, 초과 시 룰 기반 fallback)
+    
+    Returns:
+        jobs 순서대로 관찰 종목 리스트
+    """
+    if not jobs:
+        return []
+    
+    # 호출자가 지연을 감수하는 경우에만 여러 다이제스트를 Batch API 한 번으로 처리
+    # (단건이거나 사용하지 않으면 pick_watch_stocks의 동기 호출 사용)
+    if use_batch_api and LLM_ENABLED and len(jobs) > 1 and any(job.date_str for job in jobs):
+        return _pick_watch_stocks_batch_llm(jobs, max_count, batch_poll_interval, batch_timeout)
+    
+    worker = partial(_pick_watch_stocks_job, max_count=max_count)
+    
+    # 작업이 하나뿐이거나 병렬 실행을 끈 경우 프로세스 생성 비용 없이 순차 실행
+    if len(jobs) == 1 or max_workers == 1:
+        return [worker(job) for job in jobs]
+    
+    # fork 대신 spawn: 부모가 이미 yfinance 등으로 연 네트워크 핸들/스레드를 물려받은 워커는 비정상 종료될 수 있음
+    process_count = min(max_workers or os.cpu_count() or 1, len(jobs))
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=process_count,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_set_financial_fetch_workers,
+        initargs=(max(1, _FINANCIAL_FETCH_MAX_WORKERS // process_count),)
+    ) as executor:
+        return list(executor.map(worker, jobs))
+
+
+def _pick_watch_stocks_batch_llm(
+    jobs: List[WatchStockJob],
+    max_count: int,
+    poll_interval: float,
+    timeout: float
+) -> List[List[WatchStock]]:
+    """
+    pick_watch_stocks_batch의 LLM 경로 (프롬프트를 모아 Batch API 1회 호출)
+    
+    배치 전체 또는 개별 요청이 실패한 다이제스트는 룰 기반으로 fallback.
+    
+    Args:
+        jobs: 작업 리스트
+        max_count: 다이제스트별 최대 선정 개수
+        poll_interval: Batch 상태 확인 간격 (초)
+        timeout: Batch 최대 대기 시간 (초)
+    
+    Returns:
+        jobs 순서대로 관찰 종목 리스트
+    """
+    prepared = []  # (digest, news_items, candidates)
+    requests = []
+    request_index = {}  # job 인덱스 -> requests 인덱스
+    
+    for index, job in enumerate(jobs):
+        candidates = create_stock_candidates(
+            job.digest, job.news_items, max_candidates=15, overnight_signals=job.overnight_signals
+        )
+        prepared.append((job.digest, job.news_items, candidates))
+        
+        if candidates and job.date_str:
+            try:
+                system_prompt, user_prompt = create_llm_prompt(job.date_str, job.digest, candidates)
+            except Exception as e:
+                logger.warning(f"LLM 프롬프트 생성 실패, 룰 기반으로 fallback: {e}")
+                continue
+            request_index[index] = len(requests)
+            requests.append((system_prompt, user_prompt, get_stock_selection_json_schema()))
+    
+    llm_outputs = [None] * len(requests)
+    if requests:
+        try:
+            llm_outputs = generate_json_batch(requests, poll_interval=poll_interval, timeout=timeout)
+        except Exception as e:
+            logger.warning(f"LLM Batch 처리 중 오류 발생, 룰 기반으로 fallback: {e}")
+    
+    results = []
+    for index, (digest, news_items, candidates) in enumerate(prepared):
+        if not candidates:
+            logger.warning("종목 후보가 없습니다")
+            results.append([])
+            continue
+        
+        watch_stocks = None
+        if index in request_index:
+            try:
+                watch_stocks = _watch_stocks_from_llm_output(llm_outputs[request_index[index]], candidates, max_count)
+            except Exception as e:
+                logger.warning(f"LLM 처리 중 오류 발생, 룰 기반으로 fallback: {e}")
+        
+        results.append(watch_stocks or _pick_watch_stocks_by_rules(digest, news_items, candidates, max_count))
+    
+    return results
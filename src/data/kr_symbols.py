@@ -1,5 +1,8 @@
 """한국 주식 종목 마스터 (종목명 ↔ 종목코드 매핑)"""
-from typing import Dict, Optional
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 # 종목명 → 종목코드 매핑 (대표 종목 40~60개)
 KR_SYMBOLS: Dict[str, str] = {
@@ -145,9 +148,98 @@ FOREIGN_TO_KR_MAPPING: Dict[str, list] = {
 }
 
 
+# 종목명 문자열 intern (종목명 비교/해시 재사용)
+KR_SYMBOLS = {sys.intern(name): code for name, code in KR_SYMBOLS.items()}
+FOREIGN_TO_KR_MAPPING = {
+    foreign_name: [sys.intern(kr_name) for kr_name in kr_names]
+    for foreign_name, kr_names in FOREIGN_TO_KR_MAPPING.items()
+}
+
+def _trie_regex(node: Dict[str, dict]) -> str:
+    """트라이 노드 -> 정규식 (자식 우선 greedy 매칭이라 같은 위치에서는 가장 긴 이름이 매칭됨)"""
+    branches = [re.escape(char) + _trie_regex(child) for char, child in node.items() if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    # 이 노드에서 끝나는 이름이 있으면 나머지는 선택 사항
+    return "(?:" + body + ")?" if "" in node else body
+
+
+def compile_name_pattern(names: Iterable[str]) -> "re.Pattern[str]":
+    """
+    이름 목록을 트라이 구조의 정규식 하나로 컴파일 (Aho-Corasick처럼 텍스트 1회 스캔)
+    
+    위치마다 모든 이름을 차례로 비교하는 단순 alternation 대신 공통 접두사를 묶어
+    글자 단위로 분기한다. lookahead로 감싸 겹치는 이름도 놓치지 않으며,
+    findall은 위치마다 가장 긴 이름을 반환한다.
+    
+    Args:
+        names: 검색할 이름 (빈 문자열 제외, 1개 이상)
+    
+    Returns:
+        컴파일된 정규식
+    """
+    trie: Dict[str, dict] = {}
+    for name in names:
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return re.compile("(?=(" + _trie_regex(trie) + "))")
+
+
+# 부분 매칭용 (소문자 종목명, 종목코드) - KR_SYMBOLS 순서
+_SYMBOL_ITEMS_LOWER: Tuple[Tuple[str, str], ...] = tuple(
+    (name.lower(), code) for name, code in KR_SYMBOLS.items()
+)
+
+# 종목명 검색용 매처 (모듈 로드 시 1회 구성)
+# 소문자 종목명 -> 원래 종목명 (KR_SYMBOLS 순서)
+_SYMBOL_NAMES_LOWER: Dict[str, Tuple[str, ...]] = {}
+for _name in KR_SYMBOLS:
+    _SYMBOL_NAMES_LOWER[_name.lower()] = _SYMBOL_NAMES_LOWER.get(_name.lower(), ()) + (_name,)
+
+# 트라이 정규식 + lookahead로 겹치는 종목명도 놓치지 않음 (위치마다 가장 긴 종목명 매칭)
+_SYMBOL_RE = compile_name_pattern(_SYMBOL_NAMES_LOWER)
+
+# 매칭된 소문자 종목명 -> 같은 위치에서 함께 매칭되는 종목명 (접두사 종목명 포함)
+_SYMBOL_PREFIX_NAMES: Dict[str, Tuple[str, ...]] = {
+    lower: tuple(
+        name
+        for other, names in _SYMBOL_NAMES_LOWER.items()
+        if lower.startswith(other)
+        for name in names
+    )
+    for lower in _SYMBOL_NAMES_LOWER
+}
+
+# 결과를 KR_SYMBOLS 순서로 돌려주기 위한 순번
+_SYMBOL_RANK: Dict[str, int] = {name: rank for rank, name in enumerate(KR_SYMBOLS)}
+
+# 종목명 + 해외 종목명 통합 매처 (한 번의 스캔으로 둘 다 찾음)
+_MENTION_KEYS = list(dict.fromkeys([*_SYMBOL_NAMES_LOWER, *FOREIGN_TO_KR_MAPPING]))
+
+_MENTION_RE = compile_name_pattern(_MENTION_KEYS)
+
+# 매칭된 키 -> (같은 위치에서 함께 매칭되는 종목명, 해외 종목명)
+_MENTION_PREFIXES: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    key: (
+        tuple(
+            name
+            for other, names in _SYMBOL_NAMES_LOWER.items()
+            if key.startswith(other)
+            for name in names
+        ),
+        tuple(other for other in FOREIGN_TO_KR_MAPPING if key.startswith(other)),
+    )
+    for key in _MENTION_KEYS
+}
+
+
+@lru_cache(maxsize=1024)
 def get_symbol_code(name: str) -> Optional[str]:
     """
-    종목명으로 종목코드 조회
+    종목명으로 종목코드 조회 (KR_SYMBOLS는 고정이므로 결과 캐싱)
     
     Args:
         name: 종목명
@@ -161,8 +253,8 @@ def get_symbol_code(name: str) -> Optional[str]:
     
     # 부분 매칭 (종목명이 텍스트에 포함된 경우)
     name_lower = name.lower()
-    for symbol_name, code in KR_SYMBOLS.items():
-        if symbol_name.lower() in name_lower or name_lower in symbol_name.lower():
+    for symbol_lower, code in _SYMBOL_ITEMS_LOWER:
+        if symbol_lower in name_lower or name_lower in symbol_lower:
             return code
     
     return None
@@ -178,15 +270,62 @@ def find_symbols_in_text(text: str) -> Dict[str, str]:
     Returns:
         {종목명: 종목코드} 딕셔너리
     """
-    found = {}
-    text_lower = text.lower()
+    return {name: KR_SYMBOLS[name] for name in find_symbol_names(text.lower())}
+
+
+def find_symbol_names(text_lower: str) -> List[str]:
+    """
+    소문자 텍스트에 포함된 종목명 목록 (코드 매핑 없이 이름만, 텍스트 1회 스캔)
     
-    # 정확한 매칭
-    for symbol_name, code in KR_SYMBOLS.items():
-        if symbol_name.lower() in text_lower:
-            found[symbol_name] = code
+    Args:
+        text_lower: 검색할 텍스트 (소문자)
+    
+    Returns:
+        종목명 리스트 (KR_SYMBOLS 순서)
+    """
+    return list(_scan_symbol_names(text_lower))
+
+
+@lru_cache(maxsize=4096)
+def _scan_symbol_names(text_lower: str) -> Tuple[str, ...]:
+    """
+    find_symbol_names 스캔 결과 캐시 (같은 헤드라인이 여러 소스/실행에서 반복되므로 텍스트별 1회만 스캔)
+    
+    캐시된 결과를 호출자가 변경할 수 없도록 튜플로 반환
+    """
+    # 텍스트를 한 번만 훑어 포함된 종목명 수집 (종목명마다 `in` 검사한 결과와 동일)
+    matched = set()
+    for match in _SYMBOL_RE.findall(text_lower):
+        matched.update(_SYMBOL_PREFIX_NAMES[match])
+    
+    return tuple(sorted(matched, key=_SYMBOL_RANK.__getitem__))
+
+
+def find_symbol_and_foreign_names(text_lower: str) -> Tuple[List[str], Set[str]]:
+    """
+    소문자 텍스트에 포함된 종목명과 해외 종목명을 한 번의 스캔으로 찾기
+    
+    Args:
+        text_lower: 검색할 텍스트 (소문자)
+    
+    Returns:
+        (종목명 리스트 (KR_SYMBOLS 순서), 해외 종목명 집합) 튜플
+    """
+    symbol_names, foreign_names = _scan_symbol_and_foreign_names(text_lower)
+    return list(symbol_names), set(foreign_names)
+
+
+@lru_cache(maxsize=4096)
+def _scan_symbol_and_foreign_names(text_lower: str) -> Tuple[Tuple[str, ...], frozenset]:
+    """find_symbol_and_foreign_names 스캔 결과 캐시 (변경 불가능한 튜플/frozenset으로 보관)"""
+    symbol_names = set()
+    foreign_names = set()
+    for match in _MENTION_RE.findall(text_lower):
+        matched_symbols, matched_foreign = _MENTION_PREFIXES[match]
+        symbol_names.update(matched_symbols)
+        foreign_names.update(matched_foreign)
     
-    return found
+    return tuple(sorted(symbol_names, key=_SYMBOL_RANK.__getitem__)), frozenset(foreign_names)
 
 
 def get_foreign_substitute_symbols(foreign_name: str) -> list:
@@ -1,7 +1,9 @@
 """SQLite 데이터베이스 관리 모듈"""
+import json
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 from contextlib import contextmanager
 import logging
 
@@ -9,12 +11,100 @@ from src.config import DB_PATH, SCHEMA_PATH
 
 logger = logging.getLogger(__name__)
 
+# 연결 생성 시 적용하는 PRAGMA (메모리 temp/mmap/64MB 캐시)
+# db/market.db는 워크플로가 파일 그대로 커밋하므로 WAL을 쓰지 않는다 (WAL 모드에서는 체크포인트 전
+# 쓰기가 -wal 파일에만 남아 커밋에서 빠질 수 있음). 이전에 WAL로 바뀐 DB도 롤백 저널로 되돌림.
+CONNECTION_PRAGMAS = """
+PRAGMA journal_mode=DELETE;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-64000;
+"""
 
-@contextmanager
-def get_db_connection():
-    """DB 연결 컨텍스트 매니저"""
+# 스크립트 1회 실행 동안 재사용하는 연결 (get_pooled_connection으로 생성)
+_pooled_conn: Optional[sqlite3.Connection] = None
+_pooled_db_path: Optional[str] = None
+_pooled_thread_id: Optional[int] = None
+
+
+def _connect() -> sqlite3.Connection:
+    """DB 연결 생성 (row_factory=sqlite3.Row, PRAGMA 적용)"""
     conn = sqlite3.connect(str(DB_PATH))
     conn.row_factory = sqlite3.Row
+    conn.executescript(CONNECTION_PRAGMAS)
+    return conn
+
+
+def _get_active_pooled_connection() -> Optional[sqlite3.Connection]:
+    """현재 DB_PATH/스레드에서 재사용 가능한 장기 연결 반환 (없으면 None)"""
+    if (
+        _pooled_conn is not None
+        and _pooled_db_path == str(DB_PATH)
+        and _pooled_thread_id == threading.get_ident()
+    ):
+        return _pooled_conn
+    return None
+
+
+def get_pooled_connection() -> sqlite3.Connection:
+    """
+    장기 연결 반환 (없으면 생성)
+    
+    연결을 연 스레드에서는 이후 get_db_connection() 호출이 새 연결을 만들지 않고
+    이 연결을 재사용한다. 스크립트 종료 시 close_pooled_connection()으로 닫는다.
+    
+    Returns:
+        sqlite3.Connection (row_factory=sqlite3.Row, PRAGMA 적용)
+    """
+    global _pooled_conn, _pooled_db_path, _pooled_thread_id
+    
+    conn = _get_active_pooled_connection()
+    if conn is not None:
+        return conn
+    
+    # DB_PATH가 바뀌었거나 다른 스레드에서 연 연결은 정리 후 새로 생성
+    close_pooled_connection()
+    
+    conn = _connect()
+    
+    _pooled_conn = conn
+    _pooled_db_path = str(DB_PATH)
+    _pooled_thread_id = threading.get_ident()
+    return conn
+
+
+def close_pooled_connection():
+    """장기 연결 종료 (열려 있지 않으면 무시)"""
+    global _pooled_conn, _pooled_db_path, _pooled_thread_id
+    
+    if _pooled_conn is None:
+        return
+    try:
+        _pooled_conn.commit()
+        _pooled_conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"장기 DB 연결 종료 실패: {e}")
+    finally:
+        _pooled_conn = None
+        _pooled_db_path = None
+        _pooled_thread_id = None
+
+
+@contextmanager
+def get_db_connection():
+    """DB 연결 컨텍스트 매니저 (장기 연결이 열려 있으면 재사용)"""
+    pooled = _get_active_pooled_connection()
+    if pooled is not None:
+        try:
+            yield pooled
+            pooled.commit()
+        except Exception:
+            pooled.rollback()
+            raise
+        return
+    
+    conn = _connect()
     try:
         yield conn
         conn.commit()
@@ -25,6 +115,23 @@ def get_db_connection():
         conn.close()
 
 
+def get_table_columns(conn: sqlite3.Connection, table: str) -> set:
+    """
+    테이블 컬럼명 집합 조회 (행을 읽지 않고 cursor.description만 사용)
+    
+    컬럼 존재 여부는 행마다 row.keys()로 확인하지 말고, 이 집합을 한 번 구해 재사용한다.
+    
+    Args:
+        conn: DB 연결
+        table: 테이블명 (내부 고정값만 사용)
+    
+    Returns:
+        컬럼명 집합
+    """
+    cursor = conn.execute(f"SELECT * FROM {table} LIMIT 0")
+    return {column[0] for column in cursor.description}
+
+
 def init_schema():
     """스키마 초기화 (테이블 생성)"""
     if not SCHEMA_PATH.exists():
@@ -57,12 +164,7 @@ def ensure_db():
                 init_schema()
             else:
                 # 마이그레이션: paper_trades에 market_provider 컬럼 추가
-                try:
-                    cursor = conn.execute(
-                        "SELECT market_provider FROM paper_trades LIMIT 1"
-                    )
-                    cursor.fetchone()
-                except sqlite3.OperationalError:
+                if "market_provider" not in get_table_columns(conn, "paper_trades"):
                     # market_provider 컬럼이 없으면 추가
                     conn.execute(
                         "ALTER TABLE paper_trades ADD COLUMN market_provider TEXT DEFAULT 'unknown'"
@@ -134,8 +236,6 @@ def upsert_recommendation(
     Returns:
         recommendation_id
     """
-    import json
-    
     news_ids_json = json.dumps(news_ids) if news_ids else None
     
     with get_db_connection() as conn:
@@ -447,3 +547,130 @@ def get_paper_trades_by_month(year: int, month: int, include_dummy: bool = False
             for row in rows
         ]
 
+
+
+def get_paper_trade_provider_counts(year: int, month: int) -> Dict[str, int]:
+    """
+    특정 월의 provider별 가정 투자 거래 수 (모든 provider 포함, SQL 집계)
+    
+    Args:
+        year: 연도
+        month: 월 (1-12)
+    
+    Returns:
+        {market_provider: 거래 수} (provider가 없으면 "unknown")
+    """
+    from calendar import monthrange
+    _, last_day = monthrange(year, month)
+    start_date = f"{year}-{month:02d}-01"
+    end_date = f"{year}-{month:02d}-{last_day:02d}"
+    
+    with get_db_connection() as conn:
+        cursor = conn.execute(
+            """
+            SELECT 
+                COALESCE(pt.market_provider, 'unknown') as market_provider,
+                COUNT(*) as count
+            FROM paper_trades pt
+            JOIN symbols s ON pt.symbol_id = s.id
+            WHERE pt.date >= ? AND pt.date <= ?
+            GROUP BY COALESCE(pt.market_provider, 'unknown')
+            """,
+            (start_date, end_date)
+        )
+        return {row["market_provider"]: row["count"] for row in cursor.fetchall()}
+
+
+def get_paper_trade_stats_by_month(year: int, month: int, include_dummy: bool = False) -> dict:
+    """
+    특정 월의 가정 투자 기록을 SQL 집계로 조회 (거래 행 전체를 Python으로 가져오지 않음)
+    
+    Args:
+        year: 연도
+        month: 월 (1-12)
+        include_dummy: dummy provider 거래 포함 여부 (기본: False, yahoo만)
+    
+    Returns:
+        {
+            daily: [{date, pnl, invested, count}] (date 오름차순),
+            win_count, loss_count, draw_count, total_count,
+            best_stock: {name, symbol, pnl, pnl_rate} 또는 None,
+            worst_stock: {name, symbol, pnl, pnl_rate} 또는 None
+        }
+    """
+    from calendar import monthrange
+    _, last_day = monthrange(year, month)
+    start_date = f"{year}-{month:02d}-01"
+    end_date = f"{year}-{month:02d}-{last_day:02d}"
+    
+    if include_dummy:
+        where_clause = "pt.date >= ? AND pt.date <= ?"
+    else:
+        where_clause = "pt.date >= ? AND pt.date <= ? AND pt.market_provider = 'yahoo'"
+    params = (start_date, end_date)
+    
+    with get_db_connection() as conn:
+        # 일자별 합계
+        cursor = conn.execute(
+            f"""
+            SELECT 
+                pt.date,
+                SUM(pt.pnl) as pnl,
+                SUM(pt.invested_amount) as invested,
+                COUNT(*) as count
+            FROM paper_trades pt
+            JOIN symbols s ON pt.symbol_id = s.id
+            WHERE {where_clause}
+            GROUP BY pt.date
+            ORDER BY pt.date ASC
+            """,
+            params
+        )
+        daily = [
+            {
+                "date": row["date"],
+                "pnl": row["pnl"],
+                "invested": row["invested"],
+                "count": row["count"]
+            }
+            for row in cursor.fetchall()
+        ]
+        
+        # 승/패/무 카운트
+        cursor = conn.execute(
+            f"""
+            SELECT 
+                COALESCE(SUM(CASE WHEN pt.pnl > 0 THEN 1 ELSE 0 END), 0) as win_count,
+                COALESCE(SUM(CASE WHEN pt.pnl < 0 THEN 1 ELSE 0 END), 0) as loss_count,
+                COALESCE(SUM(CASE WHEN pt.pnl = 0 THEN 1 ELSE 0 END), 0) as draw_count,
+                COUNT(*) as total_count
+            FROM paper_trades pt
+            JOIN symbols s ON pt.symbol_id = s.id
+            WHERE {where_clause}
+            """,
+            params
+        )
+        counts = dict(cursor.fetchone())
+        
+        # 베스트/워스트 종목 (동률이면 date, symbol_id 순으로 첫 번째)
+        extremes = {}
+        for key, direction in (("best_stock", "DESC"), ("worst_stock", "ASC")):
+            cursor = conn.execute(
+                f"""
+                SELECT 
+                    s.name,
+                    s.symbol,
+                    pt.pnl,
+                    pt.pnl_rate
+                FROM paper_trades pt
+                JOIN symbols s ON pt.symbol_id = s.id
+                WHERE {where_clause}
+                ORDER BY pt.pnl {direction}, pt.date ASC, pt.symbol_id ASC
+                LIMIT 1
+                """,
+                params
+            )
+            row = cursor.fetchone()
+            extremes[key] = dict(row) if row else None
+    
+    return {"daily": daily, **counts, **extremes}
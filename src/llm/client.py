@@ -2,7 +2,7 @@
 import json
 import time
 import logging
-from typing import Dict, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from datetime import date
 
 from src.config import (
@@ -132,7 +132,7 @@ def generate_json(
             logger, logging.INFO,
             f"OpenAI API 호출 완료: model={LLM_MODEL}, tokens={tokens_used}, "
             f"daily_total={daily['tokens']}/{daily['limit']} ({daily['percent']:.1f}%)",
-            extra={
+            {
                 "model": LLM_MODEL,
                 "tokens": tokens_used,
                 "daily_tokens": daily['tokens'],
@@ -152,3 +152,332 @@ def generate_json(
     except Exception as e:
         logger.error(f"OpenAI API 호출 실패: {e}", exc_info=True)
         raise
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    토큰 수 근사치 (usage를 받지 못했을 때 예산 반영용)
+    
+    토크나이저 없이 UTF-8 바이트 4개당 1토큰으로 계산 (한글은 글자당 약 0.75토큰).
+    """
+    return (len(text.encode("utf-8")) + 3) // 4
+
+
+# Batch API 종료 상태 (completed 외에는 결과 없음)
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def _build_request_body(
+    system_prompt: str,
+    user_prompt: str,
+    json_schema: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Chat Completions 요청 body (generate_json과 동일한 파라미터, 배치/스트리밍 공용)"""
+    if json_schema:
+        response_format = {"type": "json_schema", "json_schema": json_schema}
+    else:
+        response_format = {"type": "json_object"}
+    return {
+        "model": LLM_MODEL,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        "response_format": response_format,
+        "temperature": LLM_TEMPERATURE,
+        "max_tokens": LLM_MAX_TOKENS
+    }
+
+
+def _parse_batch_output_line(line: str) -> Tuple[str, Optional[Dict[str, Any]], int]:
+    """
+    Batch API 결과 JSONL 한 줄 파싱
+    
+    Returns:
+        (custom_id, 파싱된 JSON 또는 None, 사용 토큰 수)
+    """
+    record = json.loads(line)
+    custom_id = record.get("custom_id", "")
+    response = record.get("response") or {}
+    if record.get("error") or response.get("status_code") != 200:
+        logger.warning(f"Batch 요청 실패: custom_id={custom_id}, error={record.get('error')}")
+        return custom_id, None, 0
+    
+    body = response.get("body") or {}
+    tokens_used = (body.get("usage") or {}).get("total_tokens", 0)
+    try:
+        content = body["choices"][0]["message"]["content"]
+        return custom_id, json.loads(content), tokens_used
+    except (KeyError, IndexError, TypeError, json.JSONDecodeError) as e:
+        logger.warning(f"Batch 응답 JSON 파싱 실패: custom_id={custom_id}, error={e}")
+        return custom_id, None, tokens_used
+
+
+@track_performance("llm_generate_json_batch")
+def generate_json_batch(
+    requests: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+    poll_interval: float = 30.0,
+    timeout: float = 24 * 3600
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    OpenAI Batch API로 여러 요청을 한 번에 처리 (백필 등 지연 허용 작업용, 단건 대비 비용 절반)
+    
+    요청을 JSONL로 업로드해 배치를 만들고 완료될 때까지 폴링한 뒤,
+    결과를 custom_id 기준으로 요청 순서에 맞춰 돌려준다.
+    
+    Args:
+        requests: (system_prompt, user_prompt, json_schema) 튜플 리스트
+        poll_interval: 상태 확인 간격 (초)
+        timeout: 최대 대기 시간 (초, 초과 시 배치 취소)
+    
+    Returns:
+        requests 순서대로 파싱된 JSON 딕셔너리 (개별 요청 실패 시 None)
+    
+    Raises:
+        Exception: API 키/예산 부족, 배치 생성 실패, 배치 실패/만료/시간 초과
+    """
+    if not requests:
+        return []
+    
+    if not OPENAI_API_KEY:
+        raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다")
+    
+    if not _check_daily_budget():
+        raise ValueError(f"일일 토큰 예산 초과: {_daily_token_usage['tokens']}/{LLM_DAILY_BUDGET_TOKENS}")
+    
+    try:
+        from openai import OpenAI
+    except ImportError:
+        raise ImportError("openai 패키지가 설치되지 않았습니다. pip install openai")
+    
+    client = OpenAI(api_key=OPENAI_API_KEY)
+    
+    jsonl = "\n".join(
+        json.dumps({
+            "custom_id": str(index),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": _build_request_body(system_prompt, user_prompt, json_schema)
+        }, ensure_ascii=False)
+        for index, (system_prompt, user_prompt, json_schema) in enumerate(requests)
+    )
+    
+    input_file = client.files.create(file=("batch.jsonl", jsonl.encode("utf-8")), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    logger.info(f"OpenAI Batch 생성: id={batch.id}, requests={len(requests)}")
+    
+    deadline = time.monotonic() + timeout
+    while batch.status not in _BATCH_TERMINAL_STATUSES:
+        if time.monotonic() >= deadline:
+            try:
+                client.batches.cancel(batch.id)
+            except Exception as e:
+                # 취소 실패가 시간 초과 예외를 가리지 않도록 로그만 남김
+                logger.warning(f"OpenAI Batch 취소 실패: id={batch.id}, error={e}")
+            raise TimeoutError(f"OpenAI Batch 시간 초과: id={batch.id}, status={batch.status}")
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+    
+    if batch.status != "completed" or not batch.output_file_id:
+        raise ValueError(f"OpenAI Batch 실패: id={batch.id}, status={batch.status}")
+    
+    results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+    total_tokens = 0
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        custom_id, result, tokens_used = _parse_batch_output_line(line)
+        total_tokens += tokens_used
+        if custom_id.isdigit() and int(custom_id) < len(results):
+            results[int(custom_id)] = result
+    
+    _add_token_usage(total_tokens)
+    daily = get_daily_token_usage()
+    
+    log_with_extra(
+        logger, logging.INFO,
+        f"OpenAI Batch 완료: id={batch.id}, requests={len(requests)}, tokens={total_tokens}, "
+        f"daily_total={daily['tokens']}/{daily['limit']} ({daily['percent']:.1f}%)",
+        {
+            "model": LLM_MODEL,
+            "batch_id": batch.id,
+            "tokens": total_tokens,
+            "daily_tokens": daily['tokens'],
+            "daily_limit": daily['limit']
+        }
+    )
+    print(
+        f"[LLM] OpenAI Batch: requests={len(requests)}, tokens={total_tokens}, "
+        f"누적={daily['tokens']}/{daily['limit']} ({daily['percent']:.1f}%)"
+    )
+    
+    return results
+
+
+class _JsonArrayItemScanner:
+    """
+    스트리밍으로 들어오는 JSON 텍스트에서 최상위 배열(array_key)의 객체 항목을 완성되는 즉시 추출
+    
+    전체 응답을 기다리지 않고 항목 단위로 검증하기 위한 최소한의 스캐너
+    (문자열/이스케이프와 괄호 깊이만 추적하며, 완성된 항목만 json.loads로 파싱).
+    """
+    
+    def __init__(self, array_key: str):
+        self.array_key = array_key
+        self.buffer = ""
+        self.pos = 0
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.string_start = 0
+        self.last_key: Optional[str] = None  # 최상위 객체에서 마지막으로 읽은 문자열 (키)
+        self.array_depth: Optional[int] = None  # 대상 배열 내부 깊이
+        self.item_start: Optional[int] = None
+    
+    def feed(self, chunk: str) -> List[Any]:
+        """
+        텍스트 조각 추가
+        
+        Args:
+            chunk: 스트리밍으로 받은 텍스트 조각
+        
+        Returns:
+            이번 조각으로 완성된 배열 항목 리스트
+        """
+        self.buffer += chunk
+        buffer = self.buffer
+        items = []
+        
+        for i in range(self.pos, len(buffer)):
+            c = buffer[i]
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif c == "\\":
+                    self.escape = True
+                elif c == '"':
+                    self.in_string = False
+                    if self.depth == 1:
+                        self.last_key = buffer[self.string_start + 1:i]
+            elif c == '"':
+                self.in_string = True
+                self.string_start = i
+            elif c == "{" or c == "[":
+                if c == "[" and self.depth == 1 and self.last_key == self.array_key:
+                    self.array_depth = 2
+                elif c == "{" and self.depth == self.array_depth:
+                    self.item_start = i
+                self.depth += 1
+            elif c == "}" or c == "]":
+                self.depth -= 1
+                if self.array_depth is not None:
+                    if c == "}" and self.depth == self.array_depth and self.item_start is not None:
+                        items.append(json.loads(buffer[self.item_start:i + 1]))
+                        self.item_start = None
+                    elif c == "]" and self.depth == self.array_depth - 1:
+                        self.array_depth = None
+        
+        self.pos = len(buffer)
+        return items
+
+
+@track_performance("llm_generate_json_stream")
+def generate_json_stream(
+    system_prompt: str,
+    user_prompt: str,
+    json_schema: Optional[Dict[str, Any]] = None,
+    array_key: str = "selected",
+    item_validator: Optional[Callable[[Any], bool]] = None
+) -> Dict[str, Any]:
+    """
+    스트리밍으로 JSON 생성, array_key 배열 항목이 완성될 때마다 검증해 실패 시 즉시 중단
+    
+    검증에 실패한 생성은 끝까지 기다리지 않고 스트림을 닫으므로
+    fallback이 빨라지고 남은 출력 토큰도 과금되지 않는다.
+    
+    Args:
+        system_prompt: 시스템 프롬프트
+        user_prompt: 사용자 프롬프트
+        json_schema: JSON Schema (Structured Outputs용, 선택사항)
+        array_key: 항목 단위로 검증할 최상위 배열 키
+        item_validator: 항목 검증 함수 (False 반환 시 중단)
+    
+    Returns:
+        파싱된 JSON 딕셔너리
+    
+    Raises:
+        Exception: API 호출 실패, 항목 검증 실패(조기 중단) 또는 JSON 파싱 실패
+    """
+    if not OPENAI_API_KEY:
+        raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다")
+    
+    if not _check_daily_budget():
+        raise ValueError(f"일일 토큰 예산 초과: {_daily_token_usage['tokens']}/{LLM_DAILY_BUDGET_TOKENS}")
+    
+    try:
+        from openai import OpenAI
+    except ImportError:
+        raise ImportError("openai 패키지가 설치되지 않았습니다. pip install openai")
+    
+    client = OpenAI(api_key=OPENAI_API_KEY)
+    
+    stream = client.chat.completions.create(
+        **_build_request_body(system_prompt, user_prompt, json_schema),
+        stream=True,
+        stream_options={"include_usage": True}
+    )
+    
+    scanner = _JsonArrayItemScanner(array_key)
+    parts = []
+    tokens_used = 0
+    try:
+        for chunk in stream:
+            if chunk.usage:
+                tokens_used = chunk.usage.total_tokens
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            parts.append(delta)
+            if item_validator:
+                for item in scanner.feed(delta):
+                    if not item_validator(item):
+                        stream.close()
+                        raise ValueError(f"LLM 출력 항목 검증 실패로 스트리밍 중단: {item}")
+        
+        content = "".join(parts)
+        if not content:
+            raise ValueError("LLM 응답이 비어있습니다")
+        result = json.loads(content)
+    except json.JSONDecodeError as e:
+        logger.error(f"JSON 파싱 실패: {e}")
+        raise ValueError(f"LLM 응답 JSON 파싱 실패: {e}")
+    finally:
+        # 조기 중단 시에는 usage가 오지 않지만 프롬프트와 받은 출력은 과금되므로 근사치로 반영
+        if not tokens_used:
+            tokens_used = _estimate_tokens(system_prompt) + _estimate_tokens(user_prompt) + _estimate_tokens("".join(parts))
+        _add_token_usage(tokens_used)
+    
+    daily = get_daily_token_usage()
+    log_with_extra(
+        logger, logging.INFO,
+        f"OpenAI API 스트리밍 완료: model={LLM_MODEL}, tokens={tokens_used}, "
+        f"daily_total={daily['tokens']}/{daily['limit']} ({daily['percent']:.1f}%)",
+        {
+            "model": LLM_MODEL,
+            "tokens": tokens_used,
+            "daily_tokens": daily['tokens'],
+            "daily_limit": daily['limit']
+        }
+    )
+    print(
+        f"[LLM] OpenAI 호출: tokens={tokens_used}, "
+        f"누적={daily['tokens']}/{daily['limit']} ({daily['percent']:.1f}%)"
+    )
+    
+    return result
@@ -12,7 +12,7 @@ from src.database import upsert_symbol, get_financial_metrics, upsert_financial_
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class FinancialMetrics:
     """재무 지표"""
     symbol: str  # 종목코드
@@ -40,11 +40,25 @@ def fetch_financial_metrics(
 ) -> FinancialMetrics:
     """
     재무 지표 수집 (캐싱 및 재시도 로직 포함)
+    
+    성공한 결과만 당일 동안 프로세스 메모리에 캐싱하고, 실패 결과는 캐싱하지 않아
+    같은 날 재실행 시 다시 조회한다.
     """
-    return _fetch_financial_metrics_cached(symbol_code, stock_name, provider, date.today().isoformat())
+    try:
+        return _fetch_financial_metrics_cached(symbol_code, stock_name, provider, date.today().isoformat())
+    except _UncachedMetrics as e:
+        return e.metrics
+
 
+class _UncachedMetrics(Exception):
+    """lru_cache에 남기지 않을 (실패한) 조회 결과 전달용"""
 
-@lru_cache(maxsize=128)
+    def __init__(self, metrics: FinancialMetrics):
+        super().__init__(metrics.error)
+        self.metrics = metrics
+
+
+@lru_cache(maxsize=1024)
 def _fetch_financial_metrics_cached(
     symbol_code: str,
     stock_name: str,
@@ -53,6 +67,8 @@ def _fetch_financial_metrics_cached(
 ) -> FinancialMetrics:
     """
     캐시 레이어를 포함한 실제 수집 로직
+    
+    lru_cache는 예외를 캐싱하지 않으므로 실패 결과는 _UncachedMetrics로 감싸 던진다.
     """
     metrics = FinancialMetrics(symbol=symbol_code, name=stock_name)
     symbol_id = None
@@ -153,6 +169,8 @@ def _fetch_financial_metrics_cached(
         except Exception as e:
             logger.warning(f"DB 캐시 저장 실패: {e}")
 
+    if not metrics.success:
+        raise _UncachedMetrics(metrics)
     return metrics
 
 
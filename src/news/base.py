@@ -5,7 +5,7 @@ from typing import List, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsItem:
     """뉴스 아이템"""
     title: str
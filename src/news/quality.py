@@ -1,5 +1,6 @@
 """뉴스 품질 평가 모듈"""
 from typing import Dict, List
+from functools import lru_cache
 import re
 from src.news.base import NewsItem
 
@@ -46,10 +47,13 @@ SOURCE_RELIABILITY: Dict[str, float] = {
 }
 
 
+@lru_cache(maxsize=256)
 def get_source_reliability(source: str) -> float:
     """
     출처별 신뢰도 반환
     
+    출처명은 소수의 값이 반복되므로 부분 일치 탐색 결과를 출처별로 캐싱
+    
     Args:
         source: 뉴스 출처명
     
@@ -18,14 +18,18 @@ from src.utils.date_utils import get_kst_date
 logger = logging.getLogger(__name__)
 
 
-def generate_evening_report() -> str:
+def generate_evening_report(today: Optional[str] = None) -> str:
     """
     오후 리포트 생성 (recommendations 테이블 기반)
     
+    Args:
+        today: 기준 날짜 (YYYY-MM-DD, 기본: 현재 KST 날짜)
+    
     Returns:
         리포트 메시지 (Markdown 형식)
     """
-    today = get_kst_date()
+    if today is None:
+        today = get_kst_date()
     
     # 1. 오늘 추천 종목 조회
     recommendations = get_recommendations_by_date(today)
@@ -206,7 +210,7 @@ def generate_review(trade_results: List[TradeResult], metrics: 'PerformanceMetri
     # 섹터 추정 (종목명 기반)
     sectors = []
     for name in names:
-        if "반도체" in name or name in ["삼성전자", "SK하이닉스"]:
+        if "반도체" in name or name in {"삼성전자", "SK하이닉스"}:
             sectors.append("반도체")
         elif "2차전지" in name or "배터리" in name or "에너지" in name:
             sectors.append("2차전지")
@@ -2,8 +2,8 @@
 from typing import Optional
 import logging
 
-from src.database import get_db_connection, get_paper_trades_by_month
-from src.analysis.monthly_summary import aggregate_monthly_trades, MonthlySummary
+from src.database import get_db_connection, get_paper_trade_provider_counts
+from src.analysis.monthly_summary import aggregate_monthly_from_db, MonthlySummary
 from src.utils.disclaimer import append_disclaimer
 from src.utils.date_utils import get_kst_now, get_month_range, get_current_month_range
 from src.config import MONTH_OVERRIDE, MONTHLY_INCLUDE_DUMMY
@@ -38,25 +38,20 @@ def generate_monthly_report() -> str:
     
     year, month = int(month_str.split("-")[0]), int(month_str.split("-")[1])
     
-    # DB에서 월간 데이터 조회 (전체 거래 수 확인용)
-    all_trades = get_paper_trades_by_month(year, month, include_dummy=True)
-    # 필터링된 거래 (기본: yahoo만)
-    trades = get_paper_trades_by_month(year, month, include_dummy=MONTHLY_INCLUDE_DUMMY)
-    
-    # provider별 거래 수 계산
-    provider_counts = {}
-    for trade in all_trades:
-        provider = trade.get("market_provider", "unknown")
-        provider_counts[provider] = provider_counts.get(provider, 0) + 1
+    # provider별 거래 수 (전체 거래 수 확인용, 거래 행을 가져오지 않고 SQL로 집계)
+    provider_counts = get_paper_trade_provider_counts(year, month)
+    total_trade_count = sum(provider_counts.values())
+    # 필터링된 거래 월간 집계 (기본: yahoo만, SQL 집계로 거래 행 리스트 생성 생략)
+    summary = aggregate_monthly_from_db(year, month, include_dummy=MONTHLY_INCLUDE_DUMMY)
     
     # yahoo 거래 수 확인
-    yahoo_count = len([t for t in all_trades if t.get("market_provider") == "yahoo"])
+    yahoo_count = provider_counts.get("yahoo", 0)
     
-    if not trades:
+    if summary.total_count == 0:
         report = f"*📅 월간 성적표 - {month_str}*\n\n"
         report += "이번 달 데이터가 없습니다.\n"
-        if all_trades:
-            report += f"(전체 거래: {len(all_trades)}건, yahoo 거래: {yahoo_count}건)\n"
+        if total_trade_count:
+            report += f"(전체 거래: {total_trade_count}건, yahoo 거래: {yahoo_count}건)\n"
             if yahoo_count == 0:
                 report += "\n⚠️ *yahoo 거래가 없어 신뢰할 수 있는 집계가 불가능합니다.*\n"
                 report += "MARKET_PROVIDER=yahoo로 evening 리포트를 실행하여 실제 시세 기반 거래를 생성하세요.\n"
@@ -64,24 +59,21 @@ def generate_monthly_report() -> str:
         report = append_disclaimer(report)
         return report
     
-    # yahoo 거래가 0건인 경우 경고 추가 (trades가 있지만 yahoo가 아닌 경우)
+    # yahoo 거래가 0건인 경우 경고 추가 (집계 대상 거래는 있지만 yahoo가 아닌 경우)
     if yahoo_count == 0 and not MONTHLY_INCLUDE_DUMMY:
         report = f"*📅 월간 성적표 - {month_str}*\n\n"
         report += "⚠️ *yahoo 거래가 없어 신뢰할 수 있는 집계가 불가능합니다.*\n"
-        report += f"(전체 거래: {len(all_trades)}건, yahoo 거래: 0건)\n"
+        report += f"(전체 거래: {total_trade_count}건, yahoo 거래: 0건)\n"
         report += "MARKET_PROVIDER=yahoo로 evening 리포트를 실행하여 실제 시세 기반 거래를 생성하세요.\n\n"
         report = append_disclaimer(report)
         return report
     
-    # 월간 집계
-    summary = aggregate_monthly_trades(trades)
-    
     # 거래 수 정보 생성
-    trade_count_info = f"집계 대상 거래수: {len(trades)}"
-    if len(all_trades) > len(trades):
-        excluded = len(all_trades) - len(trades)
+    trade_count_info = f"집계 대상 거래수: {summary.total_count}"
+    if total_trade_count > summary.total_count:
+        excluded = total_trade_count - summary.total_count
         provider_detail = ", ".join([f"{k}={v}" for k, v in sorted(provider_counts.items())])
-        trade_count_info += f" (전체={len(all_trades)}, 제외={excluded}, {provider_detail})"
+        trade_count_info += f" (전체={total_trade_count}, 제외={excluded}, {provider_detail})"
     else:
         # 모든 거래가 포함된 경우
         provider_detail = ", ".join([f"{k}={v}" for k, v in sorted(provider_counts.items())])
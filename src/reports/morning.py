@@ -11,7 +11,7 @@ from src.config import (
 )
 from src.news.provider import get_news_provider, DummyNewsProvider
 from src.news.base import NewsItem
-from src.analysis.news_analyzer import create_digest, NewsDigest
+from src.analysis.news_analyzer import create_digest, NewsDigest, classify_sector
 from src.analysis.stock_picker import pick_watch_stocks, WatchStock
 from src.database import get_db_connection, upsert_symbol, upsert_recommendation
 from src.utils.disclaimer import append_disclaimer
@@ -21,6 +21,18 @@ from pytz import UTC
 
 logger = logging.getLogger(__name__)
 
+# 오버나이트 신호 표시 순서 (신호명 -> 순위, 없는 신호는 뒤로)
+_SIGNAL_PRIORITY = {
+    name: rank for rank, name in enumerate(["Nasdaq", "S&P500", "NVDA", "BTC", "USDKRW", "US10Y", "EWY", "DXY"])
+}
+
+# 시장 톤 -> (이모지, 표시명)
+_MARKET_TONE_DISPLAY = {
+    "risk_on": ("🟢", "Risk On"),
+    "risk_off": ("🔴", "Risk Off"),
+    "mixed": ("🟡", "Mixed"),
+}
+
 
 def filter_by_time_range(news_items: List[NewsItem], 
                          start_dt: datetime, 
@@ -207,7 +219,6 @@ def generate_morning_report() -> str:
     # 7. 섹터별 분배 수 로깅
     sector_counts = defaultdict(int)
     for item in time_filtered_items:
-        from src.analysis.news_analyzer import classify_sector
         sector = classify_sector(item.title, item.content or "")
         sector_counts[sector] += 1
     
@@ -277,11 +288,10 @@ def generate_morning_report() -> str:
             
             if successful_signals:
                 # 중요도 순으로 정렬 (Nasdaq, S&P500, NVDA, BTC, USDKRW 등)
-                priority_order = ["Nasdaq", "S&P500", "NVDA", "BTC", "USDKRW", "US10Y", "EWY", "DXY"]
                 sorted_signals = sorted(
                     successful_signals,
                     key=lambda x: (
-                        priority_order.index(x[0]) if x[0] in priority_order else 999,
+                        _SIGNAL_PRIORITY.get(x[0], 999),
                         -abs(x[1].pct_change or 0)  # 변동률 큰 순
                     )
                 )
@@ -292,17 +302,8 @@ def generate_morning_report() -> str:
                     report += f"  {emoji} {name}: {pct:+.1f}%\n"
                 
                 # 시장 톤 요약
-                tone_emoji = {
-                    "risk_on": "🟢",
-                    "risk_off": "🔴",
-                    "mixed": "🟡"
-                }
-                tone_label = {
-                    "risk_on": "Risk On",
-                    "risk_off": "Risk Off",
-                    "mixed": "Mixed"
-                }
-                report += f"\n*오늘의 톤: {tone_emoji.get(market_tone, '⚪')} {tone_label.get(market_tone, 'Unknown')}*\n\n"
+                tone_emoji, tone_label = _MARKET_TONE_DISPLAY.get(market_tone, ("⚪", "Unknown"))
+                report += f"\n*오늘의 톤: {tone_emoji} {tone_label}*\n\n"
             else:
                 report += "  (신호 수집 실패)\n\n"
         except Exception as e:
@@ -1,11 +1,22 @@
 from src.utils.retry import retry_with_backoff, classify_error, is_retryable_error
-from src.utils.text import normalize_title, jaccard_similarity
+from src.utils.text import (
+    normalize_title,
+    title_token_set,
+    title_token_bitmap,
+    jaccard_similarity,
+    jaccard_similarity_sets,
+    jaccard_similarity_bits,
+)
 
 __all__ = [
     'retry_with_backoff',
     'classify_error',
     'is_retryable_error',
     'normalize_title',
+    'title_token_set',
+    'title_token_bitmap',
     'jaccard_similarity',
+    'jaccard_similarity_sets',
+    'jaccard_similarity_bits',
 ]
 
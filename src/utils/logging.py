@@ -3,6 +3,7 @@ import logging
 import time
 import json
 import sys
+from collections import defaultdict
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 from contextlib import contextmanager
@@ -53,12 +54,9 @@ class PerformanceTracker:
         
         summary = ["\n=== 성능 통계 요약 ==="]
         # 컴포넌트별 합계 및 평균 계산
-        stats = {}
+        stats = defaultdict(list)
         for m in self.metrics:
-            comp = m["component"]
-            if comp not in stats:
-                stats[comp] = []
-            stats[comp].append(m["duration"])
+            stats[m["component"]].append(m["duration"])
         
         total_time = 0
         for comp, durations in stats.items():
@@ -1,33 +1,77 @@
 """텍스트 처리 유틸리티"""
 import re
+from functools import lru_cache
+from typing import Dict
 
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s가-힣]')
+_WHITESPACE_RE = re.compile(r'\s+')
 
+
+@lru_cache(maxsize=8192)
 def normalize_title(title: str) -> str:
-    """제목 정규화 (중복 제거용)"""
+    """제목 정규화 (중복 제거용, 같은 제목은 캐시 재사용)"""
     if not title:
         return ""
         
     # 소문자 변환
     title = title.lower()
     # 특수문자 제거 (한글, 영문, 숫자만 남김)
-    title = re.sub(r'[^\w\s가-힣]', '', title)
+    title = _SPECIAL_CHARS_RE.sub('', title)
     # 공백 정규화
-    title = re.sub(r'\s+', ' ', title).strip()
+    title = _WHITESPACE_RE.sub(' ', title).strip()
     return title
 
 
-def jaccard_similarity(text1: str, text2: str) -> float:
-    """Jaccard 유사도 계산 (단어 기반)"""
-    if not text1 or not text2:
+@lru_cache(maxsize=8192)
+def title_token_set(text: str) -> frozenset:
+    """단어 집합 (Jaccard 계산용, 같은 텍스트는 캐시 재사용)"""
+    return frozenset(text.split())
+
+
+def title_token_bitmap(text: str, vocab: Dict[str, int]) -> int:
+    """
+    단어 집합을 int 비트맵으로 변환 (Jaccard를 비트 연산 + popcount로 계산하기 위함)
+    
+    Args:
+        text: 정규화된 제목
+        vocab: 단어 -> 비트 위치 사전 (처음 본 단어에 다음 비트 할당). 호출자가 한 번의 비교 작업 단위로
+            만들어 사용하므로 스레드 간에 공유되지 않고, 작업이 끝나면 함께 해제됨.
+            같은 vocab으로 만든 비트맵끼리만 비교 가능
+    
+    Returns:
+        비트맵
+    """
+    bits = 0
+    for token in title_token_set(text):
+        bit = vocab.get(token)
+        if bit is None:
+            bit = vocab[token] = len(vocab)
+        bits |= 1 << bit
+    return bits
+
+
+def jaccard_similarity_bits(bits1: int, bits2: int) -> float:
+    """Jaccard 유사도 계산 (title_token_bitmap 비트맵 기반)"""
+    if not bits1 or not bits2:
         return 0.0
-        
-    words1 = set(text1.split())
-    words2 = set(text2.split())
     
+    return (bits1 & bits2).bit_count() / (bits1 | bits2).bit_count()
+
+
+def jaccard_similarity_sets(words1: frozenset, words2: frozenset) -> float:
+    """Jaccard 유사도 계산 (미리 만든 단어 집합 기반)"""
     if not words1 or not words2:
         return 0.0
     
     intersection = len(words1 & words2)
-    union = len(words1 | words2)
+    union = len(words1) + len(words2) - intersection
     
     return intersection / union if union > 0 else 0.0
+
+
+def jaccard_similarity(text1: str, text2: str) -> float:
+    """Jaccard 유사도 계산 (단어 기반)"""
+    if not text1 or not text2:
+        return 0.0
+    
+    return jaccard_similarity_sets(title_token_set(text1), title_token_set(text2))
@@ -1,8 +1,11 @@
 """테스트 공통 fixture 및 유틸리티"""
+import os
 import sys
+import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
+from unittest.mock import patch
 import pytest
 from pytz import UTC
 
@@ -14,6 +17,23 @@ if str(project_root) not in sys.path:
 from src.news.base import NewsItem
 from src.analysis.news_analyzer import NewsDigest
 from src.market.overnight import OvernightSignal
+from src.database import init_schema, close_pooled_connection
+
+
+@pytest.fixture
+def temp_db():
+    """테스트별로 독립된 임시 DB 사용 (종료 시 장기 연결을 닫고 DB 파일 정리)"""
+    fd, path = tempfile.mkstemp()
+    os.close(fd)
+
+    with patch("src.database.DB_PATH", path), patch("src.config.DB_PATH", path):
+        init_schema()
+        yield path
+        close_pooled_connection()
+
+    for suffix in ("", "-journal", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
 
 
 @pytest.fixture
@@ -15,20 +15,11 @@ from src.market.provider import YahooMarketProvider, KISMarketProvider
 from src.database import get_db_connection, init_schema
 from src.market.base import OHLC
 
-@pytest.fixture
-def temp_db():
-    """테스트별로 독립된 임시 DB 사용"""
-    fd, path = tempfile.mkstemp()
-    os.close(fd)
-    
-    with patch("src.database.DB_PATH", path), patch("src.config.DB_PATH", path):
-        init_schema()
-        # lru_cache 초기화
-        _fetch_financial_metrics_cached.cache_clear()
-        yield path
-        
-    if os.path.exists(path):
-        os.remove(path)
+@pytest.fixture(autouse=True)
+def clear_financial_metrics_cache():
+    """테스트마다 재무 지표 lru_cache 초기화"""
+    _fetch_financial_metrics_cached.cache_clear()
+    yield
 
 def test_financial_metrics_caching(temp_db):
     """재무 지표 캐싱 동작 테스트"""
@@ -68,6 +59,19 @@ def test_financial_metrics_caching(temp_db):
         assert metrics2.per == 15.0
         assert mock_ticker.called is False  # 캐시 히트!
 
+def test_financial_metrics_failure_not_cached(temp_db):
+    """실패 결과는 캐싱하지 않고 재호출 시 다시 조회"""
+    with patch("yfinance.Ticker") as mock_ticker:
+        mock_ticker.return_value.info = {}
+
+        metrics1 = fetch_financial_metrics("000660", "SK하이닉스", provider="yahoo")
+        assert metrics1.success is False
+
+        mock_ticker.return_value.info = {"trailingPE": 12.0, **{f"k{i}": i for i in range(10)}}
+        metrics2 = fetch_financial_metrics("000660", "SK하이닉스", provider="yahoo")
+        assert metrics2.success is True
+        assert metrics2.per == 12.0
+
 def test_market_provider_db_caching(temp_db):
     """시세 데이터 DB 캐싱 테스트"""
     symbol = "005930"
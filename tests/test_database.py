@@ -0,0 +1,89 @@
+"""DB 연결 관리 테스트"""
+import os
+import sqlite3
+import threading
+
+from src.database import (
+    get_db_connection,
+    get_pooled_connection,
+    close_pooled_connection,
+    get_table_columns,
+    upsert_symbol,
+)
+
+
+def test_pooled_connection_is_reused(temp_db):
+    """장기 연결이 열려 있으면 get_db_connection이 같은 연결을 사용"""
+    conn = get_pooled_connection()
+
+    assert get_pooled_connection() is conn
+    with get_db_connection() as inner:
+        assert inner is conn
+
+    # 컨텍스트 종료 후에도 연결이 살아 있어야 함
+    symbol_id = upsert_symbol("삼성전자", "005930")
+    row = conn.execute("SELECT name FROM symbols WHERE id = ?", (symbol_id,)).fetchone()
+    assert row["name"] == "삼성전자"
+
+
+def test_pooled_connection_pragmas(temp_db):
+    """장기 연결에 PRAGMA 적용"""
+    conn = get_pooled_connection()
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+
+
+def test_close_pooled_connection(temp_db):
+    """종료 후에는 새 연결 사용"""
+    conn = get_pooled_connection()
+    close_pooled_connection()
+
+    with get_db_connection() as other:
+        assert other is not conn
+    assert get_pooled_connection() is not conn
+
+
+def test_pooled_connection_not_shared_across_threads(temp_db):
+    """다른 스레드에서는 장기 연결을 재사용하지 않음"""
+    conn = get_pooled_connection()
+    seen = []
+
+    def worker():
+        with get_db_connection() as other:
+            seen.append(other is conn)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert seen == [False]
+
+
+def test_get_table_columns(temp_db):
+    """cursor.description 기반 컬럼 집합"""
+    with get_db_connection() as conn:
+        columns = get_table_columns(conn, "paper_trades")
+
+    assert {"date", "symbol_id", "pnl", "market_provider"} <= columns
+    assert "nonexistent" not in columns
+
+
+def test_wal_database_restored_to_rollback_journal(temp_db):
+    """이전에 WAL로 바뀐 DB도 연결 시 롤백 저널 모드로 되돌려 단일 파일로 유지"""
+    raw = sqlite3.connect(temp_db)
+    raw.execute("PRAGMA journal_mode=WAL")
+    raw.close()
+
+    with get_db_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert not os.path.exists(temp_db + "-wal")
+
+
+def test_db_connection_pragmas(temp_db):
+    """컨텍스트 매니저 연결에도 PRAGMA 적용"""
+    with get_db_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
@@ -0,0 +1,190 @@
+"""LLM 클라이언트 테스트"""
+import json
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.llm.client import (
+    _JsonArrayItemScanner,
+    _parse_batch_output_line,
+    generate_json_batch,
+    generate_json_stream,
+)
+
+
+SAMPLE_OUTPUT = {
+    "selected": [
+        {"name": "삼성\"전자{", "code": "005930", "catalyst": ["x]", "y"], "checklist": {"per_10_20": 1}},
+        {"name": "SK하이닉스", "code": "000660"},
+    ],
+    "meta": {"policy": "watchlist_only_no_buy", "notes": "selected"},
+}
+
+
+def make_chunk(content=None, usage=None):
+    """스트리밍 chunk 모의 객체"""
+    choices = [Mock(delta=Mock(content=content))] if content is not None else []
+    return Mock(choices=choices, usage=usage)
+
+
+class TestJsonArrayItemScanner:
+    """스트리밍 배열 항목 스캐너 테스트"""
+
+    def test_items_emitted_as_completed(self):
+        """조각 경계와 무관하게 완성된 항목만 순서대로 반환"""
+        text = json.dumps(SAMPLE_OUTPUT, ensure_ascii=False)
+
+        for size in (1, 3, 7, len(text)):
+            scanner = _JsonArrayItemScanner("selected")
+            items = []
+            for i in range(0, len(text), size):
+                items.extend(scanner.feed(text[i:i + size]))
+            assert items == SAMPLE_OUTPUT["selected"]
+
+    def test_nested_key_ignored(self):
+        """최상위가 아닌 같은 이름의 배열은 무시"""
+        scanner = _JsonArrayItemScanner("selected")
+
+        items = scanner.feed(json.dumps({"meta": {"selected": [{"a": 1}]}, "selected": [{"b": 2}]}))
+
+        assert items == [{"b": 2}]
+
+
+class TestGenerateJsonStream:
+    """스트리밍 JSON 생성 테스트"""
+
+    def make_openai(self, with_usage=True):
+        """SAMPLE_OUTPUT을 5글자씩 보내는 모의 openai 모듈과 스트림"""
+        text = json.dumps(SAMPLE_OUTPUT, ensure_ascii=False)
+        chunks = [make_chunk(text[i:i + 5]) for i in range(0, len(text), 5)]
+        if with_usage:
+            chunks.append(make_chunk(usage=Mock(total_tokens=42)))
+        stream = Mock()
+        stream.__iter__ = Mock(return_value=iter(chunks))
+        client = Mock()
+        client.chat.completions.create.return_value = stream
+        return Mock(OpenAI=Mock(return_value=client)), stream
+
+    def run_stream(self, openai_module, item_validator):
+        with patch.dict(sys.modules, {"openai": openai_module}), \
+             patch("src.llm.client.OPENAI_API_KEY", "test-key"), \
+             patch("src.llm.client._add_token_usage") as add_usage:
+            try:
+                return generate_json_stream("system", "user", item_validator=item_validator)
+            finally:
+                self.tokens_added = add_usage.call_args.args[0]
+
+    def test_full_output(self):
+        """검증 통과 시 전체 JSON 반환, usage 토큰 반영"""
+        openai_module, stream = self.make_openai()
+
+        result = self.run_stream(openai_module, lambda item: True)
+
+        assert result == SAMPLE_OUTPUT
+        stream.close.assert_not_called()
+        assert self.tokens_added == 42
+
+    def test_early_stop_on_invalid_item(self):
+        """항목 검증 실패 시 스트림을 닫고 예외, usage가 없어도 프롬프트/출력 토큰 근사치 반영"""
+        openai_module, stream = self.make_openai(with_usage=False)
+
+        with pytest.raises(ValueError):
+            self.run_stream(openai_module, lambda item: item["code"] != "005930")
+
+        stream.close.assert_called_once()
+        assert self.tokens_added > 0
+
+
+def make_batch_line(custom_id, content=None, status_code=200, error=None, tokens=10):
+    """Batch API 결과 JSONL 한 줄 생성"""
+    body = {"choices": [{"message": {"content": content}}], "usage": {"total_tokens": tokens}}
+    return json.dumps({
+        "custom_id": custom_id,
+        "response": {"status_code": status_code, "body": body},
+        "error": error,
+    }, ensure_ascii=False)
+
+
+class TestParseBatchOutputLine:
+    """Batch 결과 한 줄 파싱 테스트"""
+
+    def test_success(self):
+        """정상 응답은 JSON과 토큰 수 반환"""
+        line = make_batch_line("3", json.dumps({"selected": []}), tokens=7)
+
+        assert _parse_batch_output_line(line) == ("3", {"selected": []}, 7)
+
+    def test_failed_lines(self):
+        """에러/비정상 상태 코드는 None, 파싱 실패는 None + 사용 토큰"""
+        assert _parse_batch_output_line(make_batch_line("0", error={"code": "x"})) == ("0", None, 0)
+        assert _parse_batch_output_line(make_batch_line("1", "{}", status_code=500)) == ("1", None, 0)
+        assert _parse_batch_output_line(make_batch_line("2", "not json", tokens=5)) == ("2", None, 5)
+
+
+class TestGenerateJsonBatch:
+    """Batch API 요청/결과 매핑 테스트"""
+
+    def test_results_in_request_order(self):
+        """custom_id 기준으로 요청 순서에 맞추고 실패 요청은 None"""
+        output = "\n".join([
+            make_batch_line("2", json.dumps({"n": 2}), tokens=3),
+            "",
+            make_batch_line("0", json.dumps({"n": 0}), tokens=4),
+            make_batch_line("1", error={"message": "failed"}),
+            make_batch_line("9", json.dumps({"n": 9})),  # 범위 밖 custom_id는 무시
+        ])
+        client = Mock()
+        client.files.create.return_value = Mock(id="file-in")
+        client.batches.create.return_value = Mock(id="batch-1", status="in_progress")
+        client.batches.retrieve.return_value = Mock(id="batch-1", status="completed", output_file_id="file-out")
+        client.files.content.return_value = Mock(text=output)
+        openai_module = Mock(OpenAI=Mock(return_value=client))
+
+        with patch.dict(sys.modules, {"openai": openai_module}), \
+             patch("src.llm.client.OPENAI_API_KEY", "test-key"), \
+             patch("src.llm.client._add_token_usage") as add_usage, \
+             patch("src.llm.client.time.sleep"):
+            results = generate_json_batch([("s", f"u{i}", None) for i in range(3)], poll_interval=0)
+
+        assert results == [{"n": 0}, None, {"n": 2}]
+        add_usage.assert_called_once_with(3 + 4 + 10)
+        client.batches.retrieve.assert_called_once_with("batch-1")
+        client.files.content.assert_called_once_with("file-out")
+
+        # 업로드한 JSONL의 custom_id는 요청 인덱스
+        uploaded = client.files.create.call_args.kwargs["file"][1].decode("utf-8").splitlines()
+        assert [json.loads(line)["custom_id"] for line in uploaded] == ["0", "1", "2"]
+        assert json.loads(uploaded[1])["body"]["messages"][1]["content"] == "u1"
+
+    def test_failed_batch_raises(self):
+        """배치 자체가 실패하면 예외"""
+        client = Mock()
+        client.files.create.return_value = Mock(id="file-in")
+        client.batches.create.return_value = Mock(id="batch-1", status="failed", output_file_id=None)
+        openai_module = Mock(OpenAI=Mock(return_value=client))
+
+        with patch.dict(sys.modules, {"openai": openai_module}), \
+             patch("src.llm.client.OPENAI_API_KEY", "test-key"):
+            with pytest.raises(ValueError):
+                generate_json_batch([("s", "u", None)])
+
+    def test_timeout_raises_even_if_cancel_fails(self):
+        """시간 초과 시 배치 취소가 실패해도 TimeoutError 유지"""
+        client = Mock()
+        client.files.create.return_value = Mock(id="file-in")
+        client.batches.create.return_value = Mock(id="batch-1", status="in_progress")
+        client.batches.cancel.side_effect = RuntimeError("cancel failed")
+        openai_module = Mock(OpenAI=Mock(return_value=client))
+
+        with patch.dict(sys.modules, {"openai": openai_module}), \
+             patch("src.llm.client.OPENAI_API_KEY", "test-key"):
+            with pytest.raises(TimeoutError):
+                generate_json_batch([("s", "u", None)], poll_interval=0, timeout=0)
+
+        client.batches.cancel.assert_called_once_with("batch-1")
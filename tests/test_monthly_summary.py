@@ -0,0 +1,132 @@
+"""월간 성과 집계 테스트"""
+from src.analysis.monthly_summary import (
+    aggregate_daily_trades,
+    aggregate_monthly_trades,
+    aggregate_monthly_from_db,
+)
+from src.database import (
+    upsert_symbol,
+    upsert_paper_trade,
+    get_paper_trades_by_month,
+    get_paper_trade_provider_counts,
+)
+
+
+def make_trade(trade_date: str, symbol: str, name: str, pnl: float, invested: float = 1_000_000.0) -> dict:
+    """집계 입력용 거래 dict 생성 헬퍼"""
+    return {
+        "date": trade_date,
+        "symbol": symbol,
+        "name": name,
+        "pnl": pnl,
+        "pnl_rate": round(pnl / invested * 100, 2),
+        "invested_amount": invested,
+    }
+
+
+SAMPLE_TRADES = [
+    make_trade("2024-01-02", "005930", "삼성전자", 30_000),
+    make_trade("2024-01-02", "000660", "SK하이닉스", -10_000),
+    make_trade("2024-01-03", "005930", "삼성전자", -50_000),
+    make_trade("2024-01-03", "035420", "NAVER", 0),
+    make_trade("2024-01-04", "000660", "SK하이닉스", 80_000),
+    make_trade("2024-01-04", "035420", "NAVER", -20_000),
+]
+
+
+def seed_trades(trades, market_provider: str = "yahoo"):
+    """paper_trades 테이블에 거래 기록 저장"""
+    for trade in trades:
+        symbol_id = upsert_symbol(trade["name"], trade["symbol"])
+        upsert_paper_trade(
+            date=trade["date"],
+            symbol_id=symbol_id,
+            recommendation_id=None,
+            entry_date=trade["date"],
+            entry_price=100.0,
+            current_price=100.0,
+            quantity=1,
+            invested_amount=trade["invested_amount"],
+            current_value=trade["invested_amount"] + trade["pnl"],
+            pnl=trade["pnl"],
+            pnl_rate=trade["pnl_rate"],
+            market_provider=market_provider,
+        )
+
+
+def test_aggregate_daily_trades():
+    """일자별 합계 및 수익률"""
+    days = aggregate_daily_trades(SAMPLE_TRADES)
+
+    assert [d.date for d in days] == ["2024-01-02", "2024-01-03", "2024-01-04"]
+    assert [d.day_pnl for d in days] == [20_000, -50_000, 60_000]
+    assert [d.trade_count for d in days] == [2, 2, 2]
+    assert days[0].day_invested == 2_000_000
+    assert days[0].day_return == 1.0
+
+
+def test_aggregate_monthly_trades():
+    """월간 합계, 승패, 베스트/워스트"""
+    summary = aggregate_monthly_trades(SAMPLE_TRADES)
+
+    assert (summary.year, summary.month) == (2024, 1)
+    assert summary.month_pnl == 30_000
+    assert summary.month_invested == 6_000_000
+    assert summary.month_return == 0.5
+    assert (summary.win_count, summary.loss_count, summary.draw_count) == (2, 3, 1)
+    assert summary.total_count == 6
+    assert summary.win_rate == 40.0
+    assert summary.best_day.date == "2024-01-04"
+    assert summary.worst_day.date == "2024-01-03"
+    assert summary.best_stock == {"name": "SK하이닉스", "symbol": "000660", "pnl": 80_000, "pnl_rate": 8.0}
+    assert summary.worst_stock["symbol"] == "005930"
+    assert summary.worst_stock["pnl"] == -50_000
+    assert summary.mdd is not None
+    assert summary.mdd_amount == 50_000
+
+
+def test_aggregate_monthly_trades_empty():
+    """거래가 없으면 0 집계"""
+    summary = aggregate_monthly_trades([])
+
+    assert summary.total_count == 0
+    assert summary.mdd is None
+    assert summary.best_day is None
+    assert summary.best_stock is None
+
+
+def test_aggregate_monthly_from_db_matches_python(temp_db):
+    """SQL 집계 결과가 Python 집계와 동일"""
+    seed_trades(SAMPLE_TRADES)
+    seed_trades([make_trade("2024-01-05", "051910", "LG화학", 999_000)], market_provider="dummy")
+
+    trades = get_paper_trades_by_month(2024, 1)
+    expected = aggregate_monthly_trades(trades)
+    actual = aggregate_monthly_from_db(2024, 1)
+
+    assert actual == expected
+
+    # dummy 포함 시에도 동일
+    trades_all = get_paper_trades_by_month(2024, 1, include_dummy=True)
+    assert aggregate_monthly_from_db(2024, 1, include_dummy=True) == aggregate_monthly_trades(trades_all)
+
+
+def test_aggregate_monthly_from_db_empty(temp_db):
+    """해당 월 거래가 없으면 0 집계"""
+    summary = aggregate_monthly_from_db(2024, 2)
+
+    assert (summary.year, summary.month) == (2024, 2)
+    assert summary.total_count == 0
+    assert summary.mdd is None
+    assert summary.best_stock is None
+    assert summary.worst_stock is None
+
+
+def test_provider_counts_match_trade_rows(temp_db):
+    """provider별 거래 수 SQL 집계가 전체 거래 행 집계와 동일"""
+    seed_trades(SAMPLE_TRADES)
+    seed_trades([make_trade("2024-01-05", "051910", "LG화학", 999_000)], market_provider="dummy")
+    seed_trades([make_trade("2024-02-01", "051910", "LG화학", 1_000)], market_provider="dummy")
+
+    assert get_paper_trade_provider_counts(2024, 1) == {"yahoo": 6, "dummy": 1}
+    assert get_paper_trade_provider_counts(2024, 3) == {}
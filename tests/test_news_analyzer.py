@@ -10,7 +10,14 @@ project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from src.utils.text import normalize_title, jaccard_similarity
+from src.utils.text import (
+    normalize_title,
+    jaccard_similarity,
+    jaccard_similarity_sets,
+    jaccard_similarity_bits,
+    title_token_set,
+    title_token_bitmap,
+)
 from src.analysis.news_analyzer import (
     is_noise_article,
     calculate_freshness_score,
@@ -71,6 +78,32 @@ class TestJaccardSimilarity:
         text2 = "NVIDIA AI 칩 판매 증가"
         similarity = jaccard_similarity(text1, text2)
         assert 0.3 < similarity < 0.8
+    
+    def test_token_set_matches_text_similarity(self):
+        """단어 집합 기반 계산이 텍스트 기반 계산과 동일"""
+        text1 = "nvidia ai 칩 수요 급증"
+        text2 = "nvidia ai 칩 판매 증가"
+        similarity = jaccard_similarity_sets(title_token_set(text1), title_token_set(text2))
+        assert similarity == jaccard_similarity(text1, text2)
+        assert jaccard_similarity_sets(frozenset(), title_token_set(text1)) == 0.0
+    
+    def test_token_bitmap_matches_token_set(self):
+        """비트맵 기반 계산이 단어 집합 기반 계산과 동일"""
+        text1 = "nvidia ai 칩 수요 급증"
+        text2 = "ai 칩 판매 급증 전망"
+        vocab = {}
+        expected = jaccard_similarity_sets(title_token_set(text1), title_token_set(text2))
+        assert jaccard_similarity_bits(title_token_bitmap(text1, vocab), title_token_bitmap(text2, vocab)) == expected
+        assert title_token_bitmap("", vocab).bit_count() == 0
+        assert jaccard_similarity_bits(title_token_bitmap("", vocab), title_token_bitmap(text1, vocab)) == 0.0
+    
+    def test_token_bitmap_vocab_per_caller(self):
+        """비트 어휘는 호출자 소유 (프로세스 전역 상태 없음)"""
+        vocab1, vocab2 = {}, {}
+        title_token_bitmap("nvidia ai 칩", vocab1)
+        assert title_token_bitmap("삼성전자 반도체", vocab2) == 0b11
+        assert set(vocab1) == {"nvidia", "ai", "칩"}
+        assert set(vocab2) == {"삼성전자", "반도체"}
 
 
 class TestIsNoiseArticle:
@@ -142,6 +175,22 @@ class TestCalculateNoveltyScore:
         assert penalty >= 0.0
 
 
+    def test_window_boundaries(self, fixed_datetime):
+        """24~72시간 구간 경계 포함, 구간 밖 유사 기사는 무시"""
+        item = create_news_item("NVIDIA AI 칩 수요 급증", hours_ago=0, base_time=fixed_datetime)
+        in_window = [
+            create_news_item("NVIDIA AI 칩 수요 급증", hours_ago=24, base_time=fixed_datetime),
+            create_news_item("NVIDIA AI 칩 수요 급증", hours_ago=72, base_time=fixed_datetime),
+        ]
+        out_of_window = [
+            create_news_item("NVIDIA AI 칩 수요 급증", hours_ago=23, base_time=fixed_datetime),
+            create_news_item("NVIDIA AI 칩 수요 급증", hours_ago=73, base_time=fixed_datetime),
+        ]
+        
+        assert calculate_novelty_score(item, out_of_window, now_utc=fixed_datetime) == (1.0, 0.0)
+        assert calculate_novelty_score(item, in_window + out_of_window, now_utc=fixed_datetime) == (0.7, 0.2)
+
+
 class TestCalculateLateNewsPenalty:
     """늦은 뉴스 페널티 테스트"""
     
@@ -176,6 +225,21 @@ class TestCalculateClickbaitPenalty:
         assert penalty < 0.3
 
 
+    def test_credible_domain_by_host(self, fixed_datetime):
+        """신뢰 도메인은 URL 호스트(하위 도메인 포함) 기준으로 판단"""
+        title = "충격! 반도체 급락"
+        credible = create_news_item(title, base_time=fixed_datetime)
+        credible.url = "https://www.reuters.com/markets/asia/article"
+        # 경로에만 도메인이 들어 있거나 도메인 일부만 겹치면 신뢰 출처 아님
+        in_path = create_news_item(title, base_time=fixed_datetime)
+        in_path.url = "https://blog.example.org/share?u=reuters.com"
+        look_alike = create_news_item(title, base_time=fixed_datetime)
+        look_alike.url = "https://microsoft.com/news"
+        
+        assert calculate_clickbait_penalty(credible) < calculate_clickbait_penalty(in_path)
+        assert calculate_clickbait_penalty(in_path) == calculate_clickbait_penalty(look_alike)
+
+
 class TestScoreHeadline:
     """헤드라인 점수 계산 테스트"""
     
@@ -196,6 +260,14 @@ class TestScoreHeadline:
         assert score >= 0
 
 
+    def test_overlapping_keywords_counted_once_each(self, fixed_datetime):
+        """겹치는 키워드(s&p / s&p 500, 하이닉스 / sk하이닉스)도 각각 1회씩 반영"""
+        item = create_news_item("S&P 500 상승, SK하이닉스 강세", base_time=fixed_datetime)
+        _, debug = score_headline(item, all_items=[], now_utc=fixed_datetime)
+        # s&p(10) + s&p 500(10) + sk하이닉스(8) + 하이닉스(8)
+        assert debug["base_relevance"] == 36
+
+
 class TestRemoveDuplicates:
     """중복 제거 테스트"""
     
@@ -286,6 +358,20 @@ class TestCreateDigest:
         assert digest is not None
         assert len(digest.top_headlines) > 0
     
+    def test_sources_deduplicated_without_dummy_urls(self, fixed_datetime):
+        """근거 링크는 중복 없이, example.com 더미 URL 제외"""
+        titles = ["NVIDIA AI 칩 수요 급증", "삼성전자 반도체 공장 건설", "코스피 금리 인상 우려"]
+        urls = ["https://news.test/a", "https://news.test/a", "https://EXAMPLE.com/dummy"]
+        items = []
+        for title, url in zip(titles, urls):
+            item = create_news_item(title, base_time=fixed_datetime)
+            item.url = url
+            items.append(item)
+        
+        digest = create_digest(items, fetched_count=3, time_filtered_count=3)
+        
+        assert digest.sources == ["https://news.test/a"]
+    
     def test_empty_news_list(self):
         """빈 뉴스 리스트"""
         digest = create_digest([], fetched_count=0, time_filtered_count=0)
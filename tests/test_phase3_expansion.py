@@ -1,6 +1,7 @@
 """Phase 3 확장 기능 테스트"""
 import pytest
-from src.data.kr_symbols import KR_SYMBOLS, get_symbol_code, get_foreign_substitute_symbols
+from src.data.kr_symbols import KR_SYMBOLS, get_symbol_code, get_foreign_substitute_symbols, find_symbols_in_text, compile_name_pattern
+from src.data.kr_symbols import find_symbol_names, find_symbol_and_foreign_names
 
 def test_new_kr_symbols():
     """새로 추가된 한국 종목 코드 조회 테스트"""
@@ -43,3 +44,33 @@ def test_partial_match_get_symbol():
     
     code = get_symbol_code("에코프로")
     assert code in ["086520", "247540"] # 에코프로 또는 에코프로비엠
+
+def test_find_symbols_overlapping_names():
+    """겹치는 종목명/대소문자 무시 매칭 테스트"""
+    found = find_symbols_in_text("hd현대일렉트릭과 카카오페이, Ls Electric 강세")
+    
+    # 포함된 종목명을 모두 찾고 KR_SYMBOLS 순서를 유지
+    assert list(found) == ["HD현대일렉트릭", "현대일렉트릭", "LS ELECTRIC", "카카오", "카카오페이"]
+    assert found["카카오페이"] == "377300"
+    assert find_symbols_in_text("") == {}
+
+def test_compile_name_pattern():
+    """트라이 정규식: 위치마다 가장 긴 이름, 겹치는 위치도 모두 매칭"""
+    pattern = compile_name_pattern(["삼성", "삼성전자", "전자", "sk", "skc"])
+    
+    assert pattern.findall("삼성전자와 skc") == ["삼성전자", "전자", "skc"]
+    assert pattern.findall("sk 삼성") == ["sk", "삼성"]
+    assert pattern.findall("") == []
+
+def test_cached_scan_results_not_shared():
+    """캐시된 스캔 결과를 호출자가 변경해도 다음 호출에 영향 없음"""
+    text = "삼성전자와 엔비디아 동반 강세"
+    
+    names = find_symbol_names(text)
+    names.append("변경")
+    symbol_names, foreign_names = find_symbol_and_foreign_names(text)
+    symbol_names.clear()
+    foreign_names.add("변경")
+    
+    assert find_symbol_names(text) == ["삼성전자"]
+    assert find_symbol_and_foreign_names(text) == (["삼성전자"], {"엔비디아"})
@@ -7,7 +7,7 @@ project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from src.analysis.performance import calculate_paper_trade
+from src.analysis.performance import calculate_paper_trade, calculate_mdd, calculate_performance_metrics
 
 
 def test_pnl_calculation():
@@ -65,8 +65,41 @@ def test_pnl_calculation():
     print("\n모든 테스트 통과!")
 
 
+
+def test_mdd_calculation():
+    """MDD 계산 테스트"""
+    # 고점 120 -> 저점 90: 25% 하락 (이후 신고점 130 -> 117: 10% 하락)
+    assert calculate_mdd([100, 120, 90, 130, 117]) == 25.0
+    # 계속 상승하면 0
+    assert calculate_mdd([100, 110, 120]) == 0.0
+    # 데이터 부족
+    assert calculate_mdd([100]) == 0.0
+    assert calculate_mdd([]) == 0.0
+
+
+
+def test_performance_metrics():
+    """성과 지표 집계 테스트"""
+    trades = [
+        calculate_paper_trade("A", "상승", entry_price=100, exit_price=110, per_stock_cash=1000),
+        calculate_paper_trade("B", "하락", entry_price=100, exit_price=80, per_stock_cash=1000),
+        calculate_paper_trade("C", "보합", entry_price=100, exit_price=100, per_stock_cash=1000),
+    ]
+    metrics = calculate_performance_metrics(trades)
+    
+    assert metrics.total_invested == 3000
+    assert metrics.total_value == 2900
+    assert metrics.total_pnl == -100
+    assert metrics.total_pnl_rate == -3.33
+    assert (metrics.win_count, metrics.loss_count) == (1, 1)
+    assert metrics.win_rate == 33.33
+    assert metrics.mdd == 20.0
+
+
 if __name__ == "__main__":
     test_pnl_calculation()
+    test_mdd_calculation()
+    test_performance_metrics()
 
 
 
@@ -1,4 +1,5 @@
 """종목 선정 로직 테스트"""
+import concurrent.futures
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -19,6 +20,12 @@ from src.analysis.stock_picker import (
     generate_trigger,
     create_stock_candidates,
     parse_llm_response,
+    create_llm_prompt,
+    pick_watch_stocks,
+    pick_watch_stocks_batch,
+    WatchStockJob,
+    _collect_news_catalysts,
+    _iter_by_score,
 )
 from src.analysis.news_analyzer import NewsDigest
 from tests.conftest import create_news_item
@@ -47,6 +54,25 @@ class TestExtractStockCandidates:
         
         assert isinstance(candidates, dict)
         assert len(candidates) > 0
+    
+    def test_empty_digest(self, sample_overnight_signals):
+        """텍스트가 없으면 빈 결과, 오버나이트 신호 가점은 그대로 적용"""
+        digest = NewsDigest(
+            top_headlines=[],
+            macro_summary="",
+            sector_bullets={"기타": []},
+            korea_impact="중",
+            sources=[],
+            fetched_count=0,
+            time_filtered_count=0,
+            deduped_count=0
+        )
+        
+        assert extract_stock_candidates(digest, []) == {}
+        
+        nvda = Mock(success=True, pct_change=3.0)
+        signals = {**sample_overnight_signals, "NVDA": nvda}
+        assert extract_stock_candidates(digest, [], overnight_signals=signals)
 
 
 class TestCalculateChecklistScore:
@@ -70,6 +96,15 @@ class TestCalculateChecklistScore:
         # Catalyst 없으면 점수가 더 낮아야 함
         assert total >= 0
     
+    def test_cached_scores_not_shared(self):
+        """캐싱된 기본 점수를 호출자가 변경해도 다음 호출에 영향 없음"""
+        scores, total = calculate_checklist_score("삼성전자", has_catalyst=True)
+        scores["살 이유 명확"] = 0
+        
+        scores_again, total_again = calculate_checklist_score("삼성전자", has_catalyst=True)
+        assert scores_again["살 이유 명확"] == 2
+        assert total_again == total
+    
     def test_with_financial_metrics(self):
         """재무 지표와 함께 계산"""
         # Mock 재무 지표
@@ -137,6 +172,13 @@ class TestGenerateRisks:
         for risk in risks:
             assert isinstance(risk, str)
             assert len(risk) > 0
+    
+    def test_risks_not_shared(self):
+        """반환된 리스트를 변경해도 다음 호출에 영향 없음"""
+        risks = generate_risks("삼성전자")
+        risks.append("추가 리스크")
+        
+        assert generate_risks("삼성전자") == ["반도체 업황 사이클 변동성", "재무데이터 확인 필요 (PER, 부채비율 등)"]
 
 
 class TestGenerateTrigger:
@@ -188,6 +230,178 @@ class TestCreateStockCandidates:
         assert isinstance(candidates, list)
         assert len(candidates) > 0
 
+    def test_parallel_financial_metrics(self, sample_digest, sample_news_items):
+        """병렬 수집 후에도 점수 순서 유지, 종목별 재무 데이터 매칭, 실패 종목은 None"""
+        from src.market.financial import FinancialMetrics
+
+        def fake_fetch(code, name, provider="yahoo"):
+            if code == "000660":
+                raise Exception("offline")
+            return FinancialMetrics(symbol=code, name=name, per=float(int(code)), success=True)
+
+        with patch("src.analysis.stock_picker.fetch_financial_metrics", side_effect=fake_fetch):
+            candidates = create_stock_candidates(sample_digest, sample_news_items)
+
+        scores = [c["score"] for c in candidates]
+        assert scores == sorted(scores, reverse=True)
+        for candidate in candidates:
+            if candidate["code"] == "000660":
+                assert candidate["financial_metrics"] is None
+            else:
+                assert candidate["financial_metrics"]["per"] == float(int(candidate["code"]))
+
+
+def test_iter_by_score_matches_sorted():
+    """힙 순회 결과가 안정 정렬(동점은 입력 순서)과 동일"""
+    scores = {"A": 2, "B": 5, "C": 2, "D": 7, "E": 5, "F": 0}
+    
+    assert list(_iter_by_score(scores)) == sorted(scores.items(), key=lambda x: x[1], reverse=True)
+    assert list(_iter_by_score({})) == []
+
+
+class TestCollectNewsCatalysts:
+    """뉴스 catalyst 일괄 수집 테스트"""
+    
+    def test_collects_per_stock_in_title_order(self):
+        """종목별로 제목 순서대로 최대 2개 수집 (겹치는 종목명 포함)"""
+        titles = ["카카오페이 상승", "삼성전자 실적", "카카오 신사업", "삼성전자 배당", "삼성전자 투자"]
+        news_titles = [(title, title.lower()) for title in titles]
+        related = {
+            "카카오": [("카카오", "카카오")],
+            "삼성전자": [("삼성전자", "삼성전자")],
+            "NAVER": [("NAVER", "naver")],
+        }
+        
+        catalysts = _collect_news_catalysts(news_titles, related)
+        
+        assert catalysts["카카오"] == ["카카오페이 상승", "카카오 신사업"]
+        assert catalysts["삼성전자"] == ["삼성전자 실적", "삼성전자 배당"]
+        assert catalysts["NAVER"] == []
+    
+    def test_counts_each_related_name(self):
+        """관련 종목명이 여러 개 포함된 제목은 그 수만큼 추가 (기존 동작 유지)"""
+        news_titles = [("Tesla와 테슬라 동반 강세", "tesla와 테슬라 동반 강세")]
+        related = {"tesla": [("tesla", "tesla"), ("테슬라", "테슬라")]}
+        
+        catalysts = _collect_news_catalysts(news_titles, related)
+        
+        assert catalysts["tesla"] == ["Tesla와 테슬라 동반 강세"] * 2
+
+
+_REAL_PROCESS_POOL = concurrent.futures.ProcessPoolExecutor
+
+
+def _offline_fetch(*args, **kwargs):
+    """네트워크 없이 재무 데이터 조회 실패"""
+    raise Exception("offline")
+
+
+def _offline_worker_init(fetch_workers):
+    """테스트용 워커 initializer (동시 요청 수 설정 + 재무 데이터 조회를 오프라인 실패로 교체)"""
+    import src.analysis.stock_picker as stock_picker
+    stock_picker._set_financial_fetch_workers(fetch_workers)
+    stock_picker.fetch_financial_metrics = _offline_fetch
+
+
+class TestPickWatchStocksBatch:
+    """다이제스트 일괄 종목 선정 테스트"""
+    
+    def test_batch_matches_single_calls(self, sample_digest, sample_news_items):
+        """일괄 처리 결과가 다이제스트별 개별 호출과 동일 (순서 유지)"""
+        jobs = [WatchStockJob(sample_digest, sample_news_items), WatchStockJob(sample_digest, sample_news_items[:2])]
+        
+        with patch("src.analysis.stock_picker.fetch_financial_metrics", side_effect=Exception("offline")):
+            expected = [pick_watch_stocks(job.digest, job.news_items, 2) for job in jobs]
+            actual = pick_watch_stocks_batch(jobs, max_count=2, max_workers=1)
+        
+        assert actual == expected
+        assert pick_watch_stocks_batch([]) == []
+    
+    def test_process_pool_matches_single_calls(self, sample_digest, sample_news_items):
+        """워커 프로세스 2개로 실행해도 결과 동일, 재무 데이터 동시 요청 수는 워커끼리 나눠 배정"""
+        jobs = [
+            WatchStockJob(sample_digest, sample_news_items),
+            WatchStockJob(sample_digest, sample_news_items[:2]),
+            WatchStockJob(sample_digest, sample_news_items[1:]),
+        ]
+        pool_kwargs = []
+        
+        def offline_pool(**kwargs):
+            # spawn 워커에는 patch가 전달되지 않으므로 initializer에서 오프라인 조회로 교체
+            pool_kwargs.append(kwargs)
+            return _REAL_PROCESS_POOL(**{**kwargs, "initializer": _offline_worker_init})
+        
+        with patch("src.analysis.stock_picker.fetch_financial_metrics", side_effect=_offline_fetch):
+            expected = [pick_watch_stocks(job.digest, job.news_items, 2) for job in jobs]
+        with patch("src.analysis.stock_picker.concurrent.futures.ProcessPoolExecutor", side_effect=offline_pool):
+            actual = pick_watch_stocks_batch(jobs, max_count=2, max_workers=2)
+        
+        assert actual == expected
+        assert pool_kwargs[0]["max_workers"] == 2
+        assert pool_kwargs[0]["initargs"] == (4,)
+    
+    def test_llm_batch_requires_opt_in(self, sample_digest, sample_news_items):
+        """use_batch_api 없이 LLM을 켜도 Batch API는 사용하지 않음"""
+        jobs = [
+            WatchStockJob(sample_digest, sample_news_items, "2024-01-15"),
+            WatchStockJob(sample_digest, sample_news_items, "2024-01-16"),
+        ]
+        
+        with patch("src.analysis.stock_picker.LLM_ENABLED", True), \
+             patch("src.analysis.stock_picker.fetch_financial_metrics", side_effect=Exception("offline")), \
+             patch("src.analysis.stock_picker.generate_json_batch") as mock_batch, \
+             patch("src.analysis.stock_picker.generate_json_stream", return_value=None) as mock_stream:
+            pick_watch_stocks_batch(jobs, max_count=2, max_workers=1)
+        
+        mock_batch.assert_not_called()
+        assert mock_stream.call_count == 2
+    
+    def test_llm_batch_single_call(self, sample_digest, sample_news_items):
+        """LLM 사용 시 Batch API 1회 호출, 실패한 요청만 룰 기반 fallback"""
+        jobs = [
+            WatchStockJob(sample_digest, sample_news_items, "2024-01-15"),
+            WatchStockJob(sample_digest, sample_news_items, "2024-01-16"),
+        ]
+        
+        with patch("src.analysis.stock_picker.fetch_financial_metrics", side_effect=Exception("offline")):
+            candidates = create_stock_candidates(sample_digest, sample_news_items, max_candidates=15)
+            llm_output = {"selected": [{"name": candidates[0]["name"], "code": candidates[0]["code"]}]}
+            rule_based = pick_watch_stocks(sample_digest, sample_news_items, 2)
+            
+            with patch("src.analysis.stock_picker.LLM_ENABLED", True), \
+                 patch("src.analysis.stock_picker.generate_json_batch", return_value=[llm_output, None]) as mock_batch:
+                actual = pick_watch_stocks_batch(
+                    jobs, max_count=2, use_batch_api=True, batch_poll_interval=5, batch_timeout=60
+                )
+        
+        assert mock_batch.call_count == 1
+        assert len(mock_batch.call_args[0][0]) == 2
+        assert mock_batch.call_args.kwargs == {"poll_interval": 5, "timeout": 60}
+        assert [stock.name for stock in actual[0]] == [candidates[0]["name"]]
+        assert actual[1] == rule_based
+
+
+class TestCreateLLMPrompt:
+    """LLM 프롬프트 생성 테스트"""
+    
+    def test_prompt_cached_per_content(self, sample_digest):
+        """같은 내용이면 캐시된 프롬프트 재사용, 후보 내용이 바뀌면 새로 생성"""
+        candidates = [{
+            "name": "삼성전자",
+            "code": "005930",
+            "sector": "반도체",
+            "matched_headlines": ["삼성전자, 새로운 반도체 공장 건설 발표"],
+            "financial_metrics": {"success": True, "per": 12.34, "debt_ratio": 30.0, "revenue_growth_3y": None}
+        }]
+        
+        system_prompt, user_prompt = create_llm_prompt("2024-01-15", sample_digest, candidates)
+        assert create_llm_prompt("2024-01-15", sample_digest, [dict(candidates[0])])[1] is user_prompt
+        assert "PER=12.3, 부채비율=30.0%" in user_prompt
+        
+        candidates[0]["financial_metrics"] = {"success": False}
+        _, changed_prompt = create_llm_prompt("2024-01-15", sample_digest, candidates)
+        assert "PER=" not in changed_prompt
+
 
 class TestParseLLMResponse:
     """LLM 응답 파싱 테스트"""
@@ -243,6 +457,13 @@ class TestParseLLMResponse:
         # 파싱 실패 시 None 반환
         assert result is None
     
+    def test_malformed_items(self):
+        """selected 항목 형식이 잘못되면 None 반환 (예외 없이 검증 실패)"""
+        candidates = [{"name": "삼성전자", "code": "005930", "score": 10}]
+        
+        assert parse_llm_response({"selected": ["삼성전자"]}, candidates) is None
+        assert parse_llm_response({"selected": [{"name": "삼성전자", "code": "005930", "catalyst": None}]}, candidates) is None
+    
     def test_empty_stocks(self):
         """빈 종목 리스트"""
         llm_output = {